@@ -0,0 +1,16 @@
+from agno.agent import Agent
+from config.llm import model
+
+# Shrinks research that doesn't fit a downstream agent's prompt budget
+context_summarizer_agent = Agent(
+    name="Context Summarizer",
+    model=model,
+    description="You condense travel research into compact notes for the agents that plan the itinerary and the budget.",
+    instructions=[
+        "Keep every named place, hotel, restaurant and flight together with its price, location, rating and URL.",
+        "Drop descriptions, reviews, marketing language and repeated information.",
+        "Prefer markdown tables or one line per item.",
+        "Never invent details that are not in the input.",
+        "Stay within the requested length.",
+    ],
+)
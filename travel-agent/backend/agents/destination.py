@@ -1,5 +1,5 @@
 from agno.agent import Agent
-from agno.tools.exa import ExaTools
+from tools.exa_cache import CachedExaTools
 from agno.tools.firecrawl import FirecrawlTools
 from config.llm import model
 
@@ -8,7 +8,7 @@ destination_agent = Agent(
     name="Destination Explorer",
     model=model,
     tools=[
-        ExaTools(
+        CachedExaTools(
             num_results=5, # Reduced for token safety
         ),
     ],
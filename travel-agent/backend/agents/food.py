@@ -1,4 +1,4 @@
-from agno.tools.exa import ExaTools
+from tools.exa_cache import CachedExaTools
 from config.llm import model
 from agno.agent import Agent
 
@@ -6,7 +6,7 @@ dining_agent = Agent(
     name="Culinary Guide",
     role="Research dining and food experiences when asked by team leader",
     model=model,
-    tools=[ExaTools(num_results=10)],
+    tools=[CachedExaTools(num_results=10)],
     description="You research restaurants, food markets, culinary experiences, and dining options when assigned by the team leader.",
     instructions=[
         "# Culinary Research and Recommendation Assistant",
@@ -1,5 +1,5 @@
 from agno.agent import Agent
-from agno.tools.exa import ExaTools
+from tools.exa_cache import CachedExaTools
 from config.llm import model
 from models.hotel import HotelResult, HotelResults
 
@@ -7,7 +7,7 @@ hotel_search_agent = Agent(
     name="Hotel Search Assistant",
     model=model,
     tools=[
-        ExaTools(num_results=10),
+        CachedExaTools(num_results=10),
     ],
     instructions=[
         "# Hotel Search and Data Extraction Assistant",
@@ -1,6 +1,6 @@
 from agno.agent import Agent
-from agno.tools.exa import ExaTools
-from agno.tools.firecrawl import FirecrawlTools
+from tools.exa_cache import CachedExaTools
+from tools.scrape import scrape_website
 from agno.tools.reasoning import ReasoningTools
 from config.llm import model
 from typing import Optional
@@ -12,8 +12,8 @@ itinerary_agent = Agent(
     name="Itinerary Specialist",
     model=model,
     tools=[
-        ExaTools(num_results=8),
-        FirecrawlTools(formats=["markdown"]),
+        CachedExaTools(num_results=8),
+        scrape_website,
         ReasoningTools(add_instructions=True),
     ],
     markdown=True,
@@ -63,7 +63,7 @@ itinerary_agent = Agent(
         "",
         "6. Research tools usage for accurate scheduling:",
         "   - Use Exa to research location-specific timing information",
-        "   - Employ FirecrawlTools for current operating hours and conditions",
+        "   - Employ scrape_website for current operating hours and conditions",
         "   - Use ReasoningTools to optimize activity sequence and timing",
         "",
         "7. Format day plans with maximum clarity:",
@@ -0,0 +1,529 @@
+"""
+Rule-based extraction of the structured travel plan from agent markdown.
+
+The research and itinerary agents write markdown in a few predictable shapes:
+one heading or numbered item per flight / hotel / restaurant followed by
+``**Field**: value`` lines (or a table with one row per entity), and
+``## Day N`` blocks split into morning, afternoon and evening parts.
+
+Each ``parse_*`` function turns one agent's output into model instances and
+returns an empty list when the text doesn't have the expected shape, so the
+caller can fall back to the LLM for just that field. ``FIELD_PARSERS`` maps
+the fields of ``TravelPlanTeamResponse`` to their parser.
+"""
+
+import re
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from models.hotel import HotelResult
+from models.travel_plan import (
+    Attraction,
+    DayByDayPlan,
+    FlightResult,
+    RestaurantResult,
+)
+
+HEADING_RE = re.compile(r"^\s{0,3}(#{1,6})\s+(.*?)[\s#]*$")
+LIST_ITEM_RE = re.compile(r"^(\s*)(?:[-*+•]|\d+[.)])\s+(.*)$")
+TABLE_ROW_RE = re.compile(r"^\s*\|(.*)\|\s*$")
+TABLE_SEPARATOR_RE = re.compile(r"^[\s|:-]+$")
+FIELD_RE = re.compile(r"^([A-Za-z][\w /&()'.-]{0,40}?)\s*[:：]\s*(.*)$")
+URL_RE = re.compile(r"https?://[^\s)\]>\"'|]+")
+LINK_RE = re.compile(r"\[([^\]]*)\]\((https?://[^)\s]+)\)")
+DAY_HEADING_RE = re.compile(r"\bday\s+(\d+)\b", re.IGNORECASE)
+DAY_PART_RE = re.compile(
+    r"^(?:#{1,6}\s*)?[\W_]*(morning|afternoon|evening|night)\b[\W_]*(.*)$", re.IGNORECASE
+)
+FLIGHT_NUMBER_RE = re.compile(r"\b([A-Z][A-Z0-9]|[A-Z0-9][A-Z])\s?-?(\d{2,4})\b")
+ISO_DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+MONTH_DAY_YEAR_RE = re.compile(r"\b([A-Z][a-z]{2,8})\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})\b")
+DAY_MONTH_YEAR_RE = re.compile(r"\b(\d{1,2})(?:st|nd|rd|th)?\s+([A-Z][a-z]{2,8})\.?,?\s+(\d{4})\b")
+TITLE_PREFIX_RE = re.compile(
+    r"^(?:(?:option|choice|hotel|restaurant|flight|pick)\s*#?\d+\s*[:.)-]\s*|\d+[.)]\s*)",
+    re.IGNORECASE,
+)
+# Section headings that group entities rather than name one
+GENERIC_TITLE_RE = re.compile(
+    r"\b(recommendations?|options?|results?|summary|overview|information|tips|notes|"
+    r"markets?|experiences|considerations|guide|list|top|best|search|details|conclusion)\b",
+    re.IGNORECASE,
+)
+
+# Lists extracted from prose sections are capped like the LLM output used to be
+MAX_LIST_ITEMS = 10
+
+FLIGHT_FIELDS = {
+    "airline": ("airline", "carrier", "operator"),
+    "flight_number": ("flight number", "flight no", "flight no.", "flight", "flight code"),
+    "price": ("price", "fare", "cost", "total price", "ticket price"),
+    "departure_time": ("departure", "departure time", "departs", "depart", "departing"),
+    "arrival_time": ("arrival", "arrival time", "arrives", "arrive", "arriving"),
+    "duration": ("duration", "flight duration", "travel time", "total duration"),
+    "stops": ("stops", "stop", "layovers", "layover", "connections"),
+    "url": ("url", "link", "booking", "booking link", "book", "website", "source"),
+}
+HOTEL_FIELDS = {
+    "hotel_name": ("hotel name", "name", "hotel"),
+    "price": ("price", "price range", "cost", "rate", "rates", "nightly rate", "price per night"),
+    "rating": ("rating", "ratings", "reviews", "review score", "guest rating", "stars"),
+    "address": ("address", "location", "area", "neighborhood", "neighbourhood"),
+    "amenities": ("amenities", "key amenities", "facilities", "features"),
+    "description": ("description", "overview", "about", "summary", "highlights", "why stay"),
+    "url": ("url", "link", "booking", "booking link", "website", "source"),
+}
+RESTAURANT_FIELDS = {
+    "name": ("name", "restaurant", "restaurant name"),
+    "description": ("description", "about", "overview", "highlights", "special features"),
+    "cuisine": ("cuisine", "cuisine type", "type"),
+    "dishes": ("popular dishes", "must try", "must-try", "signature dishes", "dishes", "specialties"),
+    "price": ("price", "price range", "cost", "budget"),
+    "location": ("location", "address", "area", "neighborhood", "neighbourhood"),
+    "url": ("url", "link", "website", "source", "booking"),
+}
+ATTRACTION_FIELDS = {
+    "description": ("description", "about", "overview", "why visit", "highlights"),
+}
+
+
+class _Block:
+    """Lines belonging to one entity: its title, labelled fields and other text."""
+
+    def __init__(self, title: str, indent: int):
+        self.title = title
+        # Indent of the list item that opened the block; -1 for a heading
+        self.indent = indent
+        self.fields: Dict[str, List[str]] = {}
+        self.text: List[str] = []
+        self.urls: List[str] = []
+
+    def field(self, name: str) -> str:
+        return "; ".join(value for value in self.fields.get(name, ()) if value)
+
+
+def clean_text(text: str) -> str:
+    """Strip markdown emphasis, links and code marks from a line of text."""
+    text = LINK_RE.sub(r"\1", text)
+    text = re.sub(r"(\*\*|__|`)", "", text)
+    text = re.sub(r"(?<!\w)[*_](\S.*?\S|\S)[*_](?!\w)", r"\1", text)
+    return " ".join(text.split()).strip(" *")
+
+
+def _clean_name(text: str) -> str:
+    text = TITLE_PREFIX_RE.sub("", clean_text(text))
+    # Leading emojis / bullets / numbering
+    return re.sub(r"^[^\w(\"'“]+", "", text).strip(" -–—:")
+
+
+def _split_title(raw: str) -> Tuple[str, str]:
+    """Split an entity's title line into its name and any trailing description."""
+    bold = re.match(r"^\s*(?:\d+[.)]\s*)?\*\*(.+?)\*\*\s*[-–—:,]?\s*(.*)$", raw)
+    if bold:
+        return _clean_name(bold.group(1)), clean_text(bold.group(2))
+    text = clean_text(raw)
+    for separator in (" - ", " – ", " — ", ": "):
+        if separator in text:
+            name, rest = text.split(separator, 1)
+            return _clean_name(name), rest.strip()
+    return _clean_name(text), ""
+
+
+def _alias_index(fields: Dict[str, Sequence[str]]) -> Dict[str, str]:
+    return {alias: name for name, aliases in fields.items() for alias in aliases}
+
+
+def _match_field(text: str, aliases: Dict[str, str]) -> Optional[Tuple[str, str]]:
+    """Return (field, value) when ``text`` is a ``Label: value`` line for a known field."""
+    match = FIELD_RE.match(clean_text(text))
+    if match is None or match.group(2).startswith("//"):
+        return None
+    label = match.group(1).strip().lower().rstrip(".")
+    field = aliases.get(label)
+    return (field, match.group(2).strip()) if field else None
+
+
+def _is_bold_item(text: str) -> bool:
+    return bool(re.match(r"^\s*(?:\d+[.)]\s*)?(\*\*|__|\[)", text))
+
+
+def _table_blocks(markdown: str, aliases: Dict[str, str]) -> List[_Block]:
+    """One block per row of every table whose header names at least two known fields."""
+    blocks: List[_Block] = []
+    header: Optional[List[Optional[str]]] = None
+    for line in markdown.splitlines():
+        row = TABLE_ROW_RE.match(line)
+        if row is None:
+            header = None
+            continue
+        cells = [cell.strip() for cell in row.group(1).split("|")]
+        if TABLE_SEPARATOR_RE.match(row.group(1)):
+            continue
+        if header is None:
+            header = [aliases.get(clean_text(cell).lower().rstrip(":")) for cell in cells]
+            if sum(1 for name in header if name) < 2:
+                # Keep scanning rows, but ignore this table
+                header = [None] * len(cells)
+            continue
+        if not any(header):
+            continue
+        block = _Block("", indent=0)
+        for name, cell in zip(header, cells):
+            if name:
+                block.fields.setdefault(name, []).append(clean_text(cell))
+            elif not block.title and cell:
+                block.title = cell
+            block.urls.extend(URL_RE.findall(cell))
+        blocks.append(block)
+    return blocks
+
+
+def _entity_blocks(markdown: str, fields: Dict[str, Sequence[str]]) -> List[_Block]:
+    """Split markdown into one block per entity.
+
+    Entities are opened by headings, by list items that aren't ``Label: value``
+    lines for a known field, and by table rows. Field lines and other text are
+    attached to the entity they follow.
+    """
+    aliases = _alias_index(fields)
+    tables = _table_blocks(markdown, aliases)
+    if tables:
+        return tables
+
+    blocks: List[_Block] = []
+    current: Optional[_Block] = None
+    # Field whose value continues in the nested list items below it
+    open_field: Optional[Tuple[str, int]] = None
+
+    for line in markdown.splitlines():
+        if not line.strip() or TABLE_ROW_RE.match(line):
+            continue
+        heading = HEADING_RE.match(line)
+        if heading:
+            current = _Block(heading.group(2), indent=-1)
+            blocks.append(current)
+            open_field = None
+            continue
+
+        urls = URL_RE.findall(line)
+        item = LIST_ITEM_RE.match(line)
+        indent = len(item.group(1).expandtabs(4)) if item else 0
+        text = item.group(2) if item else line.strip()
+
+        if current is not None and open_field and item and indent > open_field[1]:
+            current.fields[open_field[0]].append(clean_text(text))
+            current.urls.extend(urls)
+            continue
+        open_field = None
+
+        field = _match_field(text, aliases)
+        if current is not None and field:
+            name, value = field
+            current.fields.setdefault(name, [])
+            if value:
+                current.fields[name].append(value)
+            else:
+                open_field = (name, indent)
+            current.urls.extend(urls)
+            continue
+
+        opens_entity = item is not None and (
+            current is None
+            or indent <= current.indent
+            or (current.indent < 0 and indent == 0 and _is_bold_item(text))
+        )
+        if opens_entity:
+            current = _Block(text, indent=indent)
+            blocks.append(current)
+            if field:
+                name, value = field
+                current.fields.setdefault(name, []).append(value)
+        elif current is not None and URL_RE.sub("", LINK_RE.sub("", text)).strip(" -–:*"):
+            # Lines that are only a link contribute their URL, not text
+            current.text.append(clean_text(text))
+        if current is not None:
+            current.urls.extend(urls)
+
+    return blocks
+
+
+def _sections(markdown: str, keywords: Sequence[str]) -> List[str]:
+    """Text under each heading mentioning a keyword, up to the next heading of its level."""
+    lines = markdown.splitlines()
+    sections = []
+    for start, line in enumerate(lines):
+        heading = HEADING_RE.match(line)
+        if heading and any(word in heading.group(2).lower() for word in keywords):
+            level = len(heading.group(1))
+            end = start + 1
+            while end < len(lines):
+                following = HEADING_RE.match(lines[end])
+                if following and len(following.group(1)) <= level:
+                    break
+                end += 1
+            sections.append("\n".join(lines[start + 1 : end]))
+    return sections
+
+
+def _section(markdown: str, keywords: Sequence[str]) -> str:
+    """The first of ``_sections``, or an empty string."""
+    sections = _sections(markdown, keywords)
+    return sections[0] if sections else ""
+
+
+def _url(block: _Block) -> str:
+    for value in block.fields.get("url", ()):
+        found = URL_RE.search(value)
+        if found:
+            return found.group(0).rstrip(".,;")
+    return block.urls[0].rstrip(".,;") if block.urls else ""
+
+
+def _named_blocks(blocks: List[_Block], name_field: str) -> List[Tuple[str, str, _Block]]:
+    """(name, description from the title line, block) for blocks naming an entity."""
+    named = []
+    for block in blocks:
+        name, rest = _split_title(block.title) if block.title else ("", "")
+        name = block.field(name_field) or name
+        if not name or (block.indent < 0 and GENERIC_TITLE_RE.search(name)):
+            continue
+        named.append((name, rest, block))
+    return named
+
+
+def _parse_stops(value: str) -> Optional[int]:
+    value = value.lower()
+    if any(word in value for word in ("non-stop", "nonstop", "direct", "no stop")):
+        return 0
+    number = re.search(r"\d+", value)
+    return int(number.group(0)) if number else None
+
+
+def parse_flights(markdown: str) -> List[FlightResult]:
+    """Extract flights from the flight agent's report."""
+    flights = []
+    for name, _, block in _named_blocks(_entity_blocks(markdown, FLIGHT_FIELDS), "airline"):
+        airline = block.field("airline") or re.sub(FLIGHT_NUMBER_RE, "", name).strip(" -–(),")
+        flight_number = block.field("flight_number")
+        if not flight_number:
+            number = FLIGHT_NUMBER_RE.search(name)
+            flight_number = f"{number.group(1)}{number.group(2)}" if number else ""
+        price = block.field("price")
+        departure_time = block.field("departure_time")
+        if not (airline or flight_number) or not (price or departure_time):
+            continue
+        stops = _parse_stops(block.field("stops"))
+        flights.append(
+            FlightResult(
+                airline=airline,
+                flight_number=flight_number,
+                price=price,
+                departure_time=departure_time,
+                arrival_time=block.field("arrival_time"),
+                duration=block.field("duration"),
+                stops=stops if stops is not None else 0,
+                url=_url(block),
+            )
+        )
+    return flights
+
+
+def _split_list(values: List[str]) -> List[str]:
+    items = []
+    for value in values:
+        items.extend(part.strip(" .") for part in re.split(r"[,;•]", value))
+    return [item for item in items if item]
+
+
+def parse_hotels(markdown: str) -> List[HotelResult]:
+    """Extract hotels from the hotel agent's report."""
+    hotels = []
+    for name, rest, block in _named_blocks(_entity_blocks(markdown, HOTEL_FIELDS), "hotel_name"):
+        details = [block.field(field) for field in ("price", "rating", "address")] + [_url(block)]
+        # A name alone is as likely to be a heading as a hotel
+        if sum(1 for detail in details if detail) < 2:
+            continue
+        description = block.field("description") or " ".join([rest, *block.text]).strip()
+        hotels.append(
+            HotelResult(
+                hotel_name=name,
+                price=block.field("price"),
+                rating=block.field("rating"),
+                address=block.field("address"),
+                amenities=_split_list(block.fields.get("amenities", [])),
+                description=description,
+                url=_url(block),
+            )
+        )
+    return hotels
+
+
+def parse_restaurants(markdown: str) -> List[RestaurantResult]:
+    """Extract restaurants from the dining agent's report.
+
+    Only the restaurant section is read when there is one, so food markets
+    and general dining tips aren't mistaken for restaurants.
+    """
+    markdown = _section(markdown, ("restaurant",)) or markdown
+    restaurants = []
+    for name, rest, block in _named_blocks(_entity_blocks(markdown, RESTAURANT_FIELDS), "name"):
+        description = block.field("description") or " ".join([rest, *block.text]).strip()
+        extras = [
+            f"{label}: {block.field(field)}"
+            for field, label in (("cuisine", "Cuisine"), ("dishes", "Popular dishes"), ("price", "Price"))
+            if block.field(field)
+        ]
+        description = "; ".join(part for part in [description, *extras] if part)
+        location, url = block.field("location"), _url(block)
+        if not (description or location or url):
+            continue
+        restaurants.append(
+            RestaurantResult(name=name, description=description, location=location, url=url)
+        )
+    return restaurants
+
+
+def parse_attractions(markdown: str) -> List[Attraction]:
+    """Extract the main attractions from the destination agent's guide."""
+    markdown = _section(markdown, ("attraction", "must-see", "must see", "sights")) or markdown
+    attractions = []
+    for name, rest, block in _named_blocks(_entity_blocks(markdown, ATTRACTION_FIELDS), "name"):
+        other_fields = [
+            f"{field.title()}: {block.field(field)}"
+            for field in block.fields
+            if field != "description" and block.field(field)
+        ]
+        description = " ".join(
+            part for part in [block.field("description") or rest, *block.text, *other_fields] if part
+        )
+        attractions.append(Attraction(name=name, description=description))
+    return attractions
+
+
+def _parse_date(text: str) -> str:
+    iso = ISO_DATE_RE.search(text)
+    if iso:
+        return iso.group(1)
+    for pattern, order in ((MONTH_DAY_YEAR_RE, (0, 1, 2)), (DAY_MONTH_YEAR_RE, (1, 0, 2))):
+        match = pattern.search(text)
+        if not match:
+            continue
+        month, day, year = (match.group(index + 1) for index in order)
+        for month_format in ("%B", "%b"):
+            try:
+                return datetime.strptime(f"{year} {month} {day}", f"%Y {month_format} %d").date().isoformat()
+            except ValueError:
+                continue
+    return ""
+
+
+def _bullets(lines: List[str]) -> str:
+    """Render a day part as one bullet per activity, details folded into it."""
+    activities: List[List[str]] = []
+    for line in lines:
+        item = LIST_ITEM_RE.match(line)
+        text = clean_text(item.group(2) if item else line)
+        if not text:
+            continue
+        if item is not None and item.group(1) and activities:
+            activities[-1].append(text)
+        else:
+            activities.append([text])
+    return "\n".join(
+        f"• {main} ({'; '.join(details)})" if details else f"• {main}"
+        for main, *details in activities
+    )
+
+
+def parse_day_by_day_plan(markdown: str) -> List[DayByDayPlan]:
+    """Extract the ``## Day N`` blocks of the itinerary agent's plan."""
+    lines = markdown.splitlines()
+    days: List[DayByDayPlan] = []
+    index = 0
+    while index < len(lines):
+        heading = HEADING_RE.match(lines[index])
+        day_match = DAY_HEADING_RE.search(heading.group(2)) if heading else None
+        if not day_match:
+            index += 1
+            continue
+
+        level = len(heading.group(1))
+        parts: Dict[str, List[str]] = {"morning": [], "afternoon": [], "evening": [], "notes": []}
+        current = "notes"
+        index += 1
+        while index < len(lines):
+            line = lines[index]
+            following = HEADING_RE.match(line)
+            if following and len(following.group(1)) <= level:
+                break
+            part = DAY_PART_RE.match(clean_text(line)) if not LIST_ITEM_RE.match(line) or following else None
+            if part and (following or line.strip().startswith(("**", "__"))):
+                current = "evening" if part.group(1).lower() == "night" else part.group(1).lower()
+                if part.group(2).strip(" :-"):
+                    parts[current].append(part.group(2))
+            elif following:
+                # Any other sub-section of the day (tips, notes, meals...) is a note
+                current = "notes"
+                parts["notes"].append(f"{clean_text(following.group(2))}:")
+            else:
+                parts[current].append(line)
+            index += 1
+
+        morning, afternoon, evening = (_bullets(parts[name]) for name in ("morning", "afternoon", "evening"))
+        if not (morning or afternoon or evening):
+            continue
+        notes = _bullets([line for line in parts["notes"] if not line.rstrip().endswith(":")])
+        days.append(
+            DayByDayPlan(
+                day=int(day_match.group(1)),
+                date=_parse_date(heading.group(2)),
+                morning=morning,
+                afternoon=afternoon,
+                evening=evening,
+                notes=notes,
+            )
+        )
+    return days
+
+
+def parse_list_items(markdown: str, keywords: Sequence[str] = ()) -> List[str]:
+    """Top-level list items, from the sections whose heading mentions a keyword.
+
+    Without matching sections (or keywords) every top-level item is used.
+    """
+    sections = _sections(markdown, keywords) if keywords else []
+    text = "\n".join(sections) if sections else markdown
+
+    items: List[str] = []
+    for line in text.splitlines():
+        item = LIST_ITEM_RE.match(line)
+        if item and not item.group(1).strip(" ") and not TABLE_ROW_RE.match(line):
+            cleaned = clean_text(item.group(2))
+            if cleaned and not cleaned.endswith(":") and cleaned not in items:
+                items.append(cleaned)
+    return items[:MAX_LIST_ITEMS]
+
+
+def parse_tips(markdown: str) -> List[str]:
+    """Practical tips from the itinerary's notes and the destination guide."""
+    return parse_list_items(
+        markdown, ("practical", "tip", "basic information", "advice", "note")
+    )
+
+
+def parse_budget_insights(markdown: str) -> List[str]:
+    """Cost-saving recommendations from the budget agent's report."""
+    return parse_list_items(
+        markdown, ("saving", "insight", "strateg", "recommend", "tip", "optimi")
+    )
+
+
+# Parser for each field of TravelPlanTeamResponse
+FIELD_PARSERS: Dict[str, Callable[[str], list]] = {
+    "day_by_day_plan": parse_day_by_day_plan,
+    "hotels": parse_hotels,
+    "attractions": parse_attractions,
+    "flights": parse_flights,
+    "restaurants": parse_restaurants,
+    "budget_insights": parse_budget_insights,
+    "tips": parse_tips,
+}
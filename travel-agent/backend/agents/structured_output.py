@@ -1,14 +1,31 @@
-from typing import TypeVar, Type, Any
-from pydantic import BaseModel
+from typing import Dict, Iterator, List, Optional, Sequence, TypeVar, Type, Any
+from pydantic import BaseModel, create_model
 from agno.agent import Agent
 from loguru import logger
-from config.llm import model
+from config.llm import model, get_llm_provider, get_rate_limiter, model_request_times
+from config.rate_limit import estimate_tokens, parse_retry_after
+import asyncio
+import functools
 import json
+import os
 import re
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from agents.markdown_parser import FIELD_PARSERS
+from models.travel_plan import TravelPlanTeamResponse
+from services.http_gateway import gateway
 from pydantic import ValidationError
 
 T = TypeVar("T", bound=BaseModel)
 
+# Attempts per section when the LLM's answer doesn't validate
+SECTION_CONVERSION_ATTEMPTS = int(os.getenv("SECTION_CONVERSION_ATTEMPTS", "2"))
+
+
+class StructuredOutputValidationError(ValueError):
+    """The LLM's answer is not valid JSON for the target model."""
+
 
 def clean_json_string(json_str: str) -> str:
     """
@@ -27,91 +44,145 @@ def clean_json_string(json_str: str) -> str:
     return json_str.strip()
 
 
-async def convert_to_model(input_text: str, target_model: Type[T]) -> str:
+def _build_structured_output_agent() -> Agent:
+    return Agent(
+        model=model,
+        description=(
+            "You are an expert at extracting structured travel planning information from unstructured, free-form user inputs. "
+            "Given a detailed user message, travel description, or conversation, your goal is to accurately populate a predefined trip schema. "
+        ),
+        instructions=[
+            "Convert the input text into a single JSON object that matches the provided schema exactly.",
+            "Return ONLY the JSON object - no explanations, no other text, without ```json or ```.",
+            "Rules:",
+            "- Output must be valid JSON",
+            "- All required fields must be included",
+            "- Field types must match schema exactly",
+            "- No extra fields allowed",
+            "- Validate all constraints (min/max values, regex patterns, etc)",
+            "Text formatting:",
+            "- Use consistent, clean text formatting throughout all string fields",
+            "- For list items, use bullet points (•) instead of asterisks (*)",
+            "- Minimize indentation and whitespace in text fields",
+            "- Use line breaks sparingly and consistently",
+            "- Avoid formatting characters like asterisks (*) in text",
+            "- Don't include unnecessary prefixes or labels in text content",
+            "- Format times, dates, durations, and prices consistently",
+            "- Make sure all fields contain data appropriate for their purpose",
+            "URL fields (CRITICAL):",
+            "- For any 'url' field, only use actual URLs starting with http:// or https://",
+            "- NEVER use \"N/A\", \"n/a\", \"Not Available\", or any placeholder text for URL fields",
+            "- If no valid URL is found in the input, use an empty string \"\" for the url field",
+            "- Extract URLs exactly as they appear in the source text",
+        ],
+    )
+
+
+# Agents idle between conversions. An agent keeps per-run state, so each one
+# serves a single conversion at a time; concurrent conversions get their own.
+_idle_agents: List[Agent] = []
+
+
+@contextmanager
+def _structured_output_agent() -> Iterator[Agent]:
+    agent = _idle_agents.pop() if _idle_agents else _build_structured_output_agent()
+    try:
+        yield agent
+    finally:
+        _idle_agents.append(agent)
+
+
+def _strip_titles(schema: Any) -> Any:
+    """Drop the ``title`` annotations pydantic adds to every schema node."""
+    if isinstance(schema, dict):
+        return {
+            key: _strip_titles(value)
+            for key, value in schema.items()
+            if not (key == "title" and isinstance(value, str))
+        }
+    if isinstance(schema, list):
+        return [_strip_titles(value) for value in schema]
+    return schema
+
+
+@dataclass(frozen=True)
+class CompiledTarget:
+    """The parts of a conversion prompt that only depend on the target model."""
+
+    schema: str
+    prompt_prefix: str
+
+
+@functools.lru_cache(maxsize=None)
+def compile_target(target_model: Type[BaseModel]) -> CompiledTarget:
+    """Build a target model's compact schema and prompt prefix once."""
+    schema = json.dumps(
+        _strip_titles(target_model.model_json_schema()), separators=(",", ":")
+    )
+    return CompiledTarget(
+        schema=schema,
+        prompt_prefix=f"Model schema:\n{schema}\n",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def section_model(field_name: str) -> Type[BaseModel]:
+    """A model holding a single TravelPlanTeamResponse field."""
+    field = TravelPlanTeamResponse.model_fields[field_name]
+    return create_model(
+        f"{TravelPlanTeamResponse.__name__}_{field_name}",
+        **{field_name: (field.annotation, field)},
+    )
+
+
+async def convert_to_model(
+    input_text: str, target_model: Type[T], feedback: Optional[str] = None
+) -> str:
     """
     Convert input text into a specified Pydantic model using an Agno agent.
 
     Args:
         input_text (str): The input text to convert
         target_model (Type[T]): The target Pydantic model class
+        feedback (Optional[str]): Why the previous answer was rejected, if
+            this is a retry
 
     Returns:
         str: A JSON string that matches the model schema
+
+    Raises:
+        StructuredOutputValidationError: If the response is not valid JSON
+            for ``target_model``
     """
 
     logger.info(
         f"Converting input text to model: {target_model.__name__} : {input_text}"
     )
 
-    structured_output_agent = Agent(
-        model=model,
-        description=(
-            "You are an expert at extracting structured travel planning information from unstructured, free-form user inputs. "
-            "Given a detailed user message, travel description, or conversation, your goal is to accurately populate a predefined trip schema. "
-        ),
-        instructions=[
-            "Your task is to convert the input text into a valid JSON that matches the model schema exactly.",
-            "You must return ONLY the JSON object that matches the schema exactly - no other output.",
-            "When formatting text fields, you must:",
-            "- Use minimal, consistent formatting throughout",
-            "- Apply appropriate list formatting",
-            "- Format dates, times and structured data consistently",
-            "- Structure text concisely and clearly",
-        ],
-        markdown=True,
-        expected_output="""
-            A valid JSON object that matches the provided schema.
-            Text fields should be clean and consistently formatted.
-            Do not include any explanations or additional text - return only the JSON object.
-            Without ```json or ```
-        """,
-    )
-
-    schema = target_model.model_json_schema()
-    schema_str = json.dumps(schema, indent=2)
-
-    # Create the prompt with model schema and clear instructions
-    prompt = f"""
-    Your task is to convert the input text into a valid JSON object that exactly matches the provided schema.
-    Do not include any explanations or additional text - return only the JSON object.
-
-    Model schema:
-    {schema_str}
-
-    Rules:
-    - Output must be valid JSON
-    - All required fields must be included
-    - Field types must match schema exactly
-    - No extra fields allowed
-    - Validate all constraints (min/max values, regex patterns, etc)
-
-    Text Formatting Requirements:
-    - Use consistent, clean text formatting throughout all string fields
-    - For list items, use bullet points (•) instead of asterisks (*)
-    - Minimize indentation and whitespace in text fields
-    - Use line breaks sparingly and consistently
-    - Avoid formatting characters like asterisks (*) in text
-    - Don't include unnecessary prefixes or labels in text content
-    - Format times, dates, durations, and prices consistently
-    - Make sure all fields contain data appropriate for their purpose
-
-    URL Field Rules (CRITICAL):
-    - For any 'url' field, only use actual URLs starting with http:// or https://
-    - NEVER use "N/A", "n/a", "Not Available", or any placeholder text for URL fields
-    - If no valid URL is found in the input, use an empty string "" for the url field
-    - Extract URLs exactly as they appear in the source text
-
-    Input text to convert:
-    {input_text}
-    """
+    compiled = compile_target(target_model)
+    # Static prefix first and the input last, so providers can cache the prefix
+    prompt = f"{compiled.prompt_prefix}\nInput text to convert:\n{input_text}\n"
+    if feedback:
+        prompt += f"\nYour previous answer was rejected: {feedback}\nReturn corrected JSON.\n"
 
     # Get structured response from the agent with retries
     max_retries = 5
     retry_delay = 30
+    limiter = get_rate_limiter(model)
     
     for attempt in range(max_retries):
         try:
-            response = await structured_output_agent.arun(prompt)
+            # The JSON reply is roughly as long as the text being converted
+            await limiter.acquire(estimate_tokens(prompt) * 2)
+            started = time.monotonic()
+            try:
+                with _structured_output_agent() as structured_output_agent:
+                    response = await structured_output_agent.arun(prompt)
+            except Exception:
+                gateway.record(get_llm_provider(model), time.monotonic() - started, failed=True)
+                raise
+            for seconds in model_request_times(response) or [time.monotonic() - started]:
+                gateway.record(get_llm_provider(model), seconds)
             json_string = clean_json_string(response.content)
             logger.info(f"Structured output agent response: {json_string}")
             break
@@ -122,6 +193,12 @@ async def convert_to_model(input_text: str, target_model: Type[T]) -> str:
             retryable_keywords = ["429", "rate limit", "quota", "exhausted", "503", "500", "tool_use_failed"]
             is_retryable = any(kw in error_msg for kw in retryable_keywords)
             
+            if "rate_limit_exceeded" in error_msg or "tokens" in error_msg:
+                # Paced by the shared limiter rather than a fixed backoff
+                await limiter.penalize(parse_retry_after(error_msg))
+                if attempt < max_retries - 1:
+                    continue
+
             if is_retryable:
                 if attempt < max_retries - 1:
                     wait_time = retry_delay * (1.5 ** attempt)
@@ -133,19 +210,115 @@ async def convert_to_model(input_text: str, target_model: Type[T]) -> str:
             raise e
     
     try:
+        validated = target_model.model_validate_json(json_string)
+    except ValidationError as e:
+        logger.error(f"Response does not match {target_model.__name__}: {e}")
+        logger.error(f"Problematic JSON snippet: {json_string[:1000]}...") # Log first 1000 chars
+        raise StructuredOutputValidationError(
+            f"Failed to parse response into {target_model.__name__}: {e}"
+        )
+    return validated.model_dump_json()
 
-        # Parse the JSON string
+
+async def convert_section(field_name: str, input_text: str) -> List[Any]:
+    """
+    Convert the text of one TravelPlanTeamResponse field with the LLM.
+
+    The answer is validated against a model holding just that field and
+    re-asked, with the validation error, when it doesn't match. A section
+    that never validates, or whose LLM call fails, is left empty instead of
+    failing the whole plan.
+
+    Args:
+        field_name (str): The TravelPlanTeamResponse field to convert
+        input_text (str): The upstream output(s) the field is read from
+
+    Returns:
+        List[Any]: The validated items of the field
+    """
+    target_model = section_model(field_name)
+    feedback = None
+    for attempt in range(1, SECTION_CONVERSION_ATTEMPTS + 1):
         try:
-            json.loads(json_string)
-            return json_string
-
-        except json.JSONDecodeError as json_err:
-            logger.error(f"JSON parsing error at {json_err.lineno}:{json_err.colno}: {str(json_err)}")
-            logger.error(f"Problematic JSON snippet: {json_string[:1000]}...") # Log first 1000 chars
-            raise ValueError(f"Invalid JSON response at line {json_err.lineno}, col {json_err.colno}: {str(json_err)}")
-
-    except Exception as e:
-        logger.error(f"Failed to parse response into {target_model.__name__}: {str(e)}")
-        raise ValueError(
-            f"Failed to parse response into {target_model.__name__}: {str(e)}"
+            json_string = await convert_to_model(input_text, target_model, feedback)
+        except StructuredOutputValidationError as e:
+            feedback = str(e)
+            logger.warning(
+                f"Section '{field_name}' failed validation "
+                f"(attempt {attempt}/{SECTION_CONVERSION_ATTEMPTS}): {feedback[:300]}"
+            )
+            continue
+        except Exception as e:
+            # convert_to_model already retried provider and rate-limit errors
+            logger.error(f"Section '{field_name}' conversion failed: {type(e).__name__}: {e}; leaving it empty")
+            return []
+        return json.loads(json_string)[field_name]
+
+    logger.error(f"Giving up on section '{field_name}'; leaving it empty")
+    return []
+
+
+async def extract_structured_plan(
+    outputs: Dict[str, str], field_sources: Dict[str, Sequence[str]]
+) -> str:
+    """
+    Build a TravelPlanTeamResponse from the agents' markdown.
+
+    Each field is parsed by the rule-based parsers in ``agents.markdown_parser``;
+    only fields they can't extract are converted by the LLM, one field per
+    call (see ``convert_section``). Fields with no source output are left
+    empty without asking the LLM.
+
+    Args:
+        outputs (Dict[str, str]): Agent outputs keyed by section heading
+        field_sources (Dict[str, Sequence[str]]): Headings of the outputs each
+            field of TravelPlanTeamResponse is read from
+
+    Returns:
+        str: A JSON string that matches the TravelPlanTeamResponse schema
+    """
+    started = time.perf_counter()
+    values: Dict[str, Any] = {}
+    for field_name, parser in FIELD_PARSERS.items():
+        markdown = "\n\n".join(
+            outputs.get(heading, "") for heading in field_sources.get(field_name, ())
+        )
+        try:
+            parsed = parser(markdown) if markdown.strip() else []
+        except Exception as e:
+            logger.warning(f"Markdown parser for '{field_name}' failed: {e}")
+            parsed = []
+        if parsed:
+            values[field_name] = parsed
+
+    fields = TravelPlanTeamResponse.model_fields
+    missing = [name for name in fields if name not in values]
+    logger.info(
+        f"Parsed {len(values)}/{len(fields)} plan fields from markdown in "
+        f"{(time.perf_counter() - started) * 1000:.1f}ms"
+        + (f"; converting {missing} with the LLM" if missing else "")
+    )
+
+    sources = {
+        name: "".join(
+            f"\n## {heading}:\n---\n{outputs[heading]}\n---\n"
+            for heading in field_sources.get(name, ())
+            if outputs.get(heading)
+        )
+        for name in missing
+    }
+    # A field none of whose source agents produced anything stays empty
+    empty = [name for name in missing if not sources[name].strip()]
+    if empty:
+        logger.info(f"No source output for {empty}; leaving them empty")
+        values.update((name, []) for name in empty)
+    to_convert = [name for name in missing if name not in empty]
+
+    if to_convert:
+        # One small prompt per field, run concurrently, each from its own sources
+        sections = await asyncio.gather(
+            *(convert_section(name, sources[name]) for name in to_convert)
         )
+        values.update(zip(to_convert, sections))
+
+    return TravelPlanTeamResponse(**values).model_dump_json()
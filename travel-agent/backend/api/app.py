@@ -1,10 +1,25 @@
+import asyncio
 from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 from datetime import datetime, timezone
 from contextlib import asynccontextmanager
+from config.tokenizer import load_tokenizer
 from services.db_service import initialize_db_pool, close_db_pool
 from router.plan import router as plan_router
+from services.plan_worker import (
+    handle_task_exception,
+    start_embedded_worker,
+    stop_embedded_worker,
+    wake_embedded_worker,
+)
+from services.plan_recovery import recover_orphaned_plans
+from services.plan_events import start_plan_event_bridge, stop_plan_event_bridge
+from services.status_writer import status_writer
+from services.agent_cache import agent_result_cache
+from services.http_gateway import gateway
+from services.context_digest import context_digest_stats
+from services.model_router import model_router
 
 router = APIRouter(prefix="/api")
 
@@ -15,6 +30,26 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
 
 
+@router.get("/cache/stats", summary="Agent Result Cache Statistics")
+async def cache_stats():
+    return agent_result_cache.stats()
+
+
+@router.get("/gateway/stats", summary="Outbound HTTP Gateway Statistics")
+async def gateway_stats():
+    return gateway.stats()
+
+
+@router.get("/context/stats", summary="Prompt Context Compression Statistics")
+async def context_stats():
+    return context_digest_stats.stats()
+
+
+@router.get("/llm/stats", summary="LLM Backend Health")
+async def llm_stats():
+    return model_router.stats()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup logic
@@ -25,9 +60,32 @@ async def lifespan(app: FastAPI):
     await initialize_db_pool()
     logger.info("Database connection pool initialized")
 
+    # Prompt budgets need the tokenizer; warns if token counts will be estimates
+    await asyncio.to_thread(load_tokenizer)
+
+    # Run queued plans in this process too unless PLAN_WORKER_EMBEDDED=false
+    start_embedded_worker()
+
+    # Relay progress events from worker processes when PLAN_EVENTS_BACKEND=postgres
+    start_plan_event_bridge()
+
+    # Requeue plans orphaned by a previous crash without delaying startup
+    async def recover_and_wake():
+        if await recover_orphaned_plans():
+            wake_embedded_worker()
+
+    recovery_task = asyncio.create_task(recover_and_wake())
+    recovery_task.add_done_callback(handle_task_exception)
+
     yield
 
     # Shutdown logic
+    # Hand any running plans back to the queue
+    await stop_embedded_worker()
+    await stop_plan_event_bridge()
+    # Write status updates still waiting in the debounce window
+    await status_writer.flush()
+
     # Close database connection pool
     logger.info("Closing database connection pool")
     await close_db_pool()
@@ -0,0 +1,153 @@
+"""
+Benchmark: /api/health latency while plans are scraping.
+
+Starts a uvicorn server with a health endpoint, keeps ``--plans`` concurrent
+plans busy with blocking scrapes and probes the health endpoint from a
+separate thread. Each scrape is run two ways:
+
+- ``inline``: called directly on the event loop, as sync tools used to be
+- ``offload``: handed to the tool thread pool via ``tools.offload.run_blocking``
+
+With ``inline`` scrapes the health check waits behind every scrape; with
+``offload`` its latency should stay flat.
+
+Usage (from the backend directory):
+    python -m benchmarks.health_latency --plans 20 --scrape-seconds 1.5
+    python -m benchmarks.health_latency --url https://example.com   # real Firecrawl scrapes
+"""
+
+import argparse
+import asyncio
+import socket
+import statistics
+import time
+import urllib.request
+from datetime import datetime, timezone
+from typing import Callable, List
+
+import uvicorn
+from fastapi import FastAPI
+
+from tools.offload import TOOL_THREADPOOL_SIZE, run_blocking
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/health")
+    async def health_check():
+        return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def probe_health(url: str, duration: float, interval: float) -> List[float]:
+    """Request the health endpoint repeatedly and return latencies in milliseconds."""
+    latencies = []
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        with urllib.request.urlopen(url, timeout=60) as response:
+            response.read()
+        latencies.append((time.perf_counter() - start) * 1000)
+        time.sleep(interval)
+    return latencies
+
+
+async def run_plans(plans: int, scrape: Callable[[], object], offload: bool, stop: asyncio.Event) -> int:
+    """Keep ``plans`` concurrent plans scraping until ``stop`` is set."""
+    scrapes = 0
+
+    async def plan() -> None:
+        nonlocal scrapes
+        while not stop.is_set():
+            if offload:
+                await run_blocking(scrape)
+            else:
+                scrape()
+            scrapes += 1
+            await asyncio.sleep(0)
+
+    tasks = [asyncio.create_task(plan()) for _ in range(plans)]
+    await stop.wait()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return scrapes
+
+
+async def measure(mode: str, args: argparse.Namespace, scrape: Callable[[], object]) -> dict:
+    port = free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(build_app(), host="127.0.0.1", port=port, log_level="warning")
+    )
+    serve_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    url = f"http://127.0.0.1:{port}/api/health"
+    baseline = await asyncio.to_thread(probe_health, url, 1.0, args.interval)
+
+    stop = asyncio.Event()
+    load = asyncio.create_task(run_plans(args.plans, scrape, mode == "offload", stop))
+    # Give the plans a moment to saturate the loop / pool before probing
+    await asyncio.sleep(0.2)
+    under_load = await asyncio.to_thread(probe_health, url, args.duration, args.interval)
+    stop.set()
+    scrapes = await load
+
+    server.should_exit = True
+    await serve_task
+
+    return {"mode": mode, "baseline": baseline, "under_load": under_load, "scrapes": scrapes}
+
+
+def summarize(latencies: List[float]) -> str:
+    if not latencies:
+        return "no samples"
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"n={len(ordered):4d}  p50={statistics.median(ordered):8.1f}ms  "
+        f"p95={p95:8.1f}ms  max={ordered[-1]:8.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plans", type=int, default=20, help="concurrent scraping plans")
+    parser.add_argument("--scrape-seconds", type=float, default=1.5, help="duration of a simulated scrape")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to probe under load")
+    parser.add_argument("--interval", type=float, default=0.1, help="seconds between health probes")
+    parser.add_argument("--url", help="scrape this URL with Firecrawl instead of simulating")
+    parser.add_argument("--modes", nargs="+", default=["inline", "offload"], choices=["inline", "offload"])
+    args = parser.parse_args()
+
+    if args.url:
+        from tools.scrape import scrape_markdown
+
+        def scrape():
+            return scrape_markdown(args.url)
+    else:
+
+        def scrape():
+            # Stands in for a blocking HTTP call made by a sync client
+            time.sleep(args.scrape_seconds)
+
+    print(
+        f"{args.plans} plans scraping, tool pool size {TOOL_THREADPOOL_SIZE}, "
+        f"{'Firecrawl ' + args.url if args.url else f'{args.scrape_seconds}s simulated scrapes'}"
+    )
+    for mode in args.modes:
+        result = asyncio.run(measure(mode, args, scrape))
+        print(f"\n[{mode}] {result['scrapes']} scrapes completed")
+        print(f"  idle        {summarize(result['baseline'])}")
+        print(f"  under load  {summarize(result['under_load'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark: plan throughput and retry behaviour of a running backend.
+
+Submits ``--plans`` plans to ``/api/plan/trigger`` at once and follows each
+one on its ``/api/plan/{id}/events`` stream until it completes or fails, then
+reports plans per minute and the time to complete. With ``--stub`` the
+counters of the stand-in LLM (requests, tool calls, injected errors) are
+reported too.
+
+Run the backend against ``benchmarks.stub_llm`` so no quota is spent; each
+plan gets a different destination by default so requests aren't coalesced or
+served from the agent result cache (``--identical`` to measure those).
+
+Usage (from the backend directory, with the API and the stub running):
+    python -m benchmarks.plan_load --plans 20 --stub http://127.0.0.1:8001
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import urllib.request
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+DESTINATIONS = ["Lisbon", "Kyoto", "Cusco", "Hanoi", "Marrakesh", "Tbilisi", "Oaxaca", "Ljubljana"]
+
+
+def post_json(url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return json.loads(response.read())
+
+
+def get_json(url: str) -> Dict[str, Any]:
+    with urllib.request.urlopen(url, timeout=60) as response:
+        return json.loads(response.read())
+
+
+def travel_plan(index: int, identical: bool) -> Dict[str, Any]:
+    destination = DESTINATIONS[0] if identical else DESTINATIONS[index % len(DESTINATIONS)]
+    return {
+        "destination": destination,
+        "starting_location": "Mumbai",
+        "travel_dates": {"start": "2026-11-10", "end": "2026-11-14"},
+        "duration": 4,
+        "traveling_with": "friends",
+        "adults": 2,
+        "budget": 150000,
+        "travel_style": "comfort",
+        "vibes": ["culture", "food"],
+        # Distinct plans must differ beyond the destination's cache key too
+        "additional_info": "" if identical else f"load test plan {index}",
+    }
+
+
+def follow_plan(api: str, trip_plan_id: str, timeout: float) -> Dict[str, Any]:
+    """Read a plan's event stream until it ends; returns the final status and timings."""
+    started = time.monotonic()
+    result: Dict[str, Any] = {"status": "timeout", "first_token": None, "error": None}
+    url = f"{api}/api/plan/{trip_plan_id}/events"
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        for raw_line in response:
+            line = raw_line.decode("utf-8").strip()
+            if not line.startswith("data:"):
+                continue
+            event = json.loads(line[len("data:"):])
+            if event["type"] == "token" and result["first_token"] is None:
+                result["first_token"] = time.monotonic() - started
+            elif event["type"] == "status":
+                result["status"] = event["status"]
+                result["error"] = event.get("error")
+            if time.monotonic() - started > timeout:
+                break
+    result["seconds"] = time.monotonic() - started
+    return result
+
+
+async def run_plan(api: str, index: int, args: argparse.Namespace) -> Dict[str, Any]:
+    trip_plan_id = f"load-{uuid.uuid4().hex[:16]}"
+    await asyncio.to_thread(
+        post_json,
+        f"{api}/api/plan/trigger",
+        {"trip_plan_id": trip_plan_id, "travel_plan": travel_plan(index, args.identical)},
+    )
+    try:
+        return await asyncio.to_thread(follow_plan, api, trip_plan_id, args.timeout)
+    except Exception as e:
+        return {"status": "error", "error": str(e), "seconds": None, "first_token": None}
+
+
+def summarize(values: List[float]) -> str:
+    if not values:
+        return "no samples"
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50={statistics.median(ordered):7.1f}s  p95={p95:7.1f}s  max={ordered[-1]:7.1f}s"
+
+
+def stub_stats(stub: Optional[str]) -> Dict[str, int]:
+    return get_json(f"{stub}/stats") if stub else {}
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    # Every plan holds a thread reading its event stream
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=args.plans + 4))
+    before = stub_stats(args.stub)
+    started = time.monotonic()
+    results = await asyncio.gather(*(run_plan(args.api, index, args) for index in range(args.plans)))
+    elapsed = time.monotonic() - started
+    after = stub_stats(args.stub)
+
+    completed = [r for r in results if r["status"] == "completed"]
+    print(f"{len(completed)}/{args.plans} plans completed in {elapsed:.1f}s "
+          f"({len(completed) / elapsed * 60:.1f} plans/min)")
+    print(f"  time to complete     {summarize([r['seconds'] for r in completed])}")
+    print(f"  time to first token  {summarize([r['first_token'] for r in completed if r['first_token']])}")
+    for result in results:
+        if result["status"] != "completed":
+            print(f"  {result['status']}: {result['error']}")
+    if args.stub:
+        print("Stub LLM during the run:")
+        for name in sorted(after):
+            print(f"  {name:20s} {after[name] - before.get(name, 0)}")
+    for endpoint in ("llm", "context", "cache"):
+        try:
+            print(f"/api/{endpoint}/stats: {json.dumps(get_json(f'{args.api}/api/{endpoint}/stats'))}")
+        except Exception as e:
+            print(f"/api/{endpoint}/stats unavailable: {e}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--api", default="http://127.0.0.1:8000", help="backend base URL")
+    parser.add_argument("--stub", help="stand-in LLM base URL, to report its counters")
+    parser.add_argument("--plans", type=int, default=10, help="plans submitted at once")
+    parser.add_argument("--timeout", type=float, default=1800.0, help="seconds to wait for one plan")
+    parser.add_argument("--identical", action="store_true", help="submit identical plans")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+"""
+Local stand-in for an OpenAI-compatible chat completions API.
+
+Serves ``/openai/v1/chat/completions`` (the path the Groq SDK uses) and
+``/v1/chat/completions`` (OpenAI-style clients), streaming and non-streaming,
+with tool calls. Replies cost no quota and need no network, so the whole
+backend can be load-tested and its retry paths exercised on an offline box.
+
+Behaviour is configurable:
+
+- ``--latency``: time to first token, ``fixed:S``, ``uniform:LO,HI``,
+  ``normal:MEAN,SD`` or ``lognormal:MEDIAN,SIGMA`` (seconds)
+- ``--tokens-per-second`` / ``--completion-tokens``: generation speed and length
+- ``--tool-calls``: ``none`` (answer directly), ``auto`` (call the first
+  offered tool once with placeholder arguments) or a JSON file with a list of
+  ``{"name": ..., "arguments": {...}}`` calls made in turn, one per round
+- ``--fail KIND=RATE``: inject ``429``, ``500`` or ``tool_use_failed`` errors
+  in the formats Groq returns them
+- ``--rpm`` / ``--tpm``: enforce a quota and answer 429 with a
+  "try again in" hint when it is exceeded
+
+Request and error counters are served at ``GET /stats``.
+
+Usage (from the backend directory):
+    python -m benchmarks.stub_llm --port 8001 --latency lognormal:0.8,0.5 \\
+        --tokens-per-second 250 --fail 429=0.05 --fail tool_use_failed=0.02
+
+Then start the backend with the Groq SDK pointed at it (no real key needed):
+    GROQ_BASE_URL=http://127.0.0.1:8001 GROQ_API_KEY=stub \\
+        python -m uvicorn main:app --port 8000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from config.tokenizer import count_tokens
+
+FAILURE_KINDS = ("429", "500", "tool_use_failed")
+
+# Tokens sent per streamed chunk
+STREAM_CHUNK_TOKENS = 8
+
+WORDS = (
+    "visit the old town market early morning local guide museum harbour walk "
+    "sunset viewpoint budget friendly hotel near the station authentic dinner "
+    "street food tour day trip train ticket price per night free entry"
+).split()
+
+
+def parse_latency(spec: str):
+    """Build a sampler of time-to-first-token seconds from ``kind:params``."""
+    kind, _, params = spec.partition(":")
+    values = [float(value) for value in params.split(",") if value]
+    samplers = {
+        "fixed": lambda: values[0],
+        "uniform": lambda: random.uniform(values[0], values[1]),
+        "normal": lambda: random.gauss(values[0], values[1]),
+        "lognormal": lambda: random.lognormvariate(0, values[1]) * values[0],
+    }
+    if kind not in samplers:
+        raise argparse.ArgumentTypeError(f"Unknown latency distribution '{kind}'")
+    return lambda: max(samplers[kind](), 0.0)
+
+
+def parse_failure(spec: str) -> Tuple[str, float]:
+    kind, _, rate = spec.partition("=")
+    if kind not in FAILURE_KINDS:
+        raise argparse.ArgumentTypeError(f"Unknown failure '{kind}'; expected one of {FAILURE_KINDS}")
+    return kind, float(rate)
+
+
+def placeholder_arguments(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Arguments satisfying a tool's JSON schema, for ``--tool-calls auto``."""
+    placeholders = {"string": "stub", "integer": 1, "number": 1, "boolean": False, "array": [], "object": {}}
+    properties = parameters.get("properties") or {}
+    arguments = {}
+    for name in parameters.get("required") or []:
+        kind = (properties.get(name) or {}).get("type", "string")
+        if isinstance(kind, list):
+            kind = next((k for k in kind if k != "null"), "string")
+        arguments[name] = placeholders.get(kind, "stub")
+    return arguments
+
+
+class QuotaWindow:
+    """Sliding one-minute RPM/TPM quota, like a provider's."""
+
+    def __init__(self, rpm: Optional[int], tpm: Optional[int]):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.calls: Deque[Tuple[float, int]] = deque()
+
+    def admit(self, tokens: int) -> Optional[float]:
+        """Record a call, or return the seconds until it would fit."""
+        now = time.monotonic()
+        while self.calls and now - self.calls[0][0] >= 60:
+            self.calls.popleft()
+        used = sum(call_tokens for _, call_tokens in self.calls)
+        if self.rpm and len(self.calls) + 1 > self.rpm:
+            return 60 - (now - self.calls[0][0])
+        if self.tpm and self.calls and used + tokens > self.tpm:
+            # Time until enough of the window's tokens have expired
+            freed = 0
+            for started, call_tokens in self.calls:
+                freed += call_tokens
+                if used - freed + tokens <= self.tpm:
+                    return 60 - (now - started)
+        self.calls.append((now, tokens))
+        return None
+
+
+class StubLLM:
+    """Chat completions with configurable latency, throughput, tools and failures."""
+
+    def __init__(self, args: argparse.Namespace):
+        self.latency = args.latency
+        self.tokens_per_second = args.tokens_per_second
+        self.completion_tokens = args.completion_tokens
+        self.failures: Dict[str, float] = dict(args.fail or [])
+        self.quota = QuotaWindow(args.rpm, args.tpm)
+        self.tool_script: Optional[List[Dict[str, Any]]] = None
+        self.auto_tools = args.tool_calls == "auto"
+        if args.tool_calls not in ("none", "auto"):
+            with open(args.tool_calls) as f:
+                self.tool_script = json.load(f)
+        self.stats: Counter = Counter()
+
+    # --- errors, in the shapes the Groq API returns them ---
+
+    def error(self, kind: str, retry_after: Optional[float] = None) -> JSONResponse:
+        self.stats[f"errors_{kind}"] += 1
+        if kind == "429":
+            wait = retry_after if retry_after is not None else random.uniform(0.5, 5.0)
+            return JSONResponse(
+                status_code=429,
+                headers={"retry-after": str(max(int(wait + 0.999), 1))},
+                content={
+                    "error": {
+                        "message": "Rate limit reached for model on tokens per minute (TPM). "
+                        f"Please try again in {wait:.2f}s.",
+                        "type": "tokens",
+                        "code": "rate_limit_exceeded",
+                    }
+                },
+            )
+        if kind == "tool_use_failed":
+            return JSONResponse(
+                status_code=400,
+                content={
+                    "error": {
+                        "message": "Failed to call a function. Please adjust your prompt. "
+                        "See 'failed_generation' for more details.",
+                        "type": "invalid_request_error",
+                        "code": "tool_use_failed",
+                        "failed_generation": '<function=search{"query": "stub"</function>',
+                    }
+                },
+            )
+        return JSONResponse(
+            status_code=500,
+            content={"error": {"message": "Internal Server Error", "type": "internal_server_error"}},
+        )
+
+    # --- replies ---
+
+    def next_tool_call(self, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """The tool call to make in this round, if any."""
+        tools = {
+            tool["function"]["name"]: tool["function"]
+            for tool in body.get("tools") or []
+            if tool.get("type") == "function"
+        }
+        if not tools or body.get("tool_choice") == "none":
+            return None
+        rounds = sum(1 for message in body.get("messages", []) if message.get("role") == "tool")
+        if self.tool_script is not None:
+            if rounds >= len(self.tool_script) or self.tool_script[rounds]["name"] not in tools:
+                return None
+            call = self.tool_script[rounds]
+            return {"name": call["name"], "arguments": json.dumps(call.get("arguments", {}))}
+        if self.auto_tools and rounds == 0:
+            name, function = next(iter(tools.items()))
+            arguments = placeholder_arguments(function.get("parameters") or {})
+            return {"name": name, "arguments": json.dumps(arguments)}
+        return None
+
+    def reply_text(self, body: Dict[str, Any]) -> str:
+        response_format = (body.get("response_format") or {}).get("type")
+        if response_format in ("json_object", "json_schema"):
+            return "{}"
+        lines = ["## Stub response"]
+        words = 0
+        # Roughly 1.3 tokens per word
+        while words * 1.3 < self.completion_tokens:
+            line = " ".join(random.choice(WORDS) for _ in range(12))
+            lines.append(f"- {line.capitalize()}.")
+            words += 12
+        return "\n".join(lines)
+
+    def usage(self, prompt_tokens: int, completion_tokens: int) -> Dict[str, int]:
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    async def complete(self, request: Request):
+        body = await request.json()
+        self.stats["requests"] += 1
+        prompt_tokens = count_tokens(
+            json.dumps([body.get("messages", []), body.get("tools") or []])
+        )
+        self.stats["prompt_tokens"] += prompt_tokens
+
+        retry_after = self.quota.admit(prompt_tokens + self.completion_tokens)
+        if retry_after is not None:
+            return self.error("429", retry_after)
+        for kind, rate in self.failures.items():
+            if random.random() < rate:
+                return self.error(kind)
+
+        tool_call = self.next_tool_call(body)
+        if tool_call is not None:
+            self.stats["tool_calls"] += 1
+            tool_call = {"id": f"call_{uuid.uuid4().hex[:12]}", "type": "function", "function": tool_call}
+            text = ""
+            completion_tokens = count_tokens(tool_call["function"]["arguments"]) + 10
+        else:
+            text = self.reply_text(body)
+            completion_tokens = count_tokens(text)
+        self.stats["completion_tokens"] += completion_tokens
+
+        await asyncio.sleep(self.latency())
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        model = body.get("model", "stub")
+        usage = self.usage(prompt_tokens, completion_tokens)
+        if body.get("stream"):
+            self.stats["streamed"] += 1
+            return StreamingResponse(
+                self.stream(completion_id, model, text, tool_call, usage),
+                media_type="text/event-stream",
+            )
+
+        await asyncio.sleep(completion_tokens / self.tokens_per_second)
+        message: Dict[str, Any] = {"role": "assistant", "content": text or None}
+        if tool_call is not None:
+            message["tool_calls"] = [tool_call]
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": message,
+                    "finish_reason": "tool_calls" if tool_call else "stop",
+                }
+            ],
+            "usage": usage,
+        }
+
+    async def stream(self, completion_id: str, model: str, text: str, tool_call, usage):
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None, **extra) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                **extra,
+            }
+            return f"data: {json.dumps(payload)}\n\n"
+
+        yield chunk({"role": "assistant", "content": ""})
+        if tool_call is not None:
+            await asyncio.sleep(usage["completion_tokens"] / self.tokens_per_second)
+            yield chunk({"tool_calls": [{"index": 0, **tool_call}]})
+            finish_reason = "tool_calls"
+        else:
+            words = text.split(" ")
+            # Words approximate tokens closely enough for pacing
+            for start in range(0, len(words), STREAM_CHUNK_TOKENS):
+                piece = " ".join(words[start:start + STREAM_CHUNK_TOKENS])
+                if start + STREAM_CHUNK_TOKENS < len(words):
+                    piece += " "
+                await asyncio.sleep(STREAM_CHUNK_TOKENS / self.tokens_per_second)
+                yield chunk({"content": piece})
+            finish_reason = "stop"
+        # Usage as both OpenAI (include_usage) and Groq (x_groq) report it
+        yield chunk({}, finish_reason, usage=usage, x_groq={"id": completion_id, "usage": usage})
+        yield "data: [DONE]\n\n"
+
+
+def build_app(stub: StubLLM) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/openai/v1/chat/completions")
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        return await stub.complete(request)
+
+    @app.get("/stats")
+    async def stats():
+        return dict(stub.stats)
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency", type=parse_latency, default="lognormal:0.6,0.5",
+                        help="time to first token distribution, e.g. fixed:0.5 or uniform:0.2,2")
+    parser.add_argument("--tokens-per-second", type=float, default=300.0, help="generation speed")
+    parser.add_argument("--completion-tokens", type=int, default=600, help="length of text replies")
+    parser.add_argument("--tool-calls", default="none", help="none, auto, or a JSON file of scripted calls")
+    parser.add_argument("--fail", type=parse_failure, action="append",
+                        help="inject errors, e.g. 429=0.05, 500=0.01, tool_use_failed=0.02")
+    parser.add_argument("--rpm", type=int, help="requests per minute before answering 429")
+    parser.add_argument("--tpm", type=int, help="tokens per minute before answering 429")
+    parser.add_argument("--seed", type=int, help="seed for reproducible latencies and failures")
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    uvicorn.run(build_app(StubLLM(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
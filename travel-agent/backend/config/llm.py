@@ -1,7 +1,10 @@
+import os
+from loguru import logger
 from agno.models.google import Gemini
 from agno.models.openai import OpenAIChat
 from agno.models.openrouter import OpenRouter
 from agno.models.groq import Groq
+from config.rate_limit import TokenBucketRateLimiter
 # from agno.models.ollama import Ollama
 
 # ============================================
@@ -66,3 +69,144 @@ model_zero = Groq(id="meta-llama/llama-4-scout-17b-16e-instruct")
 # model = Groq(id="llama-3.3-70b-versatile")
 # model2 = Groq(id="llama-3.1-8b-instant")
 # model_zero = Groq(id="llama-3.1-8b-instant")
+
+# ============================================
+# FALLBACK BACKENDS (MODEL ROUTER)
+# ============================================
+# Agent calls go to `model` or to one of these backends, whichever is healthy,
+# fast and has quota left (see services/model_router.py). List them in
+# LLM_FALLBACK_BACKENDS, e.g. "openrouter,gemini,ollama"; backends whose API
+# key isn't set are skipped. Model ids can be overridden per backend.
+LLM_FALLBACK_BACKENDS = [
+    name.strip().lower()
+    for name in os.getenv("LLM_FALLBACK_BACKENDS", "").split(",")
+    if name.strip()
+]
+
+
+def _ollama_model():
+    from agno.models.ollama import Ollama
+
+    return Ollama(id=os.getenv("OLLAMA_MODEL_ID", "llama3.2"))
+
+
+# backend name -> (API key variable, model factory)
+BACKEND_FACTORIES = {
+    "groq": (
+        "GROQ_API_KEY",
+        lambda: Groq(id=os.getenv("GROQ_MODEL_ID", "llama-3.3-70b-versatile")),
+    ),
+    "openrouter": (
+        "OPENROUTER_API_KEY",
+        lambda: OpenRouter(
+            id=os.getenv("OPENROUTER_MODEL_ID", "openai/gpt-oss-120b:free"),
+            temperature=0.3,
+            max_tokens=8192,
+        ),
+    ),
+    "gemini": (
+        "GOOGLE_API_KEY",
+        lambda: Gemini(id=os.getenv("GEMINI_MODEL_ID", "gemini-2.0-flash-lite"), temperature=0.3),
+    ),
+    "openai": (
+        "OPENAI_API_KEY",
+        lambda: OpenAIChat(id=os.getenv("OPENAI_MODEL_ID", "gpt-4o-mini"), temperature=0.3),
+    ),
+    "ollama": (None, _ollama_model),
+}
+
+
+def get_fallback_models():
+    """(backend name, model) of each configured fallback backend."""
+    backends = []
+    for name in LLM_FALLBACK_BACKENDS:
+        if name not in BACKEND_FACTORIES:
+            logger.warning(f"Unknown LLM backend '{name}' in LLM_FALLBACK_BACKENDS; ignoring it")
+            continue
+        key_variable, factory = BACKEND_FACTORIES[name]
+        if key_variable and not os.getenv(key_variable):
+            logger.warning(f"LLM backend '{name}' needs {key_variable}; ignoring it")
+            continue
+        try:
+            backends.append((name, factory()))
+        except Exception as e:
+            logger.warning(f"Could not configure LLM backend '{name}': {e}")
+    return backends
+
+# ============================================
+# RATE LIMITS (per model, shared across the whole process)
+# ============================================
+# (requests per minute, tokens per minute) from the provider's quota page.
+# Calls are paced against these instead of sleeping a fixed time between stages.
+MODEL_RATE_LIMITS = {
+    "meta-llama/llama-4-scout-17b-16e-instruct": (30, 30000),
+    "llama-3.3-70b-versatile": (30, 12000),
+    "llama-3.1-8b-instant": (30, 6000),
+    "openai/gpt-oss-120b:free": (20, 100000),
+    "gemini-2.0-flash-lite": (30, 1000000),
+    "gpt-4o-mini": (500, 200000),
+    # Local models have no provider quota; only the machine limits them
+    "llama3.2": (600, 10000000),
+}
+# Conservative fallback for models we haven't listed yet
+DEFAULT_RATE_LIMIT = (30, 6000)
+
+# (context window, max completion tokens) per model, used to budget prompts
+MODEL_CONTEXT_LIMITS = {
+    "meta-llama/llama-4-scout-17b-16e-instruct": (131072, 8192),
+    "llama-3.3-70b-versatile": (131072, 32768),
+    "llama-3.1-8b-instant": (131072, 8192),
+    "openai/gpt-oss-120b:free": (131072, 8192),
+    "gemini-2.0-flash-lite": (1048576, 8192),
+    "gpt-4o-mini": (128000, 16384),
+    "llama3.2": (131072, 4096),
+}
+DEFAULT_CONTEXT_LIMIT = (32768, 4096)
+
+# "local" paces each process on its own; "postgres" shares one budget across
+# every replica using the same API keys (see migrations/create_rate_limit_windows_table.sql)
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "local").lower()
+
+_rate_limiters = {}
+
+
+def get_rate_limiter(llm):
+    """Get the shared rate limiter for a model (or a model id string)."""
+    model_id = llm if isinstance(llm, str) else llm.id
+    if model_id not in _rate_limiters:
+        rpm, tpm = MODEL_RATE_LIMITS.get(model_id, DEFAULT_RATE_LIMIT)
+        if RATE_LIMIT_BACKEND == "postgres":
+            from services.distributed_rate_limiter import PostgresRateLimiter
+
+            _rate_limiters[model_id] = PostgresRateLimiter(model_id, rpm, tpm)
+        else:
+            _rate_limiters[model_id] = TokenBucketRateLimiter(model_id, rpm, tpm)
+    return _rate_limiters[model_id]
+
+
+def get_llm_provider(llm) -> str:
+    """Provider name of a model, as used by the outbound HTTP gateway."""
+    return str(getattr(llm, "provider", None) or "llm").lower()
+
+
+def model_request_times(response) -> list:
+    """Seconds each model request of an agent run took, tool calls excluded.
+
+    An agent run makes one model request per tool round trip; agno reports
+    each request's duration in the run's ``metrics["time"]``.
+    """
+    metrics = getattr(response, "metrics", None) or {}
+    times = metrics.get("time") if isinstance(metrics, dict) else None
+    if isinstance(times, list):
+        return [float(seconds) for seconds in times if seconds is not None]
+    if isinstance(times, (int, float)):
+        return [float(times)]
+    return []
+
+
+def get_model_limits(llm):
+    """(requests/min, tokens/min, context window, max completion tokens) of a model."""
+    model_id = llm if isinstance(llm, str) else llm.id
+    rpm, tpm = MODEL_RATE_LIMITS.get(model_id, DEFAULT_RATE_LIMIT)
+    context_window, max_completion = MODEL_CONTEXT_LIMITS.get(model_id, DEFAULT_CONTEXT_LIMIT)
+    return rpm, tpm, context_window, max_completion
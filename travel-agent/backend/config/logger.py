@@ -111,3 +111,15 @@ def logger_hook(function_name: str, function_call: Callable, arguments: Dict[str
     result = function_call(**arguments)
     logger.info(f"Function call completed with result: {result}")
     return result
+
+
+async def alogger_hook(
+    function_name: str, function_call: Callable, arguments: Dict[str, Any]
+):
+    """Async hook that wraps the tool execution without blocking the event loop"""
+    logger.info(f"About to call {function_name} with arguments: {arguments}")
+    result = function_call(**arguments)
+    if inspect.isawaitable(result):
+        result = await result
+    logger.info(f"Function call completed with result: {result}")
+    return result
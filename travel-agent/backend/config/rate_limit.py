@@ -0,0 +1,151 @@
+"""
+Async request/token rate limiting for LLM providers.
+
+Each limiter tracks two token buckets that refill continuously: one for
+requests per minute (RPM) and one for estimated tokens per minute (TPM).
+Calls are admitted immediately while both buckets have headroom and only
+queue when the provider's quota is actually exhausted.
+"""
+
+import asyncio
+import re
+import time
+from typing import Optional
+
+from loguru import logger
+
+from config.tokenizer import count_tokens
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Estimate the number of tokens in a piece of text."""
+    return count_tokens(text)
+
+
+def parse_retry_after(error_message: str) -> Optional[float]:
+    """Extract the provider's suggested wait from a rate limit error message.
+
+    Handles messages such as "Please try again in 7.66s", "try again in 1m2.5s"
+    and "try again in 450ms".
+
+    Returns:
+        Optional[float]: The suggested wait in seconds, or None if not present
+    """
+    match = re.search(
+        r"try again in\s+(?:(\d+)m(?!s))?\s*(?:([\d.]+)(ms|s))?", error_message, re.IGNORECASE
+    )
+    if not match or not (match.group(1) or match.group(2)):
+        return None
+
+    seconds = float(match.group(1) or 0) * 60
+    if match.group(2):
+        value = float(match.group(2))
+        seconds += value / 1000 if match.group(3).lower() == "ms" else value
+    return seconds
+
+
+class TokenBucketRateLimiter:
+    """Process-wide RPM/TPM limiter for a single model or provider key."""
+
+    def __init__(self, name: str, requests_per_minute: int, tokens_per_minute: int):
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self._request_rate = requests_per_minute / 60.0
+        self._token_rate = tokens_per_minute / 60.0
+        self._available_requests = float(requests_per_minute)
+        self._available_tokens = float(tokens_per_minute)
+        self._blocked_until = 0.0
+        self._last_refill = time.monotonic()
+        # Waiters queue on the lock, so admission is FIFO
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._available_requests = min(
+            self.requests_per_minute,
+            self._available_requests + elapsed * self._request_rate,
+        )
+        self._available_tokens = min(
+            self.tokens_per_minute,
+            self._available_tokens + elapsed * self._token_rate,
+        )
+
+    def _seconds_until_available(self, tokens: int) -> float:
+        wait = max(0.0, self._blocked_until - time.monotonic())
+        if self._available_requests < 1:
+            wait = max(wait, (1 - self._available_requests) / self._request_rate)
+        if self._available_tokens < tokens:
+            wait = max(wait, (tokens - self._available_tokens) / self._token_rate)
+        return wait
+
+    async def seconds_until_available(self, tokens: int) -> float:
+        """How long a request of ``tokens`` estimated tokens would wait, without admitting it."""
+        self._refill()
+        return self._seconds_until_available(min(max(tokens, 1), self.tokens_per_minute))
+
+    async def acquire(self, tokens: int) -> float:
+        """Wait until one request of ``tokens`` estimated tokens fits the budget.
+
+        Args:
+            tokens: Estimated tokens the call will consume
+
+        Returns:
+            float: Seconds spent waiting for capacity
+        """
+        # A single call larger than the whole bucket would never be admitted
+        tokens = min(max(tokens, 1), self.tokens_per_minute)
+        waited = 0.0
+
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self._seconds_until_available(tokens)
+                if wait <= 0:
+                    self._available_requests -= 1
+                    self._available_tokens -= tokens
+                    break
+                logger.info(
+                    f"Rate limiter '{self.name}' waiting {wait:.1f}s for capacity "
+                    f"({tokens} tokens requested)"
+                )
+                await asyncio.sleep(wait)
+                waited += wait
+
+        return waited
+
+    async def record_usage(self, requests: int = 0, tokens: int = 0) -> None:
+        """Correct the buckets once the real usage of an admitted call is known.
+
+        Args:
+            requests: Extra requests made beyond the one that was acquired
+            tokens: Difference between actual and estimated tokens (may be negative)
+        """
+        self._refill()
+        self._available_requests = min(
+            self.requests_per_minute, self._available_requests - requests
+        )
+        self._available_tokens = min(
+            self.tokens_per_minute, self._available_tokens - tokens
+        )
+
+    async def penalize(self, retry_after: Optional[float] = None) -> None:
+        """React to a rate limit error returned by the provider despite pacing.
+
+        Args:
+            retry_after: The provider's suggested wait in seconds, if known.
+                Without it the token bucket is drained so calls resume as soon
+                as a minute's worth of quota has refilled.
+        """
+        self._refill()
+        if retry_after is not None:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        else:
+            self._available_tokens = min(self._available_tokens, 0.0)
+        logger.warning(
+            f"Rate limiter '{self.name}' penalized "
+            f"({f'{retry_after:.1f}s' if retry_after is not None else 'bucket drained'})"
+        )
@@ -0,0 +1,79 @@
+"""
+Token counting for prompt budgeting.
+
+Uses a tiktoken encoding. It isn't the exact tokenizer of every model we
+call, but it is within a few percent for English markdown, which is far
+closer than a characters-per-token estimate. That estimate is only a fallback
+for broken installs (or an encoding that can't be downloaded), and
+``load_tokenizer`` warns about it at startup.
+"""
+
+import functools
+import os
+from typing import Optional
+
+from loguru import logger
+
+try:
+    import tiktoken
+except ImportError:  # declared dependency; tolerated so a broken install still runs
+    tiktoken = None
+
+TOKENIZER_ENCODING = os.getenv("TOKENIZER_ENCODING", "o200k_base")
+
+# Rough heuristic used when the tokenizer can't be loaded
+CHARS_PER_TOKEN = 4
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    if tiktoken is None:
+        logger.warning(
+            "tiktoken is not installed; estimating tokens as characters / "
+            f"{CHARS_PER_TOKEN}, so prompt budgets and rate limits are approximate"
+        )
+        return None
+    try:
+        return tiktoken.get_encoding(TOKENIZER_ENCODING)
+    except Exception as e:
+        # e.g. the encoding can't be downloaded on an offline machine
+        logger.warning(f"Could not load tokenizer '{TOKENIZER_ENCODING}' ({e}); estimating tokens")
+        return None
+
+
+def load_tokenizer() -> bool:
+    """Load the tokenizer up front, warning if token counts will be estimates.
+
+    Returns:
+        bool: Whether tokens are counted with the tokenizer
+    """
+    return _encoding() is not None
+
+
+def count_tokens(text: Optional[str]) -> int:
+    """Count the tokens in a piece of text."""
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most ``max_tokens`` tokens, preferring a line boundary."""
+    if max_tokens <= 0:
+        return ""
+    encoding = _encoding()
+    if encoding is None:
+        head = text[: max_tokens * CHARS_PER_TOKEN]
+    else:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        head = encoding.decode(tokens[:max_tokens])
+    if len(head) >= len(text):
+        return text
+    # Don't leave half a line (or half a URL) at the end
+    line_end = head.rfind("\n")
+    return head[:line_end] if line_end > len(head) // 2 else head
@@ -0,0 +1,5 @@
+-- Canonical request fingerprint so identical plan requests can share one run
+ALTER TABLE plan_tasks ADD COLUMN IF NOT EXISTS fingerprint VARCHAR(64);
+
+-- Create index used by workers to claim duplicate queued requests
+CREATE INDEX IF NOT EXISTS idx_plan_tasks_fingerprint ON plan_tasks(fingerprint);
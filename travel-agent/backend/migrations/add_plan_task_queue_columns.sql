@@ -0,0 +1,8 @@
+-- Queue bookkeeping columns so plan_tasks can be claimed by worker processes
+ALTER TABLE plan_tasks ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE plan_tasks ADD COLUMN IF NOT EXISTS worker_id VARCHAR(100);
+ALTER TABLE plan_tasks ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE;
+ALTER TABLE plan_tasks ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMP WITH TIME ZONE;
+
+-- Create index used by workers to find the oldest claimable task
+CREATE INDEX IF NOT EXISTS idx_plan_tasks_claim ON plan_tasks(task_type, status, created_at);
@@ -0,0 +1,31 @@
+-- Store trip plan outputs once per trip plan, as JSONB
+
+-- Keep only the newest output of each trip plan before adding the unique key
+DELETE FROM trip_plan_output older
+USING trip_plan_output newer
+WHERE older."tripPlanId" = newer."tripPlanId"
+  AND (older."updatedAt", older.id) < (newer."updatedAt", newer.id);
+
+-- The document used to be pretty-printed text with the structured itinerary
+-- nested as a JSON string; store both as JSON
+ALTER TABLE trip_plan_output
+    ALTER COLUMN itinerary TYPE jsonb USING itinerary::jsonb;
+
+UPDATE trip_plan_output
+SET itinerary = jsonb_set(itinerary, '{itinerary}', (itinerary->>'itinerary')::jsonb)
+WHERE jsonb_typeof(itinerary->'itinerary') = 'string'
+  AND left(ltrim(itinerary->>'itinerary'), 1) = '{';
+
+-- One output per trip plan, so outputs can be written with a single upsert
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'trip_plan_output_tripPlanId_key'
+    ) THEN
+        ALTER TABLE trip_plan_output
+            ADD CONSTRAINT "trip_plan_output_tripPlanId_key" UNIQUE ("tripPlanId");
+    END IF;
+END $$;
+
+-- The unique constraint's index serves tripPlanId lookups
+DROP INDEX IF EXISTS idx_trip_plan_output_trip_plan_id;
@@ -0,0 +1,12 @@
+-- Create agent_result_cache table (persistent tier of the per-agent result cache)
+CREATE TABLE IF NOT EXISTS agent_result_cache (
+    cache_key VARCHAR(64) PRIMARY KEY,
+    agent VARCHAR(50) NOT NULL,
+    content TEXT NOT NULL,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create indexes for per-agent invalidation and pruning expired entries
+CREATE INDEX IF NOT EXISTS idx_agent_result_cache_agent ON agent_result_cache(agent);
+CREATE INDEX IF NOT EXISTS idx_agent_result_cache_expires_at ON agent_result_cache(expires_at);
@@ -0,0 +1,13 @@
+-- Create plan_stage_outputs table for per-stage checkpoints of plan generation
+CREATE TABLE IF NOT EXISTS plan_stage_outputs (
+    id SERIAL PRIMARY KEY,
+    trip_plan_id VARCHAR(50) NOT NULL,
+    stage VARCHAR(50) NOT NULL,
+    input_hash VARCHAR(64) NOT NULL,
+    output TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_plan_stage_outputs_trip_stage UNIQUE (trip_plan_id, stage)
+);
+
+-- Create index on trip_plan_id for faster lookups
+CREATE INDEX IF NOT EXISTS idx_plan_stage_outputs_trip_plan_id ON plan_stage_outputs(trip_plan_id);
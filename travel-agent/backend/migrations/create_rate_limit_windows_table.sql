@@ -0,0 +1,12 @@
+-- Shared per-minute quota windows used by the cluster-wide LLM rate limiter.
+-- One row per limiter key (model or provider) and minute.
+CREATE TABLE IF NOT EXISTS rate_limit_windows (
+    limiter_key VARCHAR(200) NOT NULL,
+    window_start TIMESTAMP WITH TIME ZONE NOT NULL,
+    requests INTEGER NOT NULL DEFAULT 0,
+    tokens INTEGER NOT NULL DEFAULT 0,
+    CONSTRAINT rate_limit_windows_pkey PRIMARY KEY (limiter_key, window_start)
+);
+
+-- Index on window_start for pruning old windows
+CREATE INDEX IF NOT EXISTS idx_rate_limit_windows_window_start ON rate_limit_windows(window_start);
@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import String, Text, DateTime, UniqueConstraint
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class PlanStageOutput(Base):
+    """Model for checkpointing the output of each plan generation stage."""
+
+    __tablename__ = "plan_stage_outputs"
+    __table_args__ = (
+        UniqueConstraint("trip_plan_id", "stage", name="uq_plan_stage_outputs_trip_stage"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    trip_plan_id: Mapped[str] = mapped_column(String(50), index=True)
+    stage: Mapped[str] = mapped_column(String(50))
+    # Hash of the travel request the output was generated for, so stale
+    # checkpoints are never reused after the request changes
+    input_hash: Mapped[str] = mapped_column(String(64))
+    output: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
@@ -2,7 +2,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import String, DateTime, Enum as SQLEnum, JSON
+from sqlalchemy import String, DateTime, Integer, Enum as SQLEnum, JSON
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
@@ -39,6 +39,17 @@ class PlanTask(Base):
     input_data: Mapped[dict] = mapped_column(JSON)
     output_data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    # Canonical fingerprint of the request, used to coalesce identical plans
+    fingerprint: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)
+    # Queue bookkeeping: which worker holds the task and until when its lease is valid
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    worker_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    lease_expires_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
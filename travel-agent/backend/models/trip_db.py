@@ -1,8 +1,9 @@
 from sqlalchemy import Column, String, TIMESTAMP, ForeignKey, Text, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 from cuid2 import Cuid
 
 CUID_GENERATOR: Cuid = Cuid()
@@ -65,8 +66,9 @@ class TripPlanOutput(Base):
     id: Mapped[str] = mapped_column(
         Text, primary_key=True, default=lambda: CUID_GENERATOR.generate()
     )
-    tripPlanId: Mapped[str] = mapped_column(Text, index=True)
-    itinerary: Mapped[str] = mapped_column(Text)
+    tripPlanId: Mapped[str] = mapped_column(Text, unique=True)
+    # The whole plan document; see repository.trip_plan_repository for section reads
+    itinerary: Mapped[Dict[str, Any]] = mapped_column(JSONB)
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     createdAt: Mapped[datetime] = mapped_column(
         DateTime(timezone=False),
@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+
+from models.agent_cache import AgentCacheEntry
+from services.db_service import commit_session, get_db_session
+
+
+async def get_cache_entry(cache_key: str) -> Optional[AgentCacheEntry]:
+    """Get an unexpired cache entry."""
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(AgentCacheEntry).where(
+                AgentCacheEntry.cache_key == cache_key,
+                AgentCacheEntry.expires_at > datetime.now(timezone.utc),
+            )
+        )
+        return result.scalar_one_or_none()
+
+
+async def upsert_cache_entry(
+    cache_key: str, agent: str, content: str, expires_at: datetime
+) -> None:
+    """Create or replace a cache entry."""
+    async with get_db_session() as session:
+        statement = insert(AgentCacheEntry).values(
+            cache_key=cache_key,
+            agent=agent,
+            content=content,
+            expires_at=expires_at,
+            created_at=datetime.now(timezone.utc),
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[AgentCacheEntry.cache_key],
+            set_={
+                "content": statement.excluded.content,
+                "expires_at": statement.excluded.expires_at,
+                "created_at": statement.excluded.created_at,
+            },
+        )
+        await session.execute(statement)
+        await commit_session(session)
+
+
+async def delete_expired_cache_entries() -> int:
+    """Delete expired cache entries and return how many were removed."""
+    async with get_db_session() as session:
+        result = await session.execute(
+            delete(AgentCacheEntry).where(
+                AgentCacheEntry.expires_at <= datetime.now(timezone.utc)
+            )
+        )
+        await commit_session(session)
+        return result.rowcount
@@ -0,0 +1,56 @@
+from datetime import datetime, timezone
+from typing import Dict
+
+from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert
+
+from models.plan_stage_output import PlanStageOutput
+from services.db_service import commit_session, get_db_session
+
+
+async def save_stage_output(
+    trip_plan_id: str, stage: str, input_hash: str, output: str
+) -> None:
+    """Save (or replace) the checkpointed output of a plan stage."""
+    async with get_db_session() as session:
+        statement = insert(PlanStageOutput).values(
+            trip_plan_id=trip_plan_id,
+            stage=stage,
+            input_hash=input_hash,
+            output=output,
+            created_at=datetime.now(timezone.utc),
+        )
+        statement = statement.on_conflict_do_update(
+            constraint="uq_plan_stage_outputs_trip_stage",
+            set_={
+                "input_hash": statement.excluded.input_hash,
+                "output": statement.excluded.output,
+                "created_at": statement.excluded.created_at,
+            },
+        )
+        await session.execute(statement)
+        await commit_session(session)
+
+
+async def get_stage_outputs(trip_plan_id: str, input_hash: str) -> Dict[str, str]:
+    """Get the checkpointed stage outputs for a trip plan, keyed by stage name.
+
+    Only outputs generated for the same travel request (``input_hash``) are returned.
+    """
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(PlanStageOutput.stage, PlanStageOutput.output).where(
+                PlanStageOutput.trip_plan_id == trip_plan_id,
+                PlanStageOutput.input_hash == input_hash,
+            )
+        )
+        return {stage: output for stage, output in result.all()}
+
+
+async def delete_stage_outputs(trip_plan_id: str) -> None:
+    """Delete all checkpointed stage outputs for a trip plan."""
+    async with get_db_session() as session:
+        await session.execute(
+            delete(PlanStageOutput).where(PlanStageOutput.trip_plan_id == trip_plan_id)
+        )
+        await commit_session(session)
@@ -1,11 +1,11 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 
-from sqlalchemy import select
+from sqlalchemy import func, select, update, or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.plan_task import PlanTask, TaskStatus
-from services.db_service import get_db_session
+from services.db_service import commit_session, get_db_session
 
 
 async def create_plan_task(
@@ -13,6 +13,7 @@ async def create_plan_task(
     task_type: str,
     input_data: dict,
     status: TaskStatus = TaskStatus.queued,
+    fingerprint: Optional[str] = None,
 ) -> PlanTask:
     """Create a new plan task."""
     async with get_db_session() as session:
@@ -21,9 +22,10 @@ async def create_plan_task(
             task_type=task_type,
             status=status,
             input_data=input_data,
+            fingerprint=fingerprint,
         )
         session.add(task)
-        await session.commit()
+        await commit_session(session)
         await session.refresh(task)
         return task
 
@@ -46,7 +48,7 @@ async def update_task_status(
             if error_message is not None:
                 task.error_message = error_message
             task.updated_at = datetime.now(timezone.utc)
-            await session.commit()
+            await commit_session(session)
             await session.refresh(task)
         return task
 
@@ -67,6 +69,20 @@ async def get_tasks_by_trip_plan(trip_plan_id: str) -> List[PlanTask]:
         return list(result.scalars().all())
 
 
+async def get_active_tasks_by_fingerprint(fingerprint: str) -> List[PlanTask]:
+    """Get the in-progress tasks for a request fingerprint, oldest first."""
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(PlanTask)
+            .where(
+                PlanTask.fingerprint == fingerprint,
+                PlanTask.status == TaskStatus.in_progress,
+            )
+            .order_by(PlanTask.created_at)
+        )
+        return list(result.scalars().all())
+
+
 async def get_tasks_by_status(status: TaskStatus) -> List[PlanTask]:
     """Get all tasks with a specific status."""
     async with get_db_session() as session:
@@ -74,3 +90,138 @@ async def get_tasks_by_status(status: TaskStatus) -> List[PlanTask]:
             select(PlanTask).where(PlanTask.status == status)
         )
         return list(result.scalars().all())
+
+
+async def claim_next_task(
+    task_type: str, worker_id: str, lease_seconds: int
+) -> Optional[PlanTask]:
+    """Claim the oldest queued task (or one whose lease expired) for a worker.
+
+    Uses ``FOR UPDATE SKIP LOCKED`` so concurrent workers never claim the same row.
+    """
+    now = datetime.now(timezone.utc)
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(PlanTask)
+            .where(
+                PlanTask.task_type == task_type,
+                or_(
+                    PlanTask.status == TaskStatus.queued,
+                    and_(
+                        PlanTask.status == TaskStatus.in_progress,
+                        PlanTask.lease_expires_at < now,
+                    ),
+                ),
+            )
+            .order_by(PlanTask.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        task = result.scalar_one_or_none()
+
+        if task:
+            task.status = TaskStatus.in_progress
+            task.worker_id = worker_id
+            task.attempts = (task.attempts or 0) + 1
+            task.lease_expires_at = now + timedelta(seconds=lease_seconds)
+            task.heartbeat_at = now
+            task.updated_at = now
+            await commit_session(session)
+            await session.refresh(task)
+        return task
+
+
+async def claim_duplicate_tasks(
+    task_type: str, fingerprint: str, worker_id: str, lease_seconds: int, limit: int = 50
+) -> List[PlanTask]:
+    """Claim every other queued task with the same request fingerprint.
+
+    Lets one worker serve a burst of identical requests with a single pipeline run.
+    """
+    now = datetime.now(timezone.utc)
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(PlanTask)
+            .where(
+                PlanTask.task_type == task_type,
+                PlanTask.fingerprint == fingerprint,
+                PlanTask.status == TaskStatus.queued,
+            )
+            .order_by(PlanTask.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        tasks = list(result.scalars().all())
+
+        for task in tasks:
+            task.status = TaskStatus.in_progress
+            task.worker_id = worker_id
+            task.attempts = (task.attempts or 0) + 1
+            task.lease_expires_at = now + timedelta(seconds=lease_seconds)
+            task.heartbeat_at = now
+            task.updated_at = now
+        if tasks:
+            await commit_session(session)
+        return tasks
+
+
+async def heartbeat_task(task_id: int, worker_id: str, lease_seconds: int) -> bool:
+    """Extend the lease of a task held by a worker.
+
+    Returns:
+        bool: False if the worker no longer holds the task
+    """
+    now = datetime.now(timezone.utc)
+    async with get_db_session() as session:
+        result = await session.execute(
+            update(PlanTask)
+            .where(
+                PlanTask.id == task_id,
+                PlanTask.worker_id == worker_id,
+                PlanTask.status == TaskStatus.in_progress,
+            )
+            .values(
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                heartbeat_at=now,
+            )
+        )
+        await commit_session(session)
+        return result.rowcount > 0
+
+
+async def release_task(task_id: int, worker_id: str) -> None:
+    """Hand a task held by a worker back to the queue (e.g. on shutdown).
+
+    The attempt isn't counted, so restarts don't use up a healthy plan's attempts.
+    """
+    async with get_db_session() as session:
+        await session.execute(
+            update(PlanTask)
+            .where(
+                PlanTask.id == task_id,
+                PlanTask.worker_id == worker_id,
+                PlanTask.status == TaskStatus.in_progress,
+            )
+            .values(
+                status=TaskStatus.queued,
+                worker_id=None,
+                lease_expires_at=None,
+                attempts=func.greatest(PlanTask.attempts - 1, 0),
+            )
+        )
+        await commit_session(session)
+
+
+async def requeue_task(task_id: int) -> None:
+    """Put an orphaned in-progress task back on the queue."""
+    async with get_db_session() as session:
+        await session.execute(
+            update(PlanTask)
+            .where(PlanTask.id == task_id, PlanTask.status == TaskStatus.in_progress)
+            .values(
+                status=TaskStatus.queued,
+                worker_id=None,
+                lease_expires_at=None,
+            )
+        )
+        await commit_session(session)
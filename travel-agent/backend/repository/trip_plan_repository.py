@@ -1,11 +1,13 @@
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Any, Dict, List, Optional, Sequence
 
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models.trip_db import TripPlanStatus, TripPlanOutput
-from services.db_service import get_db_session
+from models.travel_plan import TravelPlanTeamResponse
+from models.trip_db import CUID_GENERATOR, TripPlanStatus, TripPlanOutput
+from services.db_service import commit_session, get_db_session
 
 
 async def create_trip_plan_status(
@@ -21,7 +23,7 @@ async def create_trip_plan_status(
             updatedAt=datetime.now().replace(tzinfo=None),
         )
         session.add(status_entry)
-        await session.commit()
+        await commit_session(session)
         await session.refresh(status_entry)
         return status_entry
 
@@ -35,6 +37,29 @@ async def get_trip_plan_status(trip_plan_id: str) -> Optional[TripPlanStatus]:
         return result.scalar_one_or_none()
 
 
+def _status_values(
+    status: str,
+    current_step: Optional[str] = None,
+    error: Optional[str] = None,
+    started_at: Optional[datetime] = None,
+    completed_at: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Column values for a status update; fields left as None are not changed."""
+    values: Dict[str, Any] = {
+        "status": status,
+        "updatedAt": datetime.now(timezone.utc).replace(tzinfo=None),
+    }
+    if current_step is not None:
+        values["currentStep"] = current_step
+    if error is not None:
+        values["error"] = error
+    if started_at is not None:
+        values["startedAt"] = started_at.replace(tzinfo=None)
+    if completed_at is not None:
+        values["completedAt"] = completed_at.replace(tzinfo=None)
+    return values
+
+
 async def update_trip_plan_status(
     trip_plan_id: str,
     status: str,
@@ -43,45 +68,75 @@ async def update_trip_plan_status(
     started_at: Optional[datetime] = None,
     completed_at: Optional[datetime] = None,
 ) -> Optional[TripPlanStatus]:
-    """Update the status of a trip plan."""
+    """Update the status of a trip plan with a single UPDATE ... RETURNING."""
     async with get_db_session() as session:
         result = await session.execute(
-            select(TripPlanStatus).where(TripPlanStatus.tripPlanId == trip_plan_id)
+            update(TripPlanStatus)
+            .where(TripPlanStatus.tripPlanId == trip_plan_id)
+            .values(**_status_values(status, current_step, error, started_at, completed_at))
+            .returning(TripPlanStatus)
+            .execution_options(synchronize_session=False)
         )
         status_entry = result.scalar_one_or_none()
-
-        if status_entry:
-            status_entry.status = status
-            if current_step is not None:
-                status_entry.currentStep = current_step
-            if error is not None:
-                status_entry.error = error
-            if started_at is not None:
-                status_entry.startedAt = started_at.replace(tzinfo=None)
-            if completed_at is not None:
-                status_entry.completedAt = completed_at.replace(tzinfo=None)
-            status_entry.updatedAt = datetime.now(timezone.utc).replace(tzinfo=None)
-
-            await session.commit()
-            await session.refresh(status_entry)
+        await commit_session(session)
         return status_entry
 
 
-async def create_trip_plan_output(
-    trip_plan_id: str, itinerary: str, summary: Optional[str] = None
+async def update_trip_plan_statuses(updates: Dict[str, Dict[str, Any]]) -> None:
+    """Apply status updates to several trip plans in one transaction.
+
+    Args:
+        updates: Keyword arguments of ``update_trip_plan_status`` (except
+            ``trip_plan_id``), keyed by trip plan ID
+    """
+    async with get_db_session() as session:
+        for trip_plan_id, fields in updates.items():
+            await session.execute(
+                update(TripPlanStatus)
+                .where(TripPlanStatus.tripPlanId == trip_plan_id)
+                .values(**_status_values(**fields))
+                .execution_options(synchronize_session=False)
+            )
+        await commit_session(session)
+
+
+# Sections of the structured itinerary, stored under the document's "itinerary" key
+ITINERARY_SECTIONS = tuple(TravelPlanTeamResponse.model_fields)
+
+
+async def upsert_trip_plan_output(
+    trip_plan_id: str, itinerary: Dict[str, Any], summary: Optional[str] = None
 ) -> TripPlanOutput:
-    """Create a new trip plan output entry."""
+    """Create or replace the output of a trip plan with a single upsert.
+
+    Args:
+        trip_plan_id: The trip plan the output belongs to
+        itinerary: The plan document, stored as JSONB
+        summary: Optional short summary of the plan
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    statement = insert(TripPlanOutput).values(
+        id=CUID_GENERATOR.generate(),
+        tripPlanId=trip_plan_id,
+        itinerary=itinerary,
+        summary=summary,
+        createdAt=now,
+        updatedAt=now,
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[TripPlanOutput.tripPlanId],
+        set_={
+            "itinerary": statement.excluded.itinerary,
+            "summary": statement.excluded.summary,
+            "updatedAt": statement.excluded.updatedAt,
+        },
+    ).returning(TripPlanOutput)
     async with get_db_session() as session:
-        output_entry = TripPlanOutput(
-            tripPlanId=trip_plan_id,
-            itinerary=itinerary,
-            summary=summary,
-            createdAt=datetime.now(timezone.utc).replace(tzinfo=None),
-            updatedAt=datetime.now(timezone.utc).replace(tzinfo=None),
+        result = await session.execute(
+            statement, execution_options={"populate_existing": True}
         )
-        session.add(output_entry)
-        await session.commit()
-        await session.refresh(output_entry)
+        output_entry = result.scalar_one()
+        await commit_session(session)
         return output_entry
 
 
@@ -94,8 +149,42 @@ async def get_trip_plan_output(trip_plan_id: str) -> Optional[TripPlanOutput]:
         return result.scalar_one_or_none()
 
 
+async def get_trip_plan_output_sections(
+    trip_plan_id: str, sections: Sequence[str]
+) -> Optional[Dict[str, Any]]:
+    """Read individual sections of a trip plan's output.
+
+    Only the requested parts of the document are extracted, by Postgres, so
+    e.g. the flights don't require loading and parsing the whole plan.
+
+    Args:
+        trip_plan_id: The trip plan to read
+        sections: Names from ``ITINERARY_SECTIONS`` (e.g. ``flights``,
+            ``day_by_day_plan``) or top-level keys of the document (e.g.
+            ``budget_agent_response``)
+
+    Returns:
+        Optional[Dict[str, Any]]: The sections by name (None for missing
+        ones), or None if the trip plan has no output yet
+    """
+    columns = [
+        TripPlanOutput.itinerary[
+            ("itinerary", section) if section in ITINERARY_SECTIONS else section
+        ].label(section)
+        for section in sections
+    ]
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(*columns).where(TripPlanOutput.tripPlanId == trip_plan_id)
+        )
+        row = result.first()
+    return dict(row._mapping) if row is not None else None
+
+
 async def update_trip_plan_output(
-    trip_plan_id: str, itinerary: Optional[str] = None, summary: Optional[str] = None
+    trip_plan_id: str,
+    itinerary: Optional[Dict[str, Any]] = None,
+    summary: Optional[str] = None,
 ) -> Optional[TripPlanOutput]:
     """Update the output of a trip plan."""
     async with get_db_session() as session:
@@ -111,7 +200,7 @@ async def update_trip_plan_output(
                 output_entry.summary = summary
             output_entry.updatedAt = datetime.now(timezone.utc).replace(tzinfo=None)
 
-            await session.commit()
+            await commit_session(session)
             await session.refresh(output_entry)
         return output_entry
 
@@ -134,6 +223,31 @@ async def get_all_processing_trip_plans() -> List[TripPlanStatus]:
         return list(result.scalars().all())
 
 
+async def get_stale_trip_plans(
+    status: str, updated_before: datetime
+) -> List[TripPlanStatus]:
+    """Get trip plans in a status that have not been updated since ``updated_before``."""
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(TripPlanStatus).where(
+                TripPlanStatus.status == status,
+                TripPlanStatus.updatedAt < updated_before.astimezone(timezone.utc).replace(tzinfo=None),
+            )
+        )
+        return list(result.scalars().all())
+
+
+async def touch_trip_plan_status(trip_plan_id: str) -> None:
+    """Bump updatedAt so a running plan is not mistaken for an orphaned one."""
+    async with get_db_session() as session:
+        await session.execute(
+            update(TripPlanStatus)
+            .where(TripPlanStatus.tripPlanId == trip_plan_id)
+            .values(updatedAt=datetime.now(timezone.utc).replace(tzinfo=None))
+        )
+        await commit_session(session)
+
+
 async def get_trip_plans_by_status(status: str) -> List[TripPlanStatus]:
     """Get all trip plans with a specific status."""
     async with get_db_session() as session:
@@ -149,4 +263,4 @@ async def delete_trip_plan_outputs(trip_plan_id: str) -> None:
         await session.execute(
             delete(TripPlanOutput).where(TripPlanOutput.tripPlanId == trip_plan_id)
         )
-        await session.commit()
+        await commit_session(session)
@@ -1,23 +1,13 @@
 import asyncio
 from dotenv import load_dotenv
 load_dotenv()
-from services.db_service import initialize_db_pool, get_db_session
-from sqlalchemy import text
-from datetime import datetime, timezone
+from services.db_service import initialize_db_pool
+from services.plan_recovery import recover_orphaned_plans
 
 async def reset_status():
     await initialize_db_pool()
-    async with get_db_session() as session:
-        # Reset the stuck trip plan status to failed
-        await session.execute(text(
-            'UPDATE trip_plan_status '
-            'SET status = \'failed\', '
-            'error = \'Previous generation was interrupted. Please retry.\', '
-            '"completedAt" = NOW() '
-            'WHERE "tripPlanId" = \'cmkutczx300012ub08jlsob7k\' '
-            'AND status = \'processing\''
-        ))
-        await session.commit()
-        print('Trip plan status reset to failed. User can now retry.')
+    # Requeue stuck plans (or mark them failed if they cannot be resumed)
+    requeued = await recover_orphaned_plans()
+    print(f'{requeued} orphaned trip plans requeued. Workers will resume them.')
 
 asyncio.run(reset_status())
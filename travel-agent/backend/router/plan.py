@@ -1,27 +1,38 @@
 import asyncio
+import json
 import traceback
-from fastapi import APIRouter, HTTPException, status, BackgroundTasks
+from typing import Any, Dict
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from models.travel_plan import TravelPlanAgentRequest, TravelPlanResponse
-from models.plan_task import TaskStatus
-from services.plan_service import generate_travel_plan
-from repository.plan_task_repository import create_plan_task, update_task_status
-from typing import List
+from repository.plan_task_repository import create_plan_task
+from repository.trip_plan_repository import (
+    create_trip_plan_status,
+    get_trip_plan_output_sections,
+    get_trip_plan_status,
+    update_trip_plan_status,
+)
+from services.db_service import atomic
+from services.plan_service import travel_request_fingerprint
+from services.plan_events import (
+    TERMINAL_STATUSES,
+    load_plan_result,
+    load_plan_snapshot,
+    plan_event_broker,
+    publish_status,
+)
+from services.plan_worker import PLAN_TASK_TYPE, wake_embedded_worker
 
 router = APIRouter(prefix="/api/plan", tags=["Travel Plan"])
 
+# Comment lines sent while idle so proxies don't close the stream
+SSE_KEEPALIVE_SECONDS = 15
 
-def handle_task_exception(task: asyncio.Task):
-    """Callback to handle exceptions from background tasks."""
-    try:
-        exc = task.exception()
-        if exc:
-            logger.error(f"Background task failed with exception: {exc}")
-            logger.error(f"Traceback: {''.join(traceback.format_exception(type(exc), exc, exc.__traceback__))}")
-    except asyncio.CancelledError:
-        logger.warning("Background task was cancelled")
-    except Exception as e:
-        logger.error(f"Error in exception handler: {e}")
+
+def format_sse(event: Dict[str, Any]) -> str:
+    """Serialize an event in the Server-Sent Events wire format."""
+    return f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
 
 
 @router.post(
@@ -36,6 +47,8 @@ async def trigger_trip_craft_agent(
     """
     Trigger the trip craft agent to create a personalized travel itinerary.
 
+    The plan is only enqueued here; a plan worker claims and runs it.
+
     Args:
         request: Travel plan request containing trip details and plan ID
 
@@ -46,49 +59,37 @@ async def trigger_trip_craft_agent(
         logger.info(f"Triggering travel plan agent for trip ID: {request.trip_plan_id}")
         logger.info(f"Travel plan details: {request.travel_plan}")
 
-        # Create initial task
-        task = await create_plan_task(
-            trip_plan_id=request.trip_plan_id,
-            task_type="travel_plan_generation",
-            input_data=request.travel_plan.model_dump(),
-        )
-
-        logger.info(f"Task created: {task.id}")
+        # Show the plan as waiting and enqueue it in one transaction: a worker
+        # can claim the task as soon as it is committed, and its "processing"
+        # must not be overwritten by this "pending"
+        async with atomic():
+            if await get_trip_plan_status(request.trip_plan_id):
+                await update_trip_plan_status(
+                    trip_plan_id=request.trip_plan_id,
+                    status="pending",
+                    current_step="Waiting for an available trip planner",
+                )
+            else:
+                await create_trip_plan_status(
+                    trip_plan_id=request.trip_plan_id,
+                    status="pending",
+                    current_step="Waiting for an available trip planner",
+                )
 
-        # Create background task for plan generation
-        async def generate_plan_with_tracking():
-            try:
-                logger.info(f"[Task {task.id}] Starting plan generation for trip: {request.trip_plan_id}")
-                
-                # Update task status to in progress when service starts
-                await update_task_status(task.id, TaskStatus.in_progress)
-                logger.info(f"[Task {task.id}] Status updated to in_progress")
+            task = await create_plan_task(
+                trip_plan_id=request.trip_plan_id,
+                task_type=PLAN_TASK_TYPE,
+                input_data=request.travel_plan.model_dump(),
+                fingerprint=travel_request_fingerprint(request.travel_plan),
+            )
 
-                result = await generate_travel_plan(request)
+        logger.info(f"Task queued: {task.id}")
 
-                # Update task with success status and output
-                await update_task_status(
-                    task.id, TaskStatus.success, output_data={"travel_plan": result}
-                )
-                logger.info(f"[Task {task.id}] Completed successfully!")
-                
-            except Exception as e:
-                error_msg = f"{type(e).__name__}: {str(e)}"
-                logger.error(f"[Task {task.id}] Error generating travel plan: {error_msg}")
-                logger.error(f"[Task {task.id}] Full traceback:\n{traceback.format_exc()}")
-                
-                # Update task with error status
-                try:
-                    await update_task_status(
-                        task.id, TaskStatus.error, error_message=error_msg
-                    )
-                    logger.info(f"[Task {task.id}] Status updated to error")
-                except Exception as update_error:
-                    logger.error(f"[Task {task.id}] Failed to update error status: {update_error}")
+        await publish_status(
+            request.trip_plan_id, "pending", "Waiting for an available trip planner"
+        )
 
-        # Create background task with exception handler
-        background_task = asyncio.create_task(generate_plan_with_tracking())
-        background_task.add_done_callback(handle_task_exception)
+        wake_embedded_worker()
 
         logger.info(
             f"Travel plan agent triggered successfully for trip ID: {request.trip_plan_id}"
@@ -107,3 +108,92 @@ async def trigger_trip_craft_agent(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to trigger travel plan agent: {str(e)}",
         )
+
+
+@router.get(
+    "/{trip_plan_id}/events",
+    summary="Stream Trip Plan Progress",
+    description="Server-Sent Events stream of status changes and stage outputs of a trip plan",
+)
+async def stream_trip_plan_events(trip_plan_id: str, request: Request) -> StreamingResponse:
+    """
+    Stream a trip plan's progress as Server-Sent Events.
+
+    The stream starts with the plan's current status and the outputs of the
+    stages finished so far, then pushes ``status`` and ``stage`` events as they
+    happen, plus ``token`` events while the itinerary is being written. Once
+    the plan completes a ``result`` event carries the final plan and the
+    stream ends.
+
+    Args:
+        trip_plan_id: The trip plan to follow
+        request: The incoming request, used to detect disconnects
+
+    Returns:
+        StreamingResponse: The ``text/event-stream`` response
+    """
+    # Subscribe before loading the snapshot so no event falls in between
+    queue = plan_event_broker.subscribe(trip_plan_id)
+
+    async def event_stream():
+        try:
+            events = await load_plan_snapshot(trip_plan_id)
+            while True:
+                for event in events:
+                    yield format_sse(event)
+                    if event["type"] == "status" and event["status"] in TERMINAL_STATUSES:
+                        if event["status"] == "completed":
+                            result = await load_plan_result(trip_plan_id)
+                            if result is not None:
+                                yield format_sse(result)
+                        return
+
+                if await request.is_disconnected():
+                    return
+                try:
+                    events = [await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_SECONDS)]
+                except asyncio.TimeoutError:
+                    events = []
+                    yield ": keep-alive\n\n"
+        finally:
+            plan_event_broker.unsubscribe(trip_plan_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/{trip_plan_id}/output/{section}",
+    summary="Get Trip Plan Output Section",
+    description="Returns one section of a completed trip plan, e.g. flights or day_by_day_plan",
+)
+async def get_trip_plan_output_section(trip_plan_id: str, section: str) -> Dict[str, Any]:
+    """
+    Read a single section of a trip plan's output.
+
+    Sections of the structured itinerary (``flights``, ``hotels``,
+    ``day_by_day_plan``, ...) and the raw agent responses (e.g.
+    ``budget_agent_response``) can be read without fetching the whole plan.
+
+    Args:
+        trip_plan_id: The trip plan to read
+        section: Name of the section
+
+    Returns:
+        Dict[str, Any]: The trip plan ID, the section name and its data
+    """
+    sections = await get_trip_plan_output_sections(trip_plan_id, [section])
+    if sections is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No output for trip plan {trip_plan_id}",
+        )
+    if sections[section] is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Trip plan output has no section '{section}'",
+        )
+    return {"trip_plan_id": trip_plan_id, "section": section, "data": sections[section]}
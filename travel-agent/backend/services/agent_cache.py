@@ -0,0 +1,206 @@
+"""
+Tiered cache for per-agent results.
+
+An in-memory LRU tier sits in front of a persistent PostgreSQL tier
+(``agent_result_cache``). Entries are keyed by the agent and only the request
+fields that agent actually depends on, and expire after a per-agent TTL, so
+e.g. destination research is reused for hours while flight prices go stale
+quickly. Concurrent misses for the same key share a single agent run.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from repository.agent_cache_repository import (
+    delete_expired_cache_entries,
+    get_cache_entry,
+    upsert_cache_entry,
+)
+
+AGENT_CACHE_ENABLED = os.getenv("AGENT_CACHE_ENABLED", "true").lower() == "true"
+AGENT_CACHE_MAX_ENTRIES = int(os.getenv("AGENT_CACHE_MAX_ENTRIES", "256"))
+# Expired persistent entries are pruned at most this often per process
+PRUNE_INTERVAL_SECONDS = 3600
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How results of one agent are cached."""
+
+    ttl_seconds: int
+    # Request fields the agent's output depends on; nothing else affects the key
+    key_fields: Tuple[str, ...]
+
+
+# Result of a pending run whose plan was cancelled; its waiters run it themselves
+_ABANDONED = object()
+
+
+class AgentResultCache:
+    """Memory LRU + persistent cache of agent outputs with hit/miss metrics."""
+
+    def __init__(self, max_entries: int = AGENT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # key -> (expires_at unix timestamp, content), least recently used first
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"memory_hits": 0, "persistent_hits": 0, "misses": 0, "errors": 0}
+        )
+        self._last_prune = 0.0
+
+    @staticmethod
+    def make_key(agent_name: str, key_values: Dict[str, Any]) -> str:
+        """Build a cache key from the agent name and the fields it depends on."""
+        payload = json.dumps({"agent": agent_name, **key_values}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_memory(self, key: str) -> Optional[str]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, content = entry
+        if expires_at <= time.time():
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return content
+
+    def _set_memory(self, key: str, content: str, expires_at: float) -> None:
+        self._memory[key] = (expires_at, content)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    async def get(self, agent_name: str, key: str) -> Optional[str]:
+        """Look a key up in the memory tier, then the persistent tier."""
+        content = self._get_memory(key)
+        if content is not None:
+            self._stats[agent_name]["memory_hits"] += 1
+            return content
+
+        try:
+            entry = await get_cache_entry(key)
+        except Exception as e:
+            logger.warning(f"Agent cache lookup failed for {agent_name}: {e}")
+            self._stats[agent_name]["errors"] += 1
+            entry = None
+
+        if entry is not None:
+            self._stats[agent_name]["persistent_hits"] += 1
+            self._set_memory(key, entry.content, entry.expires_at.timestamp())
+            return entry.content
+
+        self._stats[agent_name]["misses"] += 1
+        return None
+
+    async def set(self, agent_name: str, key: str, content: str, ttl_seconds: int) -> None:
+        """Store a result in both tiers."""
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        self._set_memory(key, content, expires_at.timestamp())
+        try:
+            await upsert_cache_entry(key, agent_name, content, expires_at)
+            await self._prune_expired()
+        except Exception as e:
+            logger.warning(f"Agent cache store failed for {agent_name}: {e}")
+            self._stats[agent_name]["errors"] += 1
+
+    async def _prune_expired(self) -> None:
+        now = time.monotonic()
+        if now - self._last_prune < PRUNE_INTERVAL_SECONDS:
+            return
+        self._last_prune = now
+        removed = await delete_expired_cache_entries()
+        if removed:
+            logger.info(f"Pruned {removed} expired agent cache entries")
+
+    async def get_or_run(
+        self,
+        agent_name: str,
+        policy: CachePolicy,
+        key_values: Dict[str, Any],
+        run: Callable[[], Awaitable[str]],
+    ) -> str:
+        """Return the cached result for an agent, running it on a miss.
+
+        Args:
+            agent_name: Name of the agent (cache namespace)
+            policy: TTL and key fields for the agent
+            key_values: Values of ``policy.key_fields`` for this request
+            run: Produces the result on a miss
+
+        Returns:
+            str: The cached or freshly produced result
+        """
+        if not AGENT_CACHE_ENABLED:
+            return await run()
+
+        key = self.make_key(agent_name, key_values)
+        while True:
+            content = await self.get(agent_name, key)
+            if content is not None:
+                logger.info(f"Agent cache hit for {agent_name}")
+                return content
+
+            # Another plan is already producing this exact result; wait for it
+            pending = self._pending.get(key)
+            if pending is None:
+                break
+            content = await asyncio.shield(pending)
+            if content is not _ABANDONED:
+                return content
+            # Its plan was cancelled; look again, and produce the result if still missing
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            content = await run()
+            future.set_result(content)
+        except asyncio.CancelledError:
+            # Cancelling this plan must not cancel the plans waiting on it
+            future.set_result(_ABANDONED)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved in case nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            self._pending.pop(key, None)
+
+        await self.set(agent_name, key, content, policy.ttl_seconds)
+        return content
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss metrics per agent and in total."""
+        totals = {"memory_hits": 0, "persistent_hits": 0, "misses": 0, "errors": 0}
+        agents = {}
+        for agent_name, counters in self._stats.items():
+            lookups = counters["memory_hits"] + counters["persistent_hits"] + counters["misses"]
+            hits = counters["memory_hits"] + counters["persistent_hits"]
+            agents[agent_name] = {**counters, "hit_rate": round(hits / lookups, 3) if lookups else 0.0}
+            for name, value in counters.items():
+                totals[name] += value
+
+        lookups = totals["memory_hits"] + totals["persistent_hits"] + totals["misses"]
+        hits = totals["memory_hits"] + totals["persistent_hits"]
+        return {
+            "enabled": AGENT_CACHE_ENABLED,
+            "memory_entries": len(self._memory),
+            "memory_capacity": self.max_entries,
+            **totals,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "agents": agents,
+        }
+
+
+agent_result_cache = AgentResultCache()
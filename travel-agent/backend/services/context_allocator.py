@@ -0,0 +1,215 @@
+"""
+Token budgeting for the prompts of downstream stages.
+
+The itinerary and budget agents receive the travel request plus the outputs
+of several upstream stages. A single request may not exceed the model's
+tokens-per-minute quota (and the agent resends the prompt on every tool round
+trip), so the prompt has to fit a budget derived from the model's TPM and
+context limits.
+
+``ContextAllocator`` splits that budget across the prompt's sections by
+priority: every section keeps a small head, then the budget goes to the most
+important sections first, so low-priority content is trimmed first instead
+of whatever happens to sit at the end of the prompt. ``fit_or_summarize``
+asks a summarizer for sections that would lose a lot of text instead of
+cutting them off. Required sections (the travel request) are never trimmed,
+and a prompt whose budget leaves no room raises ``ContextBudgetError`` rather
+than reaching the model empty.
+"""
+
+import asyncio
+import os
+import re
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from config.llm import get_model_limits
+from config.tokenizer import count_tokens, truncate_to_tokens
+
+# Share of the model's TPM a single prompt may use; tool round trips resend it
+CONTEXT_TPM_SHARE = float(os.getenv("CONTEXT_TPM_SHARE", "0.5"))
+# Tokens every section keeps (if it has them) before any section is topped up
+MIN_SECTION_TOKENS = int(os.getenv("CONTEXT_MIN_SECTION_TOKENS", "300"))
+# Sections losing less than this share of their tokens are cut instead of summarized
+SUMMARY_MIN_TRIM_RATIO = float(os.getenv("CONTEXT_SUMMARY_MIN_TRIM_RATIO", "0.25"))
+
+TRIM_MARKER = "\n[... trimmed to fit the context budget ...]"
+TRIM_MARKER_TOKENS = count_tokens(TRIM_MARKER)
+
+
+class ContextBudgetError(ValueError):
+    """The fixed parts of a request leave no room for its prompt."""
+
+
+@dataclass
+class ContextSection:
+    """A part of a prompt that may be trimmed to fit the budget."""
+
+    name: str
+    text: str
+    # Higher priorities are kept in full first
+    priority: int
+    min_tokens: int = MIN_SECTION_TOKENS
+    # Kept whole whatever the budget; the prompt is meaningless without it
+    required: bool = False
+
+
+def compact_markdown(text: str) -> str:
+    """Drop formatting that costs tokens without carrying content."""
+    text = re.sub(r"!\[[^\]]*\]\([^)]*\)", "", text)  # images
+    text = re.sub(r"^\s*([-*_]\s*){3,}$", "", text, flags=re.MULTILINE)  # rules
+    text = re.sub(r"[ \t]+$", "", text, flags=re.MULTILINE)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return text.strip()
+
+
+class ContextAllocator:
+    """Fits prompt sections into the token budget of one model."""
+
+    def __init__(self, llm, tpm_share: float = CONTEXT_TPM_SHARE):
+        _, tpm, context_window, max_completion = get_model_limits(llm)
+        self.max_prompt_tokens = min(int(tpm * tpm_share), context_window - max_completion)
+
+    def fit(self, sections: Sequence[ContextSection], reserved_tokens: int = 0) -> Dict[str, str]:
+        """Trim sections to fit the prompt budget.
+
+        Args:
+            sections: The prompt's trimmable sections
+            reserved_tokens: Tokens already taken by the fixed parts of the
+                request (system prompt, prompt template, reply allowance)
+
+        Returns:
+            Dict[str, str]: The (possibly trimmed) text of each section by name
+        """
+        texts, sizes, allocation = self._plan(sections, reserved_tokens)
+        if allocation is None:
+            return texts
+        trimmed = []
+        for name, tokens in allocation.items():
+            if tokens < sizes[name]:
+                texts[name] = self._cut(texts[name], tokens)
+                trimmed.append(f"{name} {sizes[name]}→{tokens}")
+        logger.info("Trimmed context sections: " + ", ".join(trimmed))
+        return texts
+
+    async def fit_or_summarize(
+        self,
+        sections: Sequence[ContextSection],
+        reserved_tokens: int,
+        summarize: Callable[[str, str, int], Awaitable[str]],
+    ) -> Dict[str, str]:
+        """Fit sections to the prompt budget, summarizing those that lose the most.
+
+        Sections that fit are used as they are. Over budget, sections that
+        would lose at least ``SUMMARY_MIN_TRIM_RATIO`` of their tokens are
+        summarized to their share of the budget; the others (and summaries
+        that fail or come back too long) are cut as in ``fit``.
+
+        Args:
+            sections: The prompt's trimmable sections
+            reserved_tokens: Tokens already taken by the fixed parts of the request
+            summarize: Called with a section's name, text and token budget
+
+        Returns:
+            Dict[str, str]: The text of each section by name
+        """
+        texts, sizes, allocation = self._plan(sections, reserved_tokens)
+        if allocation is None:
+            return texts
+
+        async def shrink(name: str, tokens: int) -> Tuple[str, str]:
+            if tokens < MIN_SECTION_TOKENS or tokens > sizes[name] * (1 - SUMMARY_MIN_TRIM_RATIO):
+                return name, self._cut(texts[name], tokens)
+            try:
+                summary = compact_markdown(await summarize(name, texts[name], tokens))
+            except Exception as e:
+                logger.warning(f"Summarizing the {name} context failed ({e}); trimming it")
+                return name, self._cut(texts[name], tokens)
+            # A summary is a best effort at the budget; never let it overflow
+            return name, self._cut(summary, tokens) if summary else self._cut(texts[name], tokens)
+
+        shrunk = await asyncio.gather(
+            *(shrink(name, tokens) for name, tokens in allocation.items() if tokens < sizes[name])
+        )
+        texts.update(shrunk)
+        return texts
+
+    def _plan(
+        self, sections: Sequence[ContextSection], reserved_tokens: int
+    ) -> Tuple[Dict[str, str], Dict[str, int], Optional[Dict[str, int]]]:
+        """Compact the sections and allocate the budget; no allocation when they fit."""
+        texts = {section.name: compact_markdown(section.text) for section in sections}
+        sizes = {name: count_tokens(text) for name, text in texts.items()}
+        budget = max(self.max_prompt_tokens - reserved_tokens, 0)
+        if sum(sizes.values()) <= budget:
+            return texts, sizes, None
+        logger.info(f"Context over budget ({sum(sizes.values())} > {budget} tokens)")
+
+        required = [section for section in sections if section.required]
+        optional = [section for section in sections if not section.required]
+        budget -= sum(sizes[section.name] for section in required)
+        if budget <= 0 and optional:
+            logger.warning(
+                f"No prompt budget left beyond the required sections "
+                f"({self.max_prompt_tokens} tokens, {reserved_tokens} reserved); dropping "
+                + ", ".join(section.name for section in optional)
+            )
+        allocation = self._allocate(optional, sizes, max(budget, 0))
+        allocation.update({section.name: sizes[section.name] for section in required})
+        return texts, sizes, allocation
+
+    @staticmethod
+    def _cut(text: str, tokens: int) -> str:
+        if count_tokens(text) <= tokens:
+            return text
+        keep = max(tokens - TRIM_MARKER_TOKENS, 0)
+        return truncate_to_tokens(text, keep) + TRIM_MARKER if keep else ""
+
+    @staticmethod
+    def _allocate(
+        sections: Sequence[ContextSection], sizes: Dict[str, int], budget: int
+    ) -> Dict[str, int]:
+        ordered = sorted(sections, key=lambda section: -section.priority)
+        allocation = {section.name: 0 for section in sections}
+        remaining = budget
+
+        # Every section keeps its head, most important first
+        for section in ordered:
+            grant = min(sizes[section.name], section.min_tokens, remaining)
+            allocation[section.name] = grant
+            remaining -= grant
+
+        # Then the rest goes to whole priority levels in turn, split evenly
+        # between sections of the same priority
+        for priority in sorted({section.priority for section in sections}, reverse=True):
+            level: List[str] = [s.name for s in ordered if s.priority == priority]
+            while remaining > 0:
+                wanting = [name for name in level if allocation[name] < sizes[name]]
+                if not wanting:
+                    break
+                share = max(remaining // len(wanting), 1)
+                for name in wanting:
+                    grant = min(sizes[name] - allocation[name], share, remaining)
+                    allocation[name] += grant
+                    remaining -= grant
+        return allocation
+
+    def truncate(self, text: str, reserved_tokens: int = 0) -> str:
+        """Cut a whole prompt to the budget, e.g. after the provider rejected it as too large.
+
+        Raises:
+            ContextBudgetError: If the budget can't hold even ``MIN_SECTION_TOKENS``
+                of the prompt
+        """
+        budget = max(self.max_prompt_tokens - reserved_tokens, 0)
+        if count_tokens(text) <= budget:
+            return text
+        keep = budget - TRIM_MARKER_TOKENS
+        if keep < MIN_SECTION_TOKENS:
+            raise ContextBudgetError(
+                f"Prompt budget of {self.max_prompt_tokens} tokens with {reserved_tokens} reserved "
+                f"for instructions and tools leaves no room for the prompt"
+            )
+        return truncate_to_tokens(text, keep) + TRIM_MARKER
@@ -0,0 +1,198 @@
+"""
+Compact digests of the research stages' outputs for downstream prompts.
+
+The flight, hotel, dining and destination agents write long markdown reports
+(descriptions, reviews, booking advice). The itinerary and budget agents only
+need the facts: names, prices, locations and links. A digest re-renders the
+entities ``agents.markdown_parser`` finds in a report as a compact table or
+list, which typically costs a fraction of the report's tokens.
+
+Digests are deterministic, so identical research yields identical prompts.
+When a report has no parseable entities (or the digest wouldn't be smaller)
+the report itself is used. Summarizing with an LLM is left to the prompt
+budget: only sections that still don't fit are summarized.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from loguru import logger
+
+from agents.markdown_parser import (
+    parse_attractions,
+    parse_flights,
+    parse_hotels,
+    parse_restaurants,
+    parse_tips,
+)
+from config.tokenizer import count_tokens
+from services.context_allocator import compact_markdown
+
+# Longest description kept for one entity in a digest
+MAX_DESCRIPTION_CHARS = 160
+MAX_TIPS = 5
+
+
+def _cell(value) -> str:
+    """A markdown table cell: one line, no pipes."""
+    return " ".join(str(value).split()).replace("|", "/") or "-"
+
+
+def _shorten(text: str, limit: int = MAX_DESCRIPTION_CHARS) -> str:
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0].rstrip(",;:.") + "…"
+
+
+def _table(headers: Sequence[str], rows: List[Sequence]) -> str:
+    lines = [
+        "| " + " | ".join(headers) + " |",
+        "|" + "---|" * len(headers),
+    ]
+    lines += ["| " + " | ".join(_cell(value) for value in row) + " |" for row in rows]
+    return "\n".join(lines)
+
+
+def digest_flights(markdown: str) -> Optional[str]:
+    """Flights as a table of airline, number, price, times, stops and link."""
+    flights = parse_flights(markdown)
+    if not flights:
+        return None
+    return _table(
+        ("Airline", "Flight", "Price", "Departure", "Arrival", "Duration", "Stops", "URL"),
+        [
+            (
+                flight.airline,
+                flight.flight_number,
+                flight.price,
+                flight.departure_time,
+                flight.arrival_time,
+                flight.duration,
+                flight.stops,
+                flight.url,
+            )
+            for flight in flights
+        ],
+    )
+
+
+def digest_hotels(markdown: str) -> Optional[str]:
+    """Hotels as a table of name, price, rating, location, amenities and link."""
+    hotels = parse_hotels(markdown)
+    if not hotels:
+        return None
+    return _table(
+        ("Hotel", "Price", "Rating", "Location", "Amenities", "URL"),
+        [
+            (
+                hotel.hotel_name,
+                hotel.price,
+                hotel.rating,
+                hotel.address,
+                ", ".join(hotel.amenities[:4]),
+                hotel.url,
+            )
+            for hotel in hotels
+        ],
+    )
+
+
+def digest_restaurants(markdown: str) -> Optional[str]:
+    """Restaurants as a table of name, location, short description and link."""
+    restaurants = parse_restaurants(markdown)
+    if not restaurants:
+        return None
+    return _table(
+        ("Restaurant", "Location", "Notes", "URL"),
+        [
+            (
+                restaurant.name,
+                restaurant.location,
+                _shorten(restaurant.description),
+                restaurant.url,
+            )
+            for restaurant in restaurants
+        ],
+    )
+
+
+def digest_destination(markdown: str) -> Optional[str]:
+    """Attractions with a one-line description each, followed by the guide's tips."""
+    attractions = parse_attractions(markdown)
+    if not attractions:
+        return None
+    lines = [
+        f"- **{attraction.name}**: {_shorten(attraction.description)}"
+        if attraction.description
+        else f"- **{attraction.name}**"
+        for attraction in attractions
+    ]
+    tips = parse_tips(markdown)[:MAX_TIPS]
+    if tips:
+        lines += ["", "Tips:"] + [f"- {tip}" for tip in tips]
+    return "\n".join(lines)
+
+
+def digest_output(name: str, markdown: str, digester: Callable[[str], Optional[str]]) -> str:
+    """Digest one stage output, keeping the (compacted) output when that is shorter."""
+    compacted = compact_markdown(markdown)
+    try:
+        digest = digester(markdown)
+    except Exception as e:
+        # A parser bug must not fail the plan; the full output still works
+        logger.warning(f"Could not digest the {name} output: {e}")
+        digest = None
+    if not digest or count_tokens(digest) >= count_tokens(compacted):
+        return compacted
+    return digest
+
+
+class ContextDigestStats:
+    """Process-wide counters of the prompt tokens saved by context compression."""
+
+    def __init__(self):
+        self.plans = 0
+        self.raw_tokens = 0
+        self.digest_tokens = 0
+        self.summarized_sections = 0
+        self.summary_tokens_saved = 0
+
+    def record_plan(
+        self, trip_plan_id: str, raw_tokens: Dict[str, int], digest_tokens: Dict[str, int]
+    ) -> None:
+        """Record the digests of one plan's research outputs."""
+        raw_total = sum(raw_tokens.values())
+        digest_total = sum(digest_tokens.values())
+        self.plans += 1
+        self.raw_tokens += raw_total
+        self.digest_tokens += digest_total
+        per_stage = ", ".join(
+            f"{name} {raw_tokens[name]}→{digest_tokens[name]}" for name in raw_tokens
+        )
+        logger.info(
+            f"Context digest for {trip_plan_id}: {raw_total}→{digest_total} tokens "
+            f"(saved {raw_total - digest_total}; {per_stage})"
+        )
+
+    def record_summary(self, name: str, before_tokens: int, after_tokens: int) -> None:
+        """Record a section summarized to fit a prompt budget."""
+        self.summarized_sections += 1
+        self.summary_tokens_saved += max(before_tokens - after_tokens, 0)
+        logger.info(f"Summarized the {name} context: {before_tokens}→{after_tokens} tokens")
+
+    def stats(self) -> Dict[str, Any]:
+        """Tokens saved by digests and by summaries, in total and per plan."""
+        saved = self.raw_tokens - self.digest_tokens
+        return {
+            "plans": self.plans,
+            "raw_tokens": self.raw_tokens,
+            "digest_tokens": self.digest_tokens,
+            "digest_tokens_saved": saved,
+            "digest_tokens_saved_per_plan": round(saved / self.plans, 1) if self.plans else 0.0,
+            "digest_ratio": round(self.digest_tokens / self.raw_tokens, 3) if self.raw_tokens else 0.0,
+            "summarized_sections": self.summarized_sections,
+            "summary_tokens_saved": self.summary_tokens_saved,
+        }
+
+
+context_digest_stats = ContextDigestStats()
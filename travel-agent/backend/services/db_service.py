@@ -4,11 +4,26 @@ Database service module for PostgreSQL connections using SQLAlchemy.
 This module provides utilities for connecting to a PostgreSQL database
 with SQLAlchemy, including connection pooling, session management,
 and context managers for proper resource management.
+
+Inside a ``unit_of_work()`` every ``get_db_session()`` reuses one session
+bound to a single pooled connection, and inside ``atomic()`` repository
+commits are deferred so a sequence of writes commits as one transaction.
+Outside ``atomic()`` each ``get_db_session()`` block ends its transaction on
+exit, so the connection never sits "idle in transaction" between operations.
+
+A unit of work holds its pooled connection for as long as it is open. A plan
+run keeps one for several minutes, so at most ``DB_MAX_UNITS_OF_WORK``
+long-lived units of work are open at once; further ones wait for a connection
+to be handed back, leaving the rest of the pool to API requests. Short scopes,
+such as an API request's ``atomic()`` block, don't take a slot and never
+queue behind plan runs.
 """
 
+import asyncio
 import os
+from contextvars import ContextVar
 from typing import Any, AsyncGenerator, Dict, Optional
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, nullcontext
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
@@ -33,9 +48,13 @@ DATABASE_URL = re.sub(r'[?&]channel_binding=[^&]*', '', DATABASE_URL)
 # Clean up any trailing ? or &
 DATABASE_URL = re.sub(r'[?&]$', '', DATABASE_URL)
 
+# Long-lived units of work holding a pooled connection at once (keep below the pool size)
+DB_MAX_UNITS_OF_WORK = int(os.getenv("DB_MAX_UNITS_OF_WORK", "8"))
+
 # Global engine and session factory
 _engine: Optional[AsyncEngine] = None
 _session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+_unit_of_work_slots: Optional[asyncio.Semaphore] = None
 
 async def initialize_db_pool(pool_size: int = 10, max_overflow: int = 20) -> None:
     """Initialize the SQLAlchemy engine and session factory.
@@ -82,10 +101,163 @@ async def close_db_pool() -> None:
         await _engine.dispose()
         _engine = None
 
+async def get_engine() -> AsyncEngine:
+    """Get the SQLAlchemy engine, initializing the pool if needed."""
+    if _engine is None:
+        await initialize_db_pool()
+    return _engine
+
+class _TaskReentrantLock:
+    """asyncio lock that the task holding it can acquire again."""
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._owner: Optional[asyncio.Task] = None
+        self._depth = 0
+
+    async def __aenter__(self) -> None:
+        task = asyncio.current_task()
+        if self._owner is task:
+            self._depth += 1
+            return
+        await self._lock.acquire()
+        self._owner = task
+        self._depth = 1
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._owner = None
+            self._lock.release()
+
+
+class UnitOfWork:
+    """One session on one pooled connection, shared by a scope's DB operations.
+
+    Concurrent tasks in the scope (e.g. pipeline stages) take turns on the
+    session, since a session must not be used by two tasks at once.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.lock = _TaskReentrantLock()
+        self.atomic_depth = 0
+        self.closed = False
+
+    @asynccontextmanager
+    async def atomic(self) -> AsyncGenerator[AsyncSession, None]:
+        """Commit every write made inside the block as a single transaction."""
+        async with self.lock:
+            self.atomic_depth += 1
+            try:
+                yield self.session
+                if self.atomic_depth == 1:
+                    await self.session.commit()
+            except BaseException:
+                if self.atomic_depth == 1:
+                    await self.session.rollback()
+                raise
+            finally:
+                self.atomic_depth -= 1
+
+
+_current_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar(
+    "current_unit_of_work", default=None
+)
+
+
+def _active_unit_of_work() -> Optional[UnitOfWork]:
+    unit_of_work = _current_unit_of_work.get()
+    # Tasks spawned inside a scope keep seeing it after it closed
+    if unit_of_work is None or unit_of_work.closed:
+        return None
+    return unit_of_work
+
+
+@asynccontextmanager
+async def unit_of_work(long_lived: bool = False) -> AsyncGenerator[UnitOfWork, None]:
+    """Scope in which all DB operations reuse one connection.
+
+    Repository functions keep committing their own writes, so progress stays
+    visible to other connections; use ``atomic()`` to group writes. The scope
+    holds one pooled connection until it exits.
+
+    Args:
+        long_lived: The scope spans a whole plan run. At most
+            ``DB_MAX_UNITS_OF_WORK`` such scopes are open at once; short
+            scopes don't wait for a slot.
+
+    Example:
+        ```python
+        async with unit_of_work(long_lived=True):
+            await update_trip_plan_status(trip_plan_id, status="processing")
+            async with atomic():
+                await upsert_trip_plan_output(trip_plan_id, itinerary=...)
+                await update_trip_plan_status(trip_plan_id, status="completed")
+        ```
+    """
+    existing = _active_unit_of_work()
+    if existing is not None:
+        yield existing
+        return
+
+    global _unit_of_work_slots
+    if _unit_of_work_slots is None:
+        _unit_of_work_slots = asyncio.Semaphore(DB_MAX_UNITS_OF_WORK)
+
+    engine = await get_engine()
+    slot = _unit_of_work_slots if long_lived else nullcontext()
+    async with slot, engine.connect() as connection:
+        session = AsyncSession(bind=connection, expire_on_commit=False, autoflush=False)
+        current = UnitOfWork(session)
+        token = _current_unit_of_work.set(current)
+        try:
+            yield current
+        finally:
+            current.closed = True
+            _current_unit_of_work.reset(token)
+            async with current.lock:
+                await session.close()
+
+
+@asynccontextmanager
+async def atomic() -> AsyncGenerator[AsyncSession, None]:
+    """Commit all DB writes made inside the block in one transaction."""
+    async with unit_of_work() as current:
+        async with current.atomic() as session:
+            yield session
+
+
+@asynccontextmanager
+async def outside_unit_of_work() -> AsyncGenerator[None, None]:
+    """Run DB operations on their own connection even inside a ``unit_of_work()``.
+
+    For writers shared by many plans, which must not wait on one plan's session.
+    """
+    token = _current_unit_of_work.set(None)
+    try:
+        yield
+    finally:
+        _current_unit_of_work.reset(token)
+
+
+async def commit_session(session: AsyncSession) -> None:
+    """Commit a repository's writes, or defer them to the enclosing ``atomic()`` block."""
+    current = _active_unit_of_work()
+    if current is not None and current.session is session and current.atomic_depth:
+        await session.flush()
+    else:
+        await session.commit()
+
+
 @asynccontextmanager
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """Get a SQLAlchemy session for database operations.
 
+    Inside a ``unit_of_work()`` this is the unit of work's shared session.
+    Outside ``atomic()`` its transaction ends when the block exits, reads
+    included, so no locks or snapshot outlive the operation.
+
     Returns:
         AsyncSession: SQLAlchemy async session
 
@@ -96,6 +268,21 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             users = result.fetchall()
         ```
     """
+    current = _active_unit_of_work()
+    if current is not None:
+        async with current.lock:
+            try:
+                yield current.session
+            except Exception as e:
+                # Inside atomic() the whole block is rolled back by its owner
+                if not current.atomic_depth:
+                    await current.session.rollback()
+                logger.error(f"Database session operation failed: {e}")
+                raise
+            if not current.atomic_depth:
+                await _end_transaction(current.session)
+        return
+
     if _session_factory is None:
         await initialize_db_pool()
 
@@ -107,6 +294,18 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             logger.error(f"Database session operation failed: {e}")
             raise
 
+async def _end_transaction(session: AsyncSession) -> None:
+    """End a shared session's transaction between operations.
+
+    A read-only operation leaves its transaction open; held across a plan's
+    LLM calls it would keep its locks, freeze ``now()`` and serve stale rows
+    from the identity map.
+    """
+    if session.in_transaction():
+        await session.commit()
+    # Later reads load current rows instead of the identity map's copies
+    session.expunge_all()
+
 async def execute_query(query: str, params: Optional[Dict[str, Any]] = None) -> list:
     """Execute a database query and return results.
 
@@ -0,0 +1,205 @@
+"""
+Cluster-wide LLM rate limiting backed by PostgreSQL.
+
+Every replica records its usage in the shared ``rate_limit_windows`` table, one
+row per limiter key and minute. Admission is a single atomic upsert that only
+increments the window if the request still fits the provider's RPM/TPM quota,
+so all replicas draw from one budget instead of pacing themselves independently.
+"""
+
+import asyncio
+import random
+import time
+from typing import Optional
+
+from loguru import logger
+from sqlalchemy import text
+
+from config.rate_limit import TokenBucketRateLimiter
+from services.db_service import commit_session, get_db_session
+
+# Old windows are pruned at most this often per process
+CLEANUP_INTERVAL_SECONDS = 600
+
+_ACQUIRE_SQL = text(
+    """
+    INSERT INTO rate_limit_windows (limiter_key, window_start, requests, tokens)
+    VALUES (:key, date_trunc('minute', now()), 1, :tokens)
+    ON CONFLICT (limiter_key, window_start) DO UPDATE
+    SET requests = rate_limit_windows.requests + 1,
+        tokens = rate_limit_windows.tokens + EXCLUDED.tokens
+    WHERE rate_limit_windows.requests + 1 <= :rpm
+      AND rate_limit_windows.tokens + EXCLUDED.tokens <= :tpm
+    RETURNING EXTRACT(EPOCH FROM (window_start + interval '1 minute' - now()))
+    """
+)
+
+_SECONDS_LEFT_SQL = text(
+    "SELECT EXTRACT(EPOCH FROM (date_trunc('minute', now()) + interval '1 minute' - now()))"
+)
+
+# Usage of the current window, for checking headroom without consuming it
+_WINDOW_USAGE_SQL = text(
+    """
+    SELECT COALESCE(MAX(requests), 0), COALESCE(MAX(tokens), 0),
+           EXTRACT(EPOCH FROM (date_trunc('minute', now()) + interval '1 minute' - now()))
+    FROM rate_limit_windows
+    WHERE limiter_key = :key AND window_start = date_trunc('minute', now())
+    """
+)
+
+_RECORD_USAGE_SQL = text(
+    """
+    INSERT INTO rate_limit_windows (limiter_key, window_start, requests, tokens)
+    VALUES (:key, date_trunc('minute', now()), GREATEST(:requests, 0), GREATEST(:tokens, 0))
+    ON CONFLICT (limiter_key, window_start) DO UPDATE
+    SET requests = GREATEST(rate_limit_windows.requests + :requests, 0),
+        tokens = GREATEST(rate_limit_windows.tokens + :tokens, 0)
+    """
+)
+
+# Mark every window until ``:seconds`` from now as exhausted so no replica is admitted
+_PENALIZE_SQL = text(
+    """
+    INSERT INTO rate_limit_windows (limiter_key, window_start, requests, tokens)
+    SELECT CAST(:key AS VARCHAR), w, CAST(:rpm AS INTEGER), CAST(:tpm AS INTEGER)
+    FROM generate_series(
+        date_trunc('minute', now()),
+        date_trunc('minute', now() + make_interval(secs => CAST(:seconds AS DOUBLE PRECISION))),
+        interval '1 minute'
+    ) AS w
+    ON CONFLICT (limiter_key, window_start) DO UPDATE
+    SET requests = GREATEST(rate_limit_windows.requests, EXCLUDED.requests),
+        tokens = GREATEST(rate_limit_windows.tokens, EXCLUDED.tokens)
+    """
+)
+
+_CLEANUP_SQL = text(
+    "DELETE FROM rate_limit_windows WHERE window_start < now() - interval '1 hour'"
+)
+
+
+class PostgresRateLimiter:
+    """RPM/TPM limiter whose quota windows are shared through PostgreSQL.
+
+    Exposes the same interface as ``TokenBucketRateLimiter``. If the database
+    is unreachable it falls back to pacing this replica locally.
+    """
+
+    def __init__(self, name: str, requests_per_minute: int, tokens_per_minute: int):
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._fallback = TokenBucketRateLimiter(name, requests_per_minute, tokens_per_minute)
+        self._last_cleanup = 0.0
+
+    def _params(self, **params) -> dict:
+        return {
+            "key": self.name,
+            "rpm": self.requests_per_minute,
+            "tpm": self.tokens_per_minute,
+            **params,
+        }
+
+    async def _try_acquire(self, tokens: int) -> Optional[float]:
+        """Try to admit one request. Returns None if admitted, else seconds to wait."""
+        async with get_db_session() as session:
+            result = await session.execute(_ACQUIRE_SQL, self._params(tokens=tokens))
+            admitted = result.first()
+            if admitted is None:
+                seconds_left = (await session.execute(_SECONDS_LEFT_SQL)).scalar_one()
+            await commit_session(session)
+
+        if admitted is not None:
+            return None
+        # Spread replicas out a little so they don't all retry at the boundary
+        return float(seconds_left) + random.uniform(0.05, 1.0)
+
+    async def _cleanup_old_windows(self) -> None:
+        now = time.monotonic()
+        if now - self._last_cleanup < CLEANUP_INTERVAL_SECONDS:
+            return
+        self._last_cleanup = now
+        async with get_db_session() as session:
+            await session.execute(_CLEANUP_SQL)
+            await commit_session(session)
+
+    async def seconds_until_available(self, tokens: int) -> float:
+        """How long a request of ``tokens`` estimated tokens would wait, without admitting it."""
+        tokens = min(max(tokens, 1), self.tokens_per_minute)
+        try:
+            async with get_db_session() as session:
+                requests, used_tokens, seconds_left = (
+                    await session.execute(_WINDOW_USAGE_SQL, {"key": self.name})
+                ).one()
+        except Exception as e:
+            logger.warning(f"Shared rate limiter '{self.name}' unavailable ({e}); checking locally")
+            return await self._fallback.seconds_until_available(tokens)
+        if requests + 1 <= self.requests_per_minute and used_tokens + tokens <= self.tokens_per_minute:
+            return 0.0
+        return float(seconds_left)
+
+    async def acquire(self, tokens: int) -> float:
+        """Wait until one request of ``tokens`` estimated tokens fits the shared budget.
+
+        Args:
+            tokens: Estimated tokens the call will consume
+
+        Returns:
+            float: Seconds spent waiting for capacity
+        """
+        tokens = min(max(tokens, 1), self.tokens_per_minute)
+        waited = 0.0
+
+        try:
+            await self._cleanup_old_windows()
+            while True:
+                wait = await self._try_acquire(tokens)
+                if wait is None:
+                    return waited
+                logger.info(
+                    f"Shared rate limiter '{self.name}' waiting {wait:.1f}s for capacity "
+                    f"({tokens} tokens requested)"
+                )
+                await asyncio.sleep(wait)
+                waited += wait
+        except Exception as e:
+            logger.warning(
+                f"Shared rate limiter '{self.name}' unavailable ({e}); pacing locally"
+            )
+            return waited + await self._fallback.acquire(tokens)
+
+    async def record_usage(self, requests: int = 0, tokens: int = 0) -> None:
+        """Correct the current window once the real usage of a call is known."""
+        if not requests and not tokens:
+            return
+        try:
+            async with get_db_session() as session:
+                await session.execute(
+                    _RECORD_USAGE_SQL, self._params(requests=requests, tokens=tokens)
+                )
+                await commit_session(session)
+        except Exception as e:
+            logger.warning(f"Failed to record usage for '{self.name}': {e}")
+            await self._fallback.record_usage(requests=requests, tokens=tokens)
+
+    async def penalize(self, retry_after: Optional[float] = None) -> None:
+        """Block every replica after the provider rejected a call despite pacing.
+
+        Args:
+            retry_after: The provider's suggested wait in seconds, if known.
+                Without it the current window is marked exhausted.
+        """
+        try:
+            async with get_db_session() as session:
+                await session.execute(
+                    _PENALIZE_SQL, self._params(seconds=float(retry_after or 0))
+                )
+                await commit_session(session)
+            logger.warning(
+                f"Shared rate limiter '{self.name}' penalized "
+                f"({f'{retry_after:.1f}s' if retry_after is not None else 'window exhausted'})"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to penalize shared limiter '{self.name}': {e}")
+            await self._fallback.penalize(retry_after)
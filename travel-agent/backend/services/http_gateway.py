@@ -0,0 +1,273 @@
+"""
+Shared outbound HTTP gateway.
+
+Every outbound call to a third-party provider (Exa, Firecrawl, Google Flights,
+LLM providers) goes through one gateway that provides:
+
+- a keep-alive connection pool per provider, so TLS handshakes are reused
+- per-host concurrency caps, tunable centrally per provider
+- per-provider accounting (requests, errors, status codes, bytes, latency)
+
+Clients that speak HTTP through ``requests`` use ``gateway.request``. Calls
+made by SDKs that own their transport are wrapped in ``gateway.track`` (from
+threads) or ``gateway.atrack`` (from the event loop) so they still count
+against the caps and show up in the stats.
+
+LLM calls are the exception: one agent run makes a model request per tool
+round trip, with tool calls in between, so wrapping the run would time (and
+cap) whole runs. They are paced by the rate limiters in ``config/llm.py``
+instead and accounted afterwards, one entry per model request, with
+``gateway.record``.
+"""
+
+import asyncio
+import os
+import statistics
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, replace
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+
+
+@dataclass(frozen=True)
+class ProviderPolicy:
+    """Connection and concurrency settings for one provider."""
+
+    # Max concurrent calls per host; None disables the cap
+    max_concurrency: Optional[int]
+    # Keep-alive connections kept per host
+    pool_size: int
+    # Default request timeout in seconds
+    timeout: float
+
+
+DEFAULT_POLICY = ProviderPolicy(max_concurrency=4, pool_size=4, timeout=30)
+
+PROVIDER_POLICIES = {
+    "exa": ProviderPolicy(max_concurrency=8, pool_size=8, timeout=30),
+    "firecrawl": ProviderPolicy(max_concurrency=4, pool_size=4, timeout=60),
+    "google_flights": ProviderPolicy(max_concurrency=4, pool_size=4, timeout=30),
+    # LLM traffic is paced by the rate limiters in config/llm.py; one entry
+    # per provider of config.llm.BACKEND_FACTORIES (by config.llm.get_llm_provider)
+    "groq": ProviderPolicy(max_concurrency=None, pool_size=16, timeout=120),
+    "openrouter": ProviderPolicy(max_concurrency=None, pool_size=16, timeout=120),
+    "google": ProviderPolicy(max_concurrency=None, pool_size=16, timeout=120),
+    "openai": ProviderPolicy(max_concurrency=None, pool_size=16, timeout=120),
+    "ollama": ProviderPolicy(max_concurrency=None, pool_size=16, timeout=300),
+}
+
+# Latency samples kept per provider for percentiles
+LATENCY_SAMPLES = 500
+
+
+def get_provider_policy(provider: str) -> ProviderPolicy:
+    """Policy for a provider, with HTTP_GATEWAY_<PROVIDER>_CONCURRENCY overriding the cap."""
+    policy = PROVIDER_POLICIES.get(provider, DEFAULT_POLICY)
+    override = os.getenv(f"HTTP_GATEWAY_{provider.upper()}_CONCURRENCY")
+    if override:
+        policy = replace(policy, max_concurrency=int(override) or None)
+    return policy
+
+
+class _Call:
+    """Details of one outbound call, filled in while it runs."""
+
+    def __init__(self):
+        self.status_code: Optional[int] = None
+        self.bytes_received = 0
+
+
+class ProviderStats:
+    """Counters for one provider."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.bytes_received = 0
+        self.total_seconds = 0.0
+        self.status_codes: Dict[int, int] = defaultdict(int)
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self._started: Deque[float] = deque()
+
+    def begin(self) -> None:
+        self.in_flight += 1
+        self._started.append(time.monotonic())
+
+    def end(self, call: _Call, seconds: float, failed: bool) -> None:
+        self.in_flight -= 1
+        self.requests += 1
+        self.total_seconds += seconds
+        self.bytes_received += call.bytes_received
+        self._latencies.append(seconds)
+        if call.status_code is not None:
+            self.status_codes[call.status_code] += 1
+        if failed or (call.status_code is not None and call.status_code >= 400):
+            self.errors += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        cutoff = time.monotonic() - 60
+        while self._started and self._started[0] < cutoff:
+            self._started.popleft()
+        latencies = sorted(self._latencies)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "requests_last_minute": len(self._started),
+            "bytes_received": self.bytes_received,
+            "status_codes": dict(self.status_codes),
+            "avg_seconds": round(self.total_seconds / self.requests, 3) if self.requests else 0.0,
+            "p50_seconds": round(statistics.median(latencies), 3) if latencies else 0.0,
+            "p95_seconds": (
+                round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3)
+                if latencies
+                else 0.0
+            ),
+        }
+
+
+class HttpGateway:
+    """Pooled, capped and accounted outbound HTTP for all providers."""
+
+    def __init__(self):
+        self._sessions: Dict[str, requests.Session] = {}
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._async_slots: Dict[str, asyncio.Semaphore] = {}
+        self._stats: Dict[str, ProviderStats] = defaultdict(ProviderStats)
+        self._lock = threading.Lock()
+
+    def session(self, provider: str) -> requests.Session:
+        """Long-lived keep-alive session for a provider."""
+        with self._lock:
+            session = self._sessions.get(provider)
+            if session is None:
+                policy = get_provider_policy(provider)
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=policy.pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[provider] = session
+            return session
+
+    def _host_slot(self, provider: str, host: str) -> Optional[threading.BoundedSemaphore]:
+        policy = get_provider_policy(provider)
+        if policy.max_concurrency is None:
+            return None
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(policy.max_concurrency)
+                self._host_slots[host] = slot
+            return slot
+
+    def _async_slot(self, provider: str, host: str) -> Optional[asyncio.Semaphore]:
+        policy = get_provider_policy(provider)
+        if policy.max_concurrency is None:
+            return None
+        slot = self._async_slots.get(host)
+        if slot is None:
+            slot = asyncio.Semaphore(policy.max_concurrency)
+            self._async_slots[host] = slot
+        return slot
+
+    def _begin(self, provider: str) -> None:
+        with self._lock:
+            self._stats[provider].begin()
+
+    def _end(self, provider: str, call: _Call, started: float, failed: bool) -> None:
+        seconds = time.perf_counter() - started
+        with self._lock:
+            self._stats[provider].end(call, seconds, failed)
+        logger.debug(
+            f"Outbound {provider} call finished in {seconds:.2f}s (status {call.status_code})"
+        )
+
+    @contextmanager
+    def track(self, provider: str, host: Optional[str] = None) -> Iterator[_Call]:
+        """Count a blocking outbound call against the host's cap and the provider's stats."""
+        slot = self._host_slot(provider, host or provider)
+        if slot is not None:
+            slot.acquire()
+        call = _Call()
+        self._begin(provider)
+        started = time.perf_counter()
+        failed = False
+        try:
+            yield call
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._end(provider, call, started, failed)
+            if slot is not None:
+                slot.release()
+
+    @asynccontextmanager
+    async def atrack(self, provider: str, host: Optional[str] = None) -> AsyncIterator[_Call]:
+        """Async variant of ``track`` for calls made from the event loop."""
+        slot = self._async_slot(provider, host or provider)
+        if slot is not None:
+            await slot.acquire()
+        call = _Call()
+        self._begin(provider)
+        started = time.perf_counter()
+        failed = False
+        try:
+            yield call
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._end(provider, call, started, failed)
+            if slot is not None:
+                slot.release()
+
+    def record(
+        self,
+        provider: str,
+        seconds: float,
+        failed: bool = False,
+        status_code: Optional[int] = None,
+    ) -> None:
+        """Account a call that was made and timed outside the gateway."""
+        call = _Call()
+        call.status_code = status_code
+        with self._lock:
+            stats = self._stats[provider]
+            stats.begin()
+            stats.end(call, seconds, failed)
+
+    def request(self, provider: str, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request through the provider's pooled session.
+
+        Args:
+            provider: Provider name used for pooling, caps and accounting
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed to ``requests.Session.request``
+
+        Returns:
+            requests.Response: The response
+        """
+        kwargs.setdefault("timeout", get_provider_policy(provider).timeout)
+        with self.track(provider, urlparse(url).netloc) as call:
+            response = self.session(provider).request(method, url, **kwargs)
+            call.status_code = response.status_code
+            call.bytes_received = len(response.content)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Accounting per provider."""
+        with self._lock:
+            return {provider: stats.snapshot() for provider, stats in self._stats.items()}
+
+
+gateway = HttpGateway()
@@ -0,0 +1,202 @@
+"""
+Routing of agent calls across several LLM backends.
+
+The agents are configured with ``config.llm.model``. With fallback backends
+configured (``LLM_FALLBACK_BACKENDS``) each call is sent to whichever backend
+is expected to answer first, judging by:
+
+- how long its rate limiter would make the call wait (remaining quota),
+- whether the provider throttled it recently (its ``retry after``),
+- its rolling latency and error rate over the last ``ROUTER_WINDOW`` calls.
+
+After ``ROUTER_FAILURE_THRESHOLD`` consecutive failures a backend is taken out
+of rotation for ``ROUTER_COOLDOWN_SECONDS``, then tried again. Without
+fallback backends every call goes to ``model`` as before.
+"""
+
+import os
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from config.llm import get_fallback_models, get_model_limits, get_rate_limiter, model
+
+# Calls per backend the rolling latency and error rate are computed over
+ROUTER_WINDOW = int(os.getenv("ROUTER_WINDOW", "20"))
+# Consecutive failures that take a backend out of rotation
+ROUTER_FAILURE_THRESHOLD = int(os.getenv("ROUTER_FAILURE_THRESHOLD", "3"))
+ROUTER_COOLDOWN_SECONDS = float(os.getenv("ROUTER_COOLDOWN_SECONDS", "60"))
+# Throttle assumed when the provider doesn't say how long to back off
+ROUTER_DEFAULT_THROTTLE_SECONDS = 20.0
+# Expected latency of a backend without measurements; low, so new backends get tried
+ROUTER_UNMEASURED_LATENCY_SECONDS = 1.0
+
+
+@dataclass
+class BackendHealth:
+    """Rolling health of one backend."""
+
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=ROUTER_WINDOW))
+    outcomes: Deque[bool] = field(default_factory=lambda: deque(maxlen=ROUTER_WINDOW))
+    consecutive_failures: int = 0
+    throttled_until: float = 0.0
+    unhealthy_until: float = 0.0
+
+    @property
+    def latency(self) -> Optional[float]:
+        return statistics.median(self.latencies) if self.latencies else None
+
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+
+@dataclass(eq=False)
+class ModelBackend:
+    """One model the router can send agent calls to."""
+
+    name: str
+    model: Any
+    health: BackendHealth = field(default_factory=BackendHealth)
+
+    def blocked_for(self, now: float) -> float:
+        """Seconds until the backend may be called again after throttling or failures."""
+        return max(self.health.throttled_until - now, self.health.unhealthy_until - now, 0.0)
+
+
+class ModelRouter:
+    """Picks the backend for each agent call and tracks backend health."""
+
+    def __init__(self, backends: Sequence[Tuple[str, Any]]):
+        self.backends: List[ModelBackend] = [ModelBackend(name, llm) for name, llm in backends]
+        # Agents rebound to another backend's model, reused across calls
+        self._bound_agents: Dict[Tuple[int, str], Tuple[Any, Any]] = {}
+        # Health of models outside the rotation (agents configured with other models)
+        self._unrouted: Dict[int, ModelBackend] = {}
+
+    def routes(self, llm: Any) -> bool:
+        """Whether calls configured with this model are routed."""
+        return len(self.backends) > 1 and any(backend.model is llm for backend in self.backends)
+
+    async def choose(
+        self, llm: Any, estimated_tokens: int, exclude: Sequence[ModelBackend] = ()
+    ) -> ModelBackend:
+        """The backend expected to complete a call soonest.
+
+        Args:
+            llm: The model the agent is configured with
+            estimated_tokens: Estimated tokens of the call
+            exclude: Backends that already failed this call
+
+        Returns:
+            ModelBackend: The chosen backend; calls with unrouted models get
+                a backend for their own model
+        """
+        if not self.routes(llm):
+            return self._backend_for(llm)
+
+        now = time.monotonic()
+        best, best_score = None, None
+        for backend in self.backends:
+            if backend in exclude:
+                continue
+            _, _, context_window, _ = get_model_limits(backend.model)
+            if estimated_tokens > context_window:
+                continue
+            wait = max(
+                backend.blocked_for(now),
+                await get_rate_limiter(backend.model).seconds_until_available(estimated_tokens),
+            )
+            health = backend.health
+            latency = health.latency if health.latency is not None else ROUTER_UNMEASURED_LATENCY_SECONDS
+            score = wait + latency * (1 + 2 * health.error_rate)
+            if best_score is None or score < best_score:
+                best, best_score = backend, score
+
+        if best is None:
+            # Every backend failed this call already; start over with the configured one
+            return self._backend_for(llm)
+        if best.model is not llm:
+            logger.info(f"Routing call to LLM backend '{best.name}' (expected {best_score:.1f}s)")
+        return best
+
+    def has_alternative(self, backend: ModelBackend, exclude: Sequence[ModelBackend] = ()) -> bool:
+        """Whether another backend is available right now, so a throttled call can move on."""
+        now = time.monotonic()
+        return any(
+            other is not backend and other not in exclude and other.blocked_for(now) <= 0
+            for other in self.backends
+        )
+
+    def bind(self, agent: Any, backend: ModelBackend) -> Any:
+        """The agent, running on the backend's model."""
+        if agent.model is backend.model:
+            return agent
+        key = (id(agent), backend.name)
+        bound = self._bound_agents.get(key)
+        # Holding the original agent keeps its id from being reused
+        if bound is None or bound[0] is not agent:
+            bound = (agent, agent.deep_copy(update={"model": backend.model}))
+            self._bound_agents[key] = bound
+        return bound[1]
+
+    def record_success(self, backend: ModelBackend, latency: float) -> None:
+        """Record a successful call; ``latency`` is one model request's, without tool time."""
+        health = backend.health
+        health.latencies.append(latency)
+        health.outcomes.append(True)
+        health.consecutive_failures = 0
+
+    def record_failure(
+        self, backend: ModelBackend, throttled: bool = False, retry_after: Optional[float] = None
+    ) -> None:
+        """Record a failed call; throttled calls block the backend for the provider's backoff."""
+        health = backend.health
+        health.outcomes.append(False)
+        now = time.monotonic()
+        if throttled:
+            health.throttled_until = max(
+                health.throttled_until,
+                now + (retry_after if retry_after is not None else ROUTER_DEFAULT_THROTTLE_SECONDS),
+            )
+            return
+        health.consecutive_failures += 1
+        if health.consecutive_failures >= ROUTER_FAILURE_THRESHOLD:
+            health.unhealthy_until = now + ROUTER_COOLDOWN_SECONDS
+            health.consecutive_failures = 0
+            logger.warning(
+                f"LLM backend '{backend.name}' failing; out of rotation for {ROUTER_COOLDOWN_SECONDS:.0f}s"
+            )
+
+    def _backend_for(self, llm: Any) -> ModelBackend:
+        for backend in self.backends:
+            if backend.model is llm:
+                return backend
+        backend = self._unrouted.get(id(llm))
+        if backend is None or backend.model is not llm:
+            backend = ModelBackend(getattr(llm, "id", None) or "model", llm)
+            self._unrouted[id(llm)] = backend
+        return backend
+
+    def stats(self) -> Dict[str, Any]:
+        """Rolling health of every backend in the rotation."""
+        now = time.monotonic()
+        return {
+            backend.name: {
+                "model": getattr(backend.model, "id", None),
+                "latency_seconds": round(backend.health.latency, 2)
+                if backend.health.latency is not None
+                else None,
+                "error_rate": round(backend.health.error_rate, 3),
+                "calls": len(backend.health.outcomes),
+                "blocked_seconds": round(backend.blocked_for(now), 1),
+            }
+            for backend in self.backends
+        }
+
+
+model_router = ModelRouter([("primary", model), *get_fallback_models()])
@@ -0,0 +1,71 @@
+"""
+In-flight coalescing of identical plan requests.
+
+Requests with the same canonical fingerprint (see
+``plan_service.travel_request_fingerprint``) share one running pipeline. The
+first request starts it; later ones join its ``PlanRun`` so status updates and
+the final output fan out to every waiting trip plan.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from models.travel_plan import TravelPlanAgentRequest
+from services.plan_service import PlanRun, generate_travel_plan
+
+# fingerprint -> (run, pipeline task)
+_inflight: Dict[str, Tuple[PlanRun, asyncio.Task]] = {}
+
+
+def has_inflight_plan(fingerprint: str) -> bool:
+    """Whether a pipeline for this fingerprint is running in this process."""
+    return fingerprint in _inflight
+
+
+async def generate_travel_plan_coalesced(
+    request: TravelPlanAgentRequest, fingerprint: str, task_id: Optional[int] = None
+) -> Dict[str, Any]:
+    """Generate a travel plan, sharing the pipeline with identical in-flight requests.
+
+    Registration happens before the first ``await``, so of several requests
+    submitted in the same tick exactly one starts the pipeline.
+
+    Args:
+        request: The travel plan request
+        fingerprint: Canonical fingerprint of ``request.travel_plan``
+        task_id: The plan task behind the request; it is marked successful
+            together with the saved output
+
+    Returns:
+        Dict[str, Any]: The final plan document
+    """
+    trip_plan_id = request.trip_plan_id
+    entry = _inflight.get(fingerprint)
+
+    if entry is None:
+        run = PlanRun(trip_plan_id, task_id)
+        pipeline = asyncio.create_task(
+            generate_travel_plan(request, run), name=f"plan-pipeline:{trip_plan_id}"
+        )
+        _inflight[fingerprint] = (run, pipeline)
+        pipeline.add_done_callback(lambda _: _inflight.pop(fingerprint, None))
+    else:
+        run, pipeline = entry
+        await run.join(trip_plan_id, task_id)
+
+    try:
+        # Shielded so one waiter going away doesn't cancel the others' pipeline
+        result = await asyncio.shield(pipeline)
+    except asyncio.CancelledError:
+        run.leave(trip_plan_id)
+        if not run.trip_plan_ids and not pipeline.done():
+            logger.info(f"No trip plans left waiting on pipeline {fingerprint[:12]}; cancelling")
+            pipeline.cancel()
+        raise
+
+    if trip_plan_id not in run.saved_trip_plan_ids:
+        # Joined after the run saved its result, but before it finished
+        await run.save_result(result, [trip_plan_id])
+    return result
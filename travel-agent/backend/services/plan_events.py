@@ -0,0 +1,329 @@
+"""
+Live progress events for trip plans.
+
+The plan pipeline publishes an event whenever a plan changes status or one of
+its stages produces output. Subscribers (the SSE endpoint in ``router/plan.py``)
+receive them through a bounded in-process queue per connection; a slow client
+only ever loses its own oldest events (or, for streamed tokens, the newest
+ones) and never holds up the pipeline.
+
+Plans run by ``worker.py`` execute in another process. With
+``PLAN_EVENTS_BACKEND=postgres`` events are also sent with ``pg_notify`` and
+every API process forwards them to its local subscribers. NOTIFY payloads are
+limited in size, so large stage outputs are left out of the notification and
+loaded from the stage checkpoint by the receiving process.
+"""
+
+import asyncio
+import json
+import os
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+from sqlalchemy import text
+
+from repository.plan_stage_repository import get_stage_outputs
+from repository.plan_task_repository import (
+    get_active_tasks_by_fingerprint,
+    get_tasks_by_trip_plan,
+)
+from repository.trip_plan_repository import get_trip_plan_output, get_trip_plan_status
+from services.db_service import commit_session, get_db_session, get_engine
+
+PLAN_EVENTS_BACKEND = os.getenv("PLAN_EVENTS_BACKEND", "local")
+PLAN_EVENTS_CHANNEL = "plan_events"
+SUBSCRIBER_QUEUE_SIZE = int(os.getenv("PLAN_EVENTS_QUEUE_SIZE", "100"))
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_NOTIFY_BYTES = 7500
+RECONNECT_SECONDS = 5
+
+# Identifies events published by this process, so the bridge doesn't replay them
+_ORIGIN = uuid.uuid4().hex
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+class PlanEventBroker:
+    """Fans plan events out to the subscribers of each trip plan."""
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+
+    def subscribe(self, trip_plan_id: str) -> asyncio.Queue:
+        """Start receiving events for a trip plan."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[trip_plan_id].add(queue)
+        return queue
+
+    def unsubscribe(self, trip_plan_id: str, queue: asyncio.Queue) -> None:
+        """Stop receiving events for a trip plan."""
+        subscribers = self._subscribers.get(trip_plan_id)
+        if subscribers is None:
+            return
+        subscribers.discard(queue)
+        if not subscribers:
+            del self._subscribers[trip_plan_id]
+
+    def publish_local(self, event: Dict[str, Any]) -> None:
+        """Deliver an event to this process's subscribers without blocking."""
+        for queue in list(self._subscribers.get(event["trip_plan_id"], ())):
+            if queue.full():
+                if event["type"] == "token":
+                    # Token events are only a preview of the stage output that
+                    # follows, so a slow client simply misses some of them
+                    continue
+                # Slow client: drop its oldest event rather than buffer without bound
+                queue.get_nowait()
+                logger.warning(f"Dropped plan event for slow subscriber of {event['trip_plan_id']}")
+            queue.put_nowait(event)
+
+    async def publish(self, event: Dict[str, Any]) -> None:
+        """Deliver an event locally and, if enabled, to other processes."""
+        self.publish_local(event)
+        if PLAN_EVENTS_BACKEND != "postgres":
+            return
+
+        payload = json.dumps({**event, "origin": _ORIGIN}, default=str)
+        if len(payload.encode("utf-8")) > MAX_NOTIFY_BYTES:
+            payload = json.dumps(
+                {**event, "output": None, "output_omitted": True, "origin": _ORIGIN},
+                default=str,
+            )
+        try:
+            async with get_db_session() as session:
+                await session.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {"channel": PLAN_EVENTS_CHANNEL, "payload": payload},
+                )
+                await commit_session(session)
+        except Exception as e:
+            # Progress events are best effort; the plan itself is unaffected
+            logger.warning(f"Failed to notify plan event for {event['trip_plan_id']}: {e}")
+
+
+plan_event_broker = PlanEventBroker()
+
+
+async def publish_status(
+    trip_plan_id: str,
+    status: str,
+    current_step: Optional[str] = None,
+    error: Optional[str] = None,
+) -> None:
+    """Publish a status change of a trip plan."""
+    await plan_event_broker.publish(
+        {
+            "type": "status",
+            "trip_plan_id": trip_plan_id,
+            "status": status,
+            "current_step": current_step,
+            "error": error,
+        }
+    )
+
+
+async def publish_stage_output(
+    trip_plan_id: str,
+    stage: str,
+    output: str,
+    input_hash: str,
+    checkpoint_trip_plan_id: Optional[str] = None,
+) -> None:
+    """Publish the output of a finished pipeline stage.
+
+    Args:
+        trip_plan_id: The trip plan the event is for
+        stage: Name of the stage
+        output: The stage's output
+        input_hash: Fingerprint the stage checkpoint was saved under
+        checkpoint_trip_plan_id: Trip plan the checkpoint was saved under, if
+            different (trip plans that joined another plan's run)
+    """
+    await plan_event_broker.publish(
+        {
+            "type": "stage",
+            "trip_plan_id": trip_plan_id,
+            "stage": stage,
+            "output": output,
+            "input_hash": input_hash,
+            "checkpoint_trip_plan_id": checkpoint_trip_plan_id or trip_plan_id,
+        }
+    )
+
+
+async def load_plan_snapshot(trip_plan_id: str) -> List[Dict[str, Any]]:
+    """Events describing a trip plan's progress so far, for a new subscriber."""
+    status_entry = await get_trip_plan_status(trip_plan_id)
+    if status_entry is None:
+        return []
+
+    events = [
+        {
+            "type": "status",
+            "trip_plan_id": trip_plan_id,
+            "status": status_entry.status,
+            "current_step": status_entry.currentStep,
+            "error": status_entry.error,
+        }
+    ]
+    if status_entry.status != "processing":
+        return events
+
+    # Stage checkpoints are saved under the request fingerprint of the plan's task
+    tasks = await get_tasks_by_trip_plan(trip_plan_id)
+    latest_task = max(tasks, key=lambda task: task.created_at) if tasks else None
+    if latest_task is not None and latest_task.fingerprint:
+        fingerprint = latest_task.fingerprint
+        checkpoint_trip_plan_id, outputs = await _load_run_checkpoints(trip_plan_id, fingerprint)
+        for stage, output in outputs.items():
+            events.append(
+                {
+                    "type": "stage",
+                    "trip_plan_id": trip_plan_id,
+                    "stage": stage,
+                    "output": output,
+                    "input_hash": fingerprint,
+                    "checkpoint_trip_plan_id": checkpoint_trip_plan_id,
+                }
+            )
+    return events
+
+
+async def _load_run_checkpoints(trip_plan_id: str, fingerprint: str) -> Tuple[str, Dict[str, str]]:
+    """Stage checkpoints of the run serving a trip plan, and the trip plan they're saved under.
+
+    A trip plan that joined a coalesced run has none of its own; the run saves
+    them under the trip plan that started it, which has an in-progress task
+    with the same fingerprint.
+    """
+    outputs = await get_stage_outputs(trip_plan_id, fingerprint)
+    if outputs:
+        return trip_plan_id, outputs
+    for task in await get_active_tasks_by_fingerprint(fingerprint):
+        if task.trip_plan_id == trip_plan_id:
+            continue
+        outputs = await get_stage_outputs(task.trip_plan_id, fingerprint)
+        if outputs:
+            return task.trip_plan_id, outputs
+    return trip_plan_id, {}
+
+
+async def load_plan_result(trip_plan_id: str) -> Optional[Dict[str, Any]]:
+    """The final plan as an event, once the plan is completed."""
+    output = await get_trip_plan_output(trip_plan_id)
+    if output is None:
+        return None
+    return {"type": "result", "trip_plan_id": trip_plan_id, "itinerary": output.itinerary}
+
+
+async def publish_tokens(
+    trip_plan_id: str, stage: str, delta: str, offset: int, attempt: int
+) -> None:
+    """Publish a batch of tokens streamed by a stage's agent.
+
+    Args:
+        trip_plan_id: The trip plan the event is for
+        stage: Name of the streaming stage
+        delta: Text generated since the previous token event
+        offset: Position of ``delta`` in the attempt's output, so clients can
+            tell when they missed events
+        attempt: Agent attempt the tokens belong to; a new attempt restarts
+            the output from offset 0
+    """
+    await plan_event_broker.publish(
+        {
+            "type": "token",
+            "trip_plan_id": trip_plan_id,
+            "stage": stage,
+            "delta": delta,
+            "offset": offset,
+            "attempt": attempt,
+        }
+    )
+
+
+class PostgresEventBridge:
+    """Forwards plan events NOTIFY'd by other processes to local subscribers."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._forwarding: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="plan-event-bridge")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Plan event bridge disconnected ({e}); reconnecting")
+            await asyncio.sleep(RECONNECT_SECONDS)
+
+    async def _listen(self) -> None:
+        engine = await get_engine()
+        async with engine.connect() as connection:
+            raw_connection = await connection.get_raw_connection()
+            # The underlying asyncpg connection supports LISTEN callbacks
+            driver_connection = raw_connection.driver_connection
+            await driver_connection.add_listener(PLAN_EVENTS_CHANNEL, self._on_notify)
+            logger.info("Plan event bridge listening for events from other processes")
+            try:
+                while not driver_connection.is_closed():
+                    await asyncio.sleep(RECONNECT_SECONDS)
+            finally:
+                if not driver_connection.is_closed():
+                    await driver_connection.remove_listener(
+                        PLAN_EVENTS_CHANNEL, self._on_notify
+                    )
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed plan event: {payload[:200]}")
+            return
+        if event.pop("origin", None) == _ORIGIN:
+            return
+        if event.pop("output_omitted", False):
+            task = asyncio.create_task(self._forward_with_output(event))
+            self._forwarding.add(task)
+            task.add_done_callback(self._forwarding.discard)
+        else:
+            plan_event_broker.publish_local(event)
+
+    async def _forward_with_output(self, event: Dict[str, Any]) -> None:
+        try:
+            outputs = await get_stage_outputs(
+                event["checkpoint_trip_plan_id"], event["input_hash"]
+            )
+            event["output"] = outputs.get(event["stage"])
+        except Exception as e:
+            logger.warning(f"Could not load output of stage '{event['stage']}': {e}")
+        plan_event_broker.publish_local(event)
+
+
+_bridge = PostgresEventBridge()
+
+
+def start_plan_event_bridge() -> None:
+    """Start forwarding events from worker processes, if enabled."""
+    if PLAN_EVENTS_BACKEND == "postgres":
+        _bridge.start()
+
+
+async def stop_plan_event_bridge() -> None:
+    """Stop forwarding events from worker processes."""
+    await _bridge.stop()
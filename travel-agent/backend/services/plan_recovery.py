@@ -0,0 +1,68 @@
+"""
+Recovery of plans orphaned by a crashed or restarted process.
+
+A plan is orphaned when its ``trip_plan_status`` row is still ``processing``
+but nothing has touched it for a while (running plans are kept fresh by the
+worker heartbeat). Orphaned plans with a queued task input are requeued, so a
+worker picks them up and resumes from the stage checkpoints that already exist.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+from loguru import logger
+
+from models.plan_task import TaskStatus
+from repository.plan_task_repository import get_tasks_by_trip_plan, requeue_task
+from repository.trip_plan_repository import get_stale_trip_plans, update_trip_plan_status
+
+# How long a processing plan may go without an update before it is considered orphaned
+STALE_AFTER_SECONDS = int(os.getenv("PLAN_RECOVERY_STALE_SECONDS", "180"))
+
+
+async def recover_orphaned_plans(stale_after_seconds: int = STALE_AFTER_SECONDS) -> int:
+    """Requeue plans stuck in processing whose worker is gone.
+
+    Args:
+        stale_after_seconds: Minimum age of the last status update
+
+    Returns:
+        int: Number of plans requeued
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=stale_after_seconds)
+    stuck_plans = await get_stale_trip_plans("processing", updated_before=cutoff)
+    if not stuck_plans:
+        logger.info("No orphaned trip plans found")
+        return 0
+
+    logger.warning(f"Found {len(stuck_plans)} orphaned trip plans stuck in processing")
+    requeued = 0
+
+    for status_entry in stuck_plans:
+        trip_plan_id = status_entry.tripPlanId
+        tasks = await get_tasks_by_trip_plan(trip_plan_id)
+        latest_task = max(tasks, key=lambda task: task.created_at) if tasks else None
+
+        if latest_task is None or latest_task.status in (TaskStatus.success, TaskStatus.error):
+            # Nothing left to resume from; let the user retry from the client
+            logger.warning(f"Orphaned trip plan {trip_plan_id} has no resumable task; marking failed")
+            await update_trip_plan_status(
+                trip_plan_id=trip_plan_id,
+                status="failed",
+                error="Previous generation was interrupted. Please retry.",
+                completed_at=datetime.now(timezone.utc),
+            )
+            continue
+
+        if latest_task.status == TaskStatus.in_progress:
+            await requeue_task(latest_task.id)
+
+        await update_trip_plan_status(
+            trip_plan_id=trip_plan_id,
+            status="pending",
+            current_step="Resuming interrupted trip plan",
+        )
+        logger.info(f"Requeued orphaned trip plan {trip_plan_id} (task {latest_task.id})")
+        requeued += 1
+
+    return requeued
@@ -1,31 +1,68 @@
 from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from models.trip_db import TripPlanStatus, TripPlanOutput
 from models.travel_plan import (
     TravelPlanAgentRequest,
     TravelPlanRequest,
-    TravelPlanTeamResponse,
 )
 from loguru import logger
 from agents.team import trip_planning_team
 import json
+import statistics
 import time
 import asyncio
-from agents.structured_output import convert_to_model
+import hashlib
+import inspect
+import os
+from agno.models.message import Message
+from agno.run.response import RunResponse
+from agents.structured_output import extract_structured_plan
+from services.stage_scheduler import Stage, run_stage_graph
+from config.llm import get_llm_provider, get_rate_limiter, model_request_times
+from config.rate_limit import estimate_tokens, parse_retry_after
+from config.tokenizer import count_tokens
 from repository.trip_plan_repository import (
     create_trip_plan_status,
-    update_trip_plan_status,
     get_trip_plan_status,
-    create_trip_plan_output,
-    delete_trip_plan_outputs,
+    update_trip_plan_status,
+    upsert_trip_plan_output,
 )
+from repository.plan_task_repository import update_task_status
+from models.plan_task import TaskStatus
+from services.db_service import atomic, unit_of_work
 from agents.destination import destination_agent
 from agents.itinerary import itinerary_agent
 from agents.flight import flight_search_agent
 from agents.hotel import hotel_search_agent
 from agents.food import dining_agent
 from agents.budget import budget_agent
+from agents.context_summarizer import context_summarizer_agent
+from services.agent_cache import CachePolicy, agent_result_cache
+from services.context_allocator import (
+    CONTEXT_TPM_SHARE,
+    ContextAllocator,
+    ContextBudgetError,
+    ContextSection,
+)
+from services.context_digest import (
+    context_digest_stats,
+    digest_destination,
+    digest_flights,
+    digest_hotels,
+    digest_output,
+    digest_restaurants,
+)
+from services.http_gateway import gateway
+from services.model_router import model_router
+from services.plan_events import publish_stage_output, publish_status, publish_tokens
+from services.status_writer import status_writer
+from repository.plan_stage_repository import (
+    save_stage_output,
+    get_stage_outputs,
+    delete_stage_outputs,
+)
 
 def travel_request_to_markdown(data: TravelPlanRequest) -> str:
     # Map of travel vibes to their descriptions
@@ -128,34 +165,170 @@ def travel_request_to_markdown(data: TravelPlanRequest) -> str:
     return "\n".join(lines)
 
 
-async def safe_agent_run(agent, prompt, max_retries=5):
-    """Run an agent with exponential backoff for rate limits and robust error handling."""
+# Allowance for the agent's reply when estimating the tokens a run will use
+RESPONSE_TOKEN_ALLOWANCE = 1500
+
+
+def estimate_agent_run_tokens(agent, prompt: str) -> int:
+    """Estimate the tokens an agent run will consume, including its system prompt."""
+    instructions = agent.instructions or []
+    if isinstance(instructions, str):
+        instructions = [instructions]
+    system_prompt = "\n".join(
+        [str(agent.description or ""), *map(str, instructions), str(agent.expected_output or "")]
+    )
+    return estimate_tokens(prompt) + estimate_tokens(system_prompt) + RESPONSE_TOKEN_ALLOWANCE
+
+
+async def record_agent_run_usage(limiter, response, estimated_tokens: int) -> None:
+    """Reconcile the limiter with the real token usage reported for a run.
+
+    A single agent run can make several model calls (one per tool round trip),
+    each of which counts against the provider's RPM and TPM quota.
+    """
+    metrics = getattr(response, "metrics", None) or {}
+    total_tokens = metrics.get("total_tokens") if isinstance(metrics, dict) else None
+    if isinstance(total_tokens, list):
+        await limiter.record_usage(
+            requests=max(len(total_tokens) - 1, 0),
+            tokens=sum(total_tokens) - estimated_tokens,
+        )
+    elif isinstance(total_tokens, (int, float)):
+        await limiter.record_usage(tokens=int(total_tokens) - estimated_tokens)
+
+
+# Streamed tokens are batched into one event per this interval
+TOKEN_FLUSH_SECONDS = float(os.getenv("PLAN_TOKEN_FLUSH_SECONDS", "0.25"))
+
+
+class TokenRelay:
+    """Batches tokens streamed by a stage's agent into events for a run's subscribers."""
+
+    def __init__(self, run: "PlanRun", stage: str, flush_seconds: float = TOKEN_FLUSH_SECONDS):
+        self.run = run
+        self.stage = stage
+        self.flush_seconds = flush_seconds
+        self.attempt = 0
+        self._buffer: List[str] = []
+        self._offset = 0
+        self._last_flush = time.monotonic()
+
+    def start_attempt(self) -> None:
+        """Start a new agent attempt; its output replaces the previous attempt's."""
+        self.attempt += 1
+        self._buffer = []
+        self._offset = 0
+        self._last_flush = time.monotonic()
+
+    async def feed(self, delta: str) -> None:
+        self._buffer.append(delta)
+        if time.monotonic() - self._last_flush >= self.flush_seconds:
+            await self.flush()
+
+    async def flush(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        delta = "".join(self._buffer)
+        self._buffer = []
+        await self.run.publish_tokens(self.stage, delta, self._offset, self.attempt)
+        self._offset += len(delta)
+
+
+async def stream_agent_run(agent, prompt: str, relay: TokenRelay) -> RunResponse:
+    """Run an agent in streaming mode, relaying its content as it is generated.
+
+    Returns:
+        RunResponse: The agent's final response
+    """
+    stream = agent.arun(prompt, stream=True)
+    if inspect.isawaitable(stream):
+        stream = await stream
+
+    run_id = None
+    parts: List[str] = []
+    async for chunk in stream:
+        run_id = getattr(chunk, "run_id", None) or run_id
+        if getattr(chunk, "event", "RunResponse") not in ("RunResponse", "RunResponseContent"):
+            continue
+        content = getattr(chunk, "content", None)
+        if isinstance(content, str) and content:
+            parts.append(content)
+            await relay.feed(content)
+    await relay.flush()
+
+    # The agent keeps the full response (with messages and metrics) of its
+    # latest run; use it only if no concurrent run has replaced it since
+    final = getattr(agent, "run_response", None)
+    if final is not None and run_id is not None and final.run_id == run_id and final.messages:
+        return final
+    content = "".join(parts)
+    return RunResponse(
+        content=content,
+        run_id=run_id,
+        messages=[Message(role="assistant", content=content)],
+    )
+
+
+async def safe_agent_run(agent, prompt, max_retries=5, token_relay: Optional[TokenRelay] = None):
+    """Run an agent with exponential backoff for rate limits and robust error handling.
+
+    Each attempt goes to the backend chosen by the model router; with fallback
+    backends configured, throttled or failing calls move to another backend
+    instead of waiting. With a ``token_relay`` the agent runs in streaming mode and its output is
+    relayed to subscribers while it is generated.
+    """
     # --- NEW CODE START (ERROR REFLECTION & TPM SLICING) ---
     current_prompt = prompt
     last_error_context = ""
     retry_delay = 30
-    
-    # Helper to clean and truncate strings to roughly 3500 tokens (4 chars per token)
-    def truncate_for_tpm(text, limit=14000): 
-        if len(text) > limit:
-            logger.warning(f"Truncating massive input ({len(text)} chars) to fit TPM limits.")
-            return text[:limit] + "\n[... Content truncated to stay under TPM limit ...]"
-        return text
+    # Backends that failed this call with a server error; tried again only as a last resort
+    failed_backends = []
+
+    def truncate_for_tpm(text, llm):
+        # Retries after a "request too large" error get half the usual prompt budget
+        retry_allocator = ContextAllocator(llm, tpm_share=CONTEXT_TPM_SHARE / 2)
+        truncated = retry_allocator.truncate(text, estimate_agent_run_tokens(agent, ""))
+        if truncated is not text:
+            logger.warning(f"Truncating massive input ({estimate_tokens(text)} tokens) to fit TPM limits.")
+        return truncated
 
     for attempt in range(max_retries):
+        # Send the call to the backend expected to answer first
+        backend = await model_router.choose(
+            agent.model, estimate_agent_run_tokens(agent, current_prompt), failed_backends
+        )
+        run_agent = model_router.bind(agent, backend)
+        limiter = get_rate_limiter(backend.model)
+        started = None
         try:
             # If we previously hit a TPM/Size error, we MUST truncate the prompt
             if "tokens" in last_error_context.lower() or "too large" in last_error_context.lower():
                 # Forcefully slice the prompt or last tool output if possible
-                current_prompt = truncate_for_tpm(current_prompt)
+                current_prompt = truncate_for_tpm(current_prompt, backend.model)
 
             # Append error context if this is a retry
             if last_error_context:
-                reflection_prompt = f"{current_prompt}\n\nATTENTION: Your previous attempt failed with the following error. PLEASE FIX YOUR TOOL CALL FORMATTING OR BE MORE CONCISE:\n{last_error_context}"
-                response = await agent.arun(reflection_prompt)
+                run_prompt = f"{current_prompt}\n\nATTENTION: Your previous attempt failed with the following error. PLEASE FIX YOUR TOOL CALL FORMATTING OR BE MORE CONCISE:\n{last_error_context}"
             else:
-                response = await agent.arun(current_prompt)
-            
+                run_prompt = current_prompt
+
+            # Wait for RPM/TPM headroom instead of sleeping a fixed time
+            estimated_tokens = estimate_agent_run_tokens(agent, run_prompt)
+            await limiter.acquire(estimated_tokens)
+            started = time.monotonic()
+            if token_relay is None:
+                response = await run_agent.arun(run_prompt)
+            else:
+                token_relay.start_attempt()
+                response = await stream_agent_run(run_agent, run_prompt, token_relay)
+            await record_agent_run_usage(limiter, response, estimated_tokens)
+            # Account and judge the backend by its model requests, not the tool calls between them
+            request_times = model_request_times(response) or [time.monotonic() - started]
+            for seconds in request_times:
+                gateway.record(get_llm_provider(backend.model), seconds)
+            model_router.record_success(backend, statistics.median(request_times))
+
             if response is None:
                 raise ValueError("Agent returned None response")
             if not response.messages or len(response.messages) == 0:
@@ -164,10 +337,16 @@ async def safe_agent_run(agent, prompt, max_retries=5):
                 raise ValueError("Agent response content is None")
                 
             return response
-            
+
+        except ContextBudgetError:
+            # No retry can fit this prompt; don't send the agent an empty one
+            raise
         except Exception as e:
             error_msg = str(e).lower()
             last_error_context = str(e) # Save exact error for reflection
+            if started is not None:
+                # The failing model request; earlier ones of the run aren't reported
+                gateway.record(get_llm_provider(backend.model), time.monotonic() - started, failed=True)
             
             # Check for Groq's tool_use_failed error (Strict Retry with Reflection)
             if "tool_use_failed" in error_msg or "failed to call a function" in error_msg or "validation failed" in error_msg:
@@ -179,20 +358,41 @@ async def safe_agent_run(agent, prompt, max_retries=5):
             # Check for TPM/Token limits (Specific fix for 6k limit)
             if "tokens" in error_msg or "too large" in error_msg or "rate_limit_exceeded" in error_msg:
                 logger.warning(f"TPM Limit Hit (Requested {error_msg}). Attempting TRUNCATED retry...")
-                # We need to wait a full minute for TPM to reset if we really blasted it
-                await asyncio.sleep(60) 
-                continue
+                # Let the shared limiter hold back every caller of this model until
+                # the provider's quota has actually refilled
+                retry_after = parse_retry_after(error_msg)
+                await limiter.penalize(retry_after)
+                model_router.record_failure(backend, throttled=True, retry_after=retry_after)
+                if attempt < max_retries - 1:
+                    continue
             
             # Broad check for retryable errors (429, 500, 503, Quota, etc.)
             retryable_keywords = ["429", "rate limit", "quota", "exhausted", "503", "500"]
             is_retryable = any(kw in error_msg for kw in retryable_keywords)
             
             if is_retryable:
+                throttled = any(kw in error_msg for kw in ("429", "rate limit", "quota", "exhausted"))
+                model_router.record_failure(
+                    backend, throttled=throttled, retry_after=parse_retry_after(error_msg)
+                )
+                if not throttled:
+                    failed_backends.append(backend)
+                if attempt < max_retries - 1 and model_router.has_alternative(backend, failed_backends):
+                    # Fail over to another backend instead of sleeping
+                    logger.warning(f"Retryable error on '{backend.name}': '{error_msg}'. Failing over...")
+                    continue
                 if attempt < max_retries - 1:
                     wait_time = retry_delay * (1.5 ** attempt) 
                     logger.warning(f"Retryable error: '{error_msg}'. Waiting {wait_time:.1f}s before retry...")
                     await asyncio.sleep(wait_time)
                     continue
+
+            # A broken fallback backend (bad key, unknown model) must not fail the call
+            if backend.model is not agent.model and attempt < max_retries - 1:
+                logger.warning(f"LLM backend '{backend.name}' failed: '{error_msg}'. Retrying elsewhere...")
+                model_router.record_failure(backend)
+                failed_backends.append(backend)
+                continue
             
             if "404" in error_msg or "not found" in error_msg:
                 logger.error("MODEL NOT FOUND ERROR: Check if the model ID in llm.py is correct.")
@@ -307,52 +507,234 @@ async def safe_agent_run(agent, prompt, max_retries=5):
 #             logger.error(f"Agent execution failed after {attempt + 1} attempts: {str(e)}")
 #             raise e
 
-async def generate_travel_plan(request: TravelPlanAgentRequest) -> str:
-    """Generate a travel plan based on the request and log status/output to database."""
-    trip_plan_id = request.trip_plan_id
-    logger.info(f"Generating travel plan for tripPlanId: {trip_plan_id}")
-
-    # Get or create status entry using repository functions
-    status_entry = await get_trip_plan_status(trip_plan_id)
-    if not status_entry:
-        status_entry = await create_trip_plan_status(
-            trip_plan_id=trip_plan_id, status="pending"
-        )
-
-    # Update status to processing
-    status_entry = await update_trip_plan_status(
-        trip_plan_id=trip_plan_id,
-        status="processing",
-        current_step="Initializing travel plan generation",
-        started_at=datetime.now(timezone.utc),
+# Stage names used in the plan generation graph
+DESTINATION_STAGE = "destination"
+FLIGHTS_STAGE = "flights"
+HOTELS_STAGE = "hotels"
+DINING_STAGE = "dining"
+ITINERARY_STAGE = "itinerary"
+BUDGET_STAGE = "budget"
+STRUCTURED_STAGE = "structured"
+DIGEST_STAGE = "digest"
+
+RESEARCH_STAGES = (DESTINATION_STAGE, FLIGHTS_STAGE, HOTELS_STAGE, DINING_STAGE)
+
+# Compact rendering of each research output handed to downstream agents
+STAGE_DIGESTERS = {
+    DESTINATION_STAGE: digest_destination,
+    FLIGHTS_STAGE: digest_flights,
+    HOTELS_STAGE: digest_hotels,
+    DINING_STAGE: digest_restaurants,
+}
+
+# Headings used when upstream stage outputs are handed to downstream agents
+SECTION_HEADINGS = {
+    DESTINATION_STAGE: "Destination Attractions",
+    FLIGHTS_STAGE: "Flight recommendations",
+    HOTELS_STAGE: "Hotel recommendations",
+    DINING_STAGE: "Restaurant recommendations",
+    ITINERARY_STAGE: "Day-by-day itinerary",
+    BUDGET_STAGE: "Budget optimization",
+}
+
+# Stage outputs each field of the structured plan is extracted from
+STRUCTURED_FIELD_SOURCES = {
+    "day_by_day_plan": (ITINERARY_STAGE,),
+    "hotels": (HOTELS_STAGE,),
+    "attractions": (DESTINATION_STAGE,),
+    "flights": (FLIGHTS_STAGE,),
+    "restaurants": (DINING_STAGE,),
+    "budget_insights": (BUDGET_STAGE,),
+    "tips": (ITINERARY_STAGE, DESTINATION_STAGE),
+}
+
+# Research results are reused across plans that share the request fields each
+# agent depends on. Flight prices go stale quickly; destination and dining
+# research stays valid much longer.
+STAGE_CACHE_POLICIES = {
+    DESTINATION_STAGE: CachePolicy(
+        ttl_seconds=24 * 3600,
+        key_fields=(
+            "destination",
+            "traveling_with",
+            "age_groups",
+            "vibes",
+            "priorities",
+            "interests",
+        ),
+    ),
+    FLIGHTS_STAGE: CachePolicy(
+        ttl_seconds=30 * 60,
+        key_fields=(
+            "starting_location",
+            "destination",
+            "travel_dates",
+            "date_input_type",
+            "duration",
+            "adults",
+            "children",
+            "travel_style",
+            "budget",
+            "budget_currency",
+        ),
+    ),
+    HOTELS_STAGE: CachePolicy(
+        ttl_seconds=6 * 3600,
+        key_fields=(
+            "destination",
+            "travel_dates",
+            "date_input_type",
+            "duration",
+            "adults",
+            "children",
+            "rooms",
+            "travel_style",
+            "budget",
+            "budget_currency",
+            "priorities",
+        ),
+    ),
+    DINING_STAGE: CachePolicy(
+        ttl_seconds=24 * 3600,
+        key_fields=(
+            "destination",
+            "age_groups",
+            "travel_style",
+            "budget",
+            "budget_currency",
+            "vibes",
+            "interests",
+            "additional_info",
+        ),
+    ),
+}
+
+
+def build_upstream_context(results: Dict[str, str], stage_names: Sequence[str]) -> str:
+    """Combine the outputs of upstream stages into a single markdown block.
+
+    Sections are always emitted in the order of ``stage_names`` so the prompt
+    is stable regardless of which stage happened to finish first.
+    """
+    sections = []
+    for name in stage_names:
+        if name in results:
+            sections.append(
+                f"""
+        ## {SECTION_HEADINGS[name]}:
+        ---
+        {results[name]}
+        ---
+        """
+            )
+    return "".join(sections)
+
+
+# How much each part of a downstream prompt matters; the lowest are trimmed first
+CONTEXT_PRIORITIES = {
+    "request": 100,
+    ITINERARY_STAGE: 90,
+    FLIGHTS_STAGE: 80,
+    HOTELS_STAGE: 80,
+    DESTINATION_STAGE: 60,
+    DINING_STAGE: 50,
+}
+# Allowance for the fixed instructions around the context in a stage prompt
+PROMPT_TEMPLATE_TOKENS = 200
+
+
+async def summarize_context(name: str, text: str, max_tokens: int) -> str:
+    """Summarize an upstream output that doesn't fit a prompt budget."""
+    # Aim below the budget; the allocator cuts summaries that overshoot it
+    max_words = int(max_tokens * 0.6)
+    response = await safe_agent_run(
+        context_summarizer_agent,
+        f"""
+        Condense the following {SECTION_HEADINGS.get(name, name)} to at most {max_words} words:
+
+        {text}
+        """,
     )
+    summary = response.messages[-1].content or ""
+    context_digest_stats.record_summary(name, count_tokens(text), count_tokens(summary))
+    return summary
 
-    try:
-        travel_request_md = travel_request_to_markdown(request.travel_plan)
-        logger.info(f"Travel request markdown: {travel_request_md}")
 
-        # Update status for AI team generation
-        await update_trip_plan_status(
-            trip_plan_id=trip_plan_id,
-            status="processing",
-            current_step="Generating plan with TripCraft AI agents",
-        )
+async def fit_stage_context(
+    agent, travel_request_md: str, results: Dict[str, str], stage_names: Sequence[str]
+) -> Tuple[str, str]:
+    """Fit the travel request and upstream outputs into an agent's prompt budget.
 
-        last_response_content = ""
-        time_start = time.time()
+    Research outputs are replaced by their digests (see the digest stage);
+    sections that still don't fit are summarized or trimmed.
 
-        # Update status for AI team generation
-        await update_trip_plan_status(
-            trip_plan_id=trip_plan_id,
-            status="processing",
-            current_step="Researching about the destination",
-        )
-
-        # Destination Research
-        destionation_research_response = await safe_agent_run(
+    Returns:
+        Tuple[str, str]: The travel request markdown and the upstream context
+    """
+    context = {**results, **json.loads(results[DIGEST_STAGE])}
+    sections = [
+        ContextSection("request", travel_request_md, CONTEXT_PRIORITIES["request"], required=True)
+    ]
+    sections += [
+        ContextSection(name, context[name], CONTEXT_PRIORITIES[name])
+        for name in stage_names
+        if name in context
+    ]
+    fitted = await ContextAllocator(agent.model).fit_or_summarize(
+        sections,
+        estimate_agent_run_tokens(agent, "") + PROMPT_TEMPLATE_TOKENS,
+        summarize_context,
+    )
+    return fitted["request"], build_upstream_context(fitted, stage_names)
+
+
+def build_plan_stages(travel_plan: TravelPlanRequest, run: "PlanRun") -> List[Stage]:
+    """Declare the stage graph for generating a single travel plan.
+
+    The destination, flight, hotel and dining research stages are independent
+    and run concurrently. The digest stage compacts their results for the
+    itinerary, and the budget needs the itinerary as well; the structured plan
+    is then parsed from the full outputs of all of them. Research stages are served from the agent result cache when
+    possible.
+    """
+    destination = travel_plan.destination
+    travel_request_md = travel_request_to_markdown(travel_plan)
+    logger.info(f"Travel request markdown: {travel_request_md}")
+
+    async def run_agent_stage(
+        current_step: str,
+        agent,
+        prompt: str,
+        label: str,
+        stage_name: Optional[str] = None,
+        stream: bool = False,
+    ) -> str:
+        await run.update_status(status="processing", current_step=current_step)
+
+        async def run_agent() -> str:
+            token_relay = TokenRelay(run, stage_name) if stream else None
+            response = await safe_agent_run(agent, prompt, token_relay=token_relay)
+            return response.messages[-1].content
+
+        policy = STAGE_CACHE_POLICIES.get(stage_name)
+        if policy is None:
+            content = await run_agent()
+        else:
+            content = await agent_result_cache.get_or_run(
+                stage_name,
+                policy,
+                travel_plan.model_dump(include=set(policy.key_fields)),
+                run_agent,
+            )
+        logger.info(f"{label} response: {content}")
+        return content
+
+    async def destination_stage(results: Dict[str, str]) -> str:
+        return await run_agent_stage(
+            "Researching about the destination",
             destination_agent,
             f"""
-            Please research about the destination {request.travel_plan.destination}
+            Please research about the destination {destination}
 
             Below are user's travel request:
             {travel_request_md}
@@ -360,32 +742,14 @@ async def generate_travel_plan(request: TravelPlanAgentRequest) -> str:
             Provide a very detailed research about the destination, its attractions, activities, and other relevant information that user might be interested in.
 
             Give 10 attractions/activities that user might be interested in.
-            """
+            """,
+            "Destination research",
+            DESTINATION_STAGE,
         )
 
-        logger.info(
-            f"Destination research response: {destionation_research_response.messages[-1].content}"
-        )
-
-        last_response_content = f"""
-        ## Destination Attractions:
-        ---
-        {destionation_research_response.messages[-1].content}
-        ---
-"""
-
-        # Wait 12s before next call to stay under 5 RPM
-        logger.info("Waiting 12s for Rate Limit (RPM) protection...")
-        await asyncio.sleep(12)
-
-        # Update status for AI team generation
-        await update_trip_plan_status(
-            trip_plan_id=trip_plan_id,
-            status="processing",
-            current_step="Searching for the best flights",
-        )
-        # Flight Search
-        flight_search_response = await safe_agent_run(
+    async def flights_stage(results: Dict[str, str]) -> str:
+        return await run_agent_stage(
+            "Searching for the best flights",
             flight_search_agent,
             f"""
             Please find flights according to the user's travel request:
@@ -396,32 +760,14 @@ async def generate_travel_plan(request: TravelPlanAgentRequest) -> str:
             Provide a very detailed research about the flights, its price, duration, and other relevant information that user might be interested in.
 
             Give top 5 flights.
-            """
+            """,
+            "Flight search",
+            FLIGHTS_STAGE,
         )
 
-        logger.info(
-            f"Flight search response: {flight_search_response.messages[-1].content}"
-        )
-
-        last_response_content += f"""
-        ## Flight recommendations:
-        ---
-        {flight_search_response.messages[-1].content}
-        ---
-        """
-
-        # Wait 12s before next call to stay under 5 RPM
-        logger.info("Waiting 12s for Rate Limit (RPM) protection...")
-        await asyncio.sleep(12)
-
-        # Update status for AI team generation
-        await update_trip_plan_status(
-            trip_plan_id=trip_plan_id,
-            status="processing",
-            current_step="Searching for the best hotels",
-        )
-        # Hotel Search
-        hotel_search_response = await safe_agent_run(
+    async def hotels_stage(results: Dict[str, str]) -> str:
+        return await run_agent_stage(
+            "Searching for the best hotels",
             hotel_search_agent,
             f"""
             Please find hotels according to the user's travel request:
@@ -432,32 +778,14 @@ async def generate_travel_plan(request: TravelPlanAgentRequest) -> str:
             Provide a very detailed research about the hotels, its price, amenities, and other relevant information that user might be interested in.
 
             Give top 5 hotels.
-            """
+            """,
+            "Hotel search",
+            HOTELS_STAGE,
         )
 
-        last_response_content += f"""
-        ## Hotel recommendations:
-        ---
-        {hotel_search_response.messages[-1].content}
-        ---
-        """
-
-        logger.info(
-            f"Hotel search response: {hotel_search_response.messages[-1].content}"
-        )
-
-        # Wait 12s before next call to stay under 5 RPM
-        logger.info("Waiting 12s for Rate Limit (RPM) protection...")
-        await asyncio.sleep(12)
-
-        # Update status for AI team generation
-        await update_trip_plan_status(
-            trip_plan_id=trip_plan_id,
-            status="processing",
-            current_step="Searching for the best restaurants",
-        )
-        # Restaurant Search
-        restaurant_search_response = await safe_agent_run(
+    async def dining_stage(results: Dict[str, str]) -> str:
+        return await run_agent_stage(
+            "Searching for the best restaurants",
             dining_agent,
             f"""
             Please find restaurants according to the user's travel request:
@@ -468,137 +796,392 @@ async def generate_travel_plan(request: TravelPlanAgentRequest) -> str:
             Provide a very detailed research about the restaurants, its price, menu, and other relevant information that user might be interested in.
 
             Give top 5 restaurants.
-            """
+            """,
+            "Restaurant search",
+            DINING_STAGE,
         )
 
-        last_response_content += f"""
-        ## Restaurant recommendations:
-        ---
-        {restaurant_search_response.messages[-1].content}
-        ---
-        """
-
-        logger.info(
-            f"Restaurant search response: {restaurant_search_response.messages[-1].content}"
+    async def digest_stage(results: Dict[str, str]) -> str:
+        digests = {
+            name: digest_output(name, results[name], STAGE_DIGESTERS[name])
+            for name in RESEARCH_STAGES
+        }
+        context_digest_stats.record_plan(
+            run.primary_trip_plan_id,
+            {name: count_tokens(results[name]) for name in RESEARCH_STAGES},
+            {name: count_tokens(digest) for name, digest in digests.items()},
         )
+        return json.dumps(digests)
 
-        # Wait 12s before next call to stay under 5 RPM
-        logger.info("Waiting 12s for Rate Limit (RPM) protection...")
-        await asyncio.sleep(12)
-
-        # Update status for AI team generation
-        await update_trip_plan_status(
-            trip_plan_id=trip_plan_id,
-            status="processing",
-            current_step="Creating the day-by-day itinerary",
+    async def itinerary_stage(results: Dict[str, str]) -> str:
+        request_md, upstream_context = await fit_stage_context(
+            itinerary_agent, travel_request_md, results, RESEARCH_STAGES
         )
-        # Itinerary
-        itinerary_response = await safe_agent_run(
+        return await run_agent_stage(
+            "Creating the day-by-day itinerary",
             itinerary_agent,
             f"""
-            Please create a detailed day-by-day itinerary for a trip to {request.travel_plan.destination}  for user's travel request:
-            {travel_request_md}
+            Please create a detailed day-by-day itinerary for a trip to {destination}  for user's travel request:
+            {request_md}
 
             Based on the following information:
-            {last_response_content}
-            """
+            {upstream_context}
+            """,
+            "Itinerary",
+            ITINERARY_STAGE,
+            stream=True,
         )
 
-        logger.info(f"Itinerary response: {itinerary_response.messages[-1].content}")
-
-        last_response_content += f"""
-        ## Day-by-day itinerary:
-        ---
-        {itinerary_response.messages[-1].content}
-        ---
-        """
-
-        # Wait 12s before next call to stay under 5 RPM
-        logger.info("Waiting 12s for Rate Limit (RPM) protection...")
-        await asyncio.sleep(12)
-
-        # Update status for AI team generation
-        await update_trip_plan_status(
-            trip_plan_id=trip_plan_id,
-            status="processing",
-            current_step="Optimizing the budget",
+    async def budget_stage(results: Dict[str, str]) -> str:
+        request_md, upstream_context = await fit_stage_context(
+            budget_agent, travel_request_md, results, RESEARCH_STAGES + (ITINERARY_STAGE,)
         )
-        # Budget
-        budget_response = await safe_agent_run(
+        return await run_agent_stage(
+            "Optimizing the budget",
             budget_agent,
             f"""
             Please optimize the budget according to the user's travel request:
-            {travel_request_md}
+            {request_md}
 
             Based on the following information:
-            {last_response_content}
-            """
+            {upstream_context}
+            """,
+            "Budget",
         )
 
-        logger.info(f"Budget response: {budget_response.messages[-1].content}")
+    async def structured_stage(results: Dict[str, str]) -> str:
+        await run.update_status(status="processing", current_step="Adding finishing touches")
+        json_response_output = await extract_structured_plan(
+            {
+                SECTION_HEADINGS[name]: output
+                for name, output in results.items()
+                if name in SECTION_HEADINGS
+            },
+            {
+                field_name: [SECTION_HEADINGS[name] for name in stage_names]
+                for field_name, stage_names in STRUCTURED_FIELD_SOURCES.items()
+            },
+        )
+        logger.info(f"Converted Structured Response: {json_response_output[:500]}...")
+        return json_response_output
+
+    return [
+        Stage(DESTINATION_STAGE, destination_stage),
+        Stage(FLIGHTS_STAGE, flights_stage),
+        Stage(HOTELS_STAGE, hotels_stage),
+        Stage(DINING_STAGE, dining_stage),
+        Stage(DIGEST_STAGE, digest_stage, depends_on=RESEARCH_STAGES),
+        Stage(ITINERARY_STAGE, itinerary_stage, depends_on=(DIGEST_STAGE,)),
+        Stage(BUDGET_STAGE, budget_stage, depends_on=(DIGEST_STAGE, ITINERARY_STAGE)),
+        Stage(
+            STRUCTURED_STAGE,
+            structured_stage,
+            depends_on=RESEARCH_STAGES + (ITINERARY_STAGE, BUDGET_STAGE),
+        ),
+    ]
 
-        # Wait 12s before final conversion (which also uses an agent)
-        logger.info("Waiting 12s for Rate Limit (RPM) protection before final formatting...")
-        await asyncio.sleep(12)
 
-        time_end = time.time()
-        logger.info(f"Total time taken (including delays): {time_end - time_start:.2f} seconds")
+def normalize_travel_request(data: TravelPlanRequest) -> TravelPlanRequest:
+    """Return a canonical copy of a travel request.
+
+    Formatting differences (case, spacing, list order) are removed, and so is
+    the traveler's name, which the agents don't need. Requests that normalize
+    to the same value can share one pipeline run.
+    """
+
+    def clean(text: str) -> str:
+        return " ".join(text.split())
+
+    def clean_list(values: List[str]) -> List[str]:
+        return sorted({clean(value).lower() for value in values if value.strip()})
+
+    return data.model_copy(
+        update={
+            "name": "",
+            "destination": clean(data.destination).lower(),
+            "starting_location": clean(data.starting_location).lower(),
+            "travel_dates": data.travel_dates.model_copy(
+                update={
+                    "start": data.travel_dates.start.strip(),
+                    "end": data.travel_dates.end.strip(),
+                }
+            ),
+            "date_input_type": clean(data.date_input_type).lower(),
+            "traveling_with": clean(data.traveling_with).lower(),
+            "age_groups": clean_list(data.age_groups),
+            "budget_currency": clean(data.budget_currency).upper(),
+            "travel_style": clean(data.travel_style).lower(),
+            "vibes": clean_list(data.vibes),
+            "priorities": clean_list(data.priorities),
+            "interests": clean(data.interests),
+            "pace": sorted(set(data.pace)),
+            "been_there_before": clean(data.been_there_before).lower(),
+            "loved_places": clean(data.loved_places),
+            "additional_info": clean(data.additional_info),
+        }
+    )
 
-        # Update status for response conversion
-        await update_trip_plan_status(
-            trip_plan_id=trip_plan_id,
-            status="processing",
-            current_step="Adding finishing touches",
+
+def travel_request_fingerprint(data: TravelPlanRequest) -> str:
+    """Canonical fingerprint of a travel request.
+
+    Used to coalesce identical requests and to only reuse stage checkpoints
+    generated for the same request.
+    """
+    normalized = normalize_travel_request(data)
+    return hashlib.sha256(normalized.model_dump_json().encode("utf-8")).hexdigest()
+
+
+class PlanRun:
+    """The trip plans served by one execution of the plan pipeline.
+
+    Usually a single trip plan, but identical requests submitted while a run is
+    in flight join it, so status updates and the final output fan out to every
+    trip plan in the run.
+    """
+
+    def __init__(self, trip_plan_id: str, task_id: Optional[int] = None):
+        self.primary_trip_plan_id = trip_plan_id
+        self.trip_plan_ids: List[str] = [trip_plan_id]
+        # Plan task behind each trip plan, completed together with its output
+        self.task_ids: Dict[str, int] = {}
+        if task_id is not None:
+            self.task_ids[trip_plan_id] = task_id
+        self.saved_trip_plan_ids: List[str] = []
+        self.current_step: Optional[str] = None
+        self.input_hash: Optional[str] = None
+        # Outputs of the stages finished so far, replayed to trip plans that join late
+        self.stage_outputs: Dict[str, str] = {}
+
+    async def update_status(self, status: str, **kwargs) -> None:
+        """Update the status of every trip plan in the run.
+
+        Database writes of intermediate steps are coalesced by the status writer.
+        """
+        if kwargs.get("current_step") is not None:
+            self.current_step = kwargs["current_step"]
+        for trip_plan_id in list(self.trip_plan_ids):
+            await status_writer.update(trip_plan_id, status, **kwargs)
+            await publish_status(
+                trip_plan_id, status, kwargs.get("current_step"), kwargs.get("error")
+            )
+
+    async def publish_tokens(self, stage: str, delta: str, offset: int, attempt: int) -> None:
+        """Push streamed tokens to subscribers of every trip plan in the run."""
+        for trip_plan_id in list(self.trip_plan_ids):
+            await publish_tokens(trip_plan_id, stage, delta, offset, attempt)
+
+    async def publish_stage_output(self, stage: str, output: str, input_hash: str) -> None:
+        """Push a finished stage's output to subscribers of every trip plan in the run."""
+        self.input_hash = input_hash
+        self.stage_outputs[stage] = output
+        for trip_plan_id in list(self.trip_plan_ids):
+            await publish_stage_output(
+                trip_plan_id,
+                stage,
+                output,
+                input_hash,
+                checkpoint_trip_plan_id=self.primary_trip_plan_id,
+            )
+
+    async def join(self, trip_plan_id: str, task_id: Optional[int] = None) -> None:
+        """Add a trip plan to the run and bring its status up to date."""
+        if task_id is not None:
+            self.task_ids[trip_plan_id] = task_id
+        if trip_plan_id in self.trip_plan_ids:
+            return
+        self.trip_plan_ids.append(trip_plan_id)
+        logger.info(
+            f"Trip plan {trip_plan_id} joined in-flight run of {self.primary_trip_plan_id}"
+        )
+        if not await get_trip_plan_status(trip_plan_id):
+            await create_trip_plan_status(trip_plan_id=trip_plan_id, status="pending")
+        current_step = self.current_step or "Generating plan with TripCraft AI agents"
+        await status_writer.update(
+            trip_plan_id,
+            "processing",
+            current_step=current_step,
+            started_at=datetime.now(timezone.utc),
         )
+        await publish_status(trip_plan_id, "processing", current_step)
+        for stage, output in list(self.stage_outputs.items()):
+            await publish_stage_output(
+                trip_plan_id,
+                stage,
+                output,
+                self.input_hash,
+                checkpoint_trip_plan_id=self.primary_trip_plan_id,
+            )
+
+    def leave(self, trip_plan_id: str) -> None:
+        """Stop fanning results out to a trip plan."""
+        if trip_plan_id in self.trip_plan_ids:
+            self.trip_plan_ids.remove(trip_plan_id)
+        self.task_ids.pop(trip_plan_id, None)
+
+    async def save_result(
+        self, plan: Dict[str, Any], trip_plan_ids: Optional[Sequence[str]] = None
+    ) -> None:
+        """Save the final plan and mark its trip plans and tasks completed.
+
+        Replacing the output, completing the status and completing the task
+        commit as one transaction, so a plan is never seen completed without
+        its output (or with a task still running). The plan is stored once, in
+        the trip plan output; the task only records that it succeeded.
+
+        Args:
+            plan: The final plan document
+            trip_plan_ids: Trip plans to save it for; defaults to every trip
+                plan in the run
+        """
+        trip_plan_ids = list(self.trip_plan_ids if trip_plan_ids is None else trip_plan_ids)
+        completed_at = datetime.now(timezone.utc)
+        current_step = "Plan generated and saved"
+
+        # Debounced progress must not land on top of the completed status
+        await status_writer.flush()
+        async with atomic():
+            for trip_plan_id in trip_plan_ids:
+                await upsert_trip_plan_output(
+                    trip_plan_id=trip_plan_id, itinerary=plan, summary=""
+                )
+                await update_trip_plan_status(
+                    trip_plan_id=trip_plan_id,
+                    status="completed",
+                    current_step=current_step,
+                    completed_at=completed_at,
+                )
+                task_id = self.task_ids.get(trip_plan_id)
+                if task_id is not None:
+                    await update_task_status(task_id, TaskStatus.success)
+        self.saved_trip_plan_ids.extend(trip_plan_ids)
+
+        self.current_step = current_step
+        for trip_plan_id in trip_plan_ids:
+            await publish_status(trip_plan_id, "completed", current_step)
+
+
+def parse_structured_output(output: str) -> Any:
+    """Parse the structured stage's JSON so the plan is stored as one document.
+
+    Output that isn't valid JSON is kept as the raw string.
+    """
+    try:
+        return json.loads(output)
+    except ValueError:
+        logger.warning("Structured output is not valid JSON; storing it as text")
+        return output
+
 
-        json_response_output = await convert_to_model(
-            last_response_content, TravelPlanTeamResponse
+async def load_stage_checkpoints(trip_plan_id: str, input_hash: str) -> Dict[str, str]:
+    """Load stage outputs persisted by a previous, unfinished run of this plan."""
+    try:
+        checkpoints = await get_stage_outputs(trip_plan_id, input_hash)
+    except Exception as e:
+        logger.warning(f"Could not load stage checkpoints for {trip_plan_id}: {e}")
+        return {}
+    if checkpoints:
+        logger.info(
+            f"Resuming trip plan {trip_plan_id} from checkpoints: {sorted(checkpoints)}"
         )
-        logger.info(f"Converted Structured Response: {json_response_output[:500]}...")
+    return checkpoints
 
-        # Delete any existing output entries for this trip plan
-        await delete_trip_plan_outputs(trip_plan_id=trip_plan_id)
 
-        final_response = json.dumps(
-            {
-                "itinerary": json_response_output,
-                "budget_agent_response": budget_response.messages[-1].content,
-                "destination_agent_response": destionation_research_response.messages[
-                    -1
-                ].content,
-                "flight_agent_response": flight_search_response.messages[-1].content,
-                "hotel_agent_response": hotel_search_response.messages[-1].content,
-                "restaurant_agent_response": restaurant_search_response.messages[
-                    -1
-                ].content,
-                "itinerary_agent_response": itinerary_response.messages[-1].content,
-            },
-            indent=2,
+async def generate_travel_plan(
+    request: TravelPlanAgentRequest, run: Optional[PlanRun] = None
+) -> Dict[str, Any]:
+    """Generate a travel plan based on the request and log status/output to database.
+
+    Args:
+        request: The travel plan request
+        run: The run to report to; identical requests may join it while it is
+            in flight. Defaults to a run serving only ``request.trip_plan_id``.
+    """
+    run = run or PlanRun(request.trip_plan_id)
+    # One connection serves all of the run's DB operations, stages included
+    async with unit_of_work(long_lived=True):
+        return await _generate_travel_plan(request, run)
+
+
+async def _generate_travel_plan(
+    request: TravelPlanAgentRequest, run: PlanRun
+) -> Dict[str, Any]:
+    trip_plan_id = request.trip_plan_id
+    logger.info(f"Generating travel plan for tripPlanId: {trip_plan_id}")
+
+    # Get or create status entry using repository functions
+    status_entry = await get_trip_plan_status(trip_plan_id)
+    if not status_entry:
+        status_entry = await create_trip_plan_status(
+            trip_plan_id=trip_plan_id, status="pending"
         )
 
-        # Create new output entry
-        await create_trip_plan_output(
-            trip_plan_id=trip_plan_id,
-            itinerary=final_response,
-            summary="",
+    # Update status to processing
+    await run.update_status(
+        status="processing",
+        current_step="Initializing travel plan generation",
+        started_at=datetime.now(timezone.utc),
+    )
+
+    try:
+        # Update status for AI team generation
+        await run.update_status(
+            status="processing",
+            current_step="Generating plan with TripCraft AI agents",
         )
 
-        # Update status to completed
-        await update_trip_plan_status(
-            trip_plan_id=trip_plan_id,
-            status="completed",
-            current_step="Plan generated and saved",
-            completed_at=datetime.now(timezone.utc),
+        time_start = time.time()
+
+        # Reuse the outputs of stages that finished during an earlier attempt
+        travel_plan = normalize_travel_request(request.travel_plan)
+        input_hash = travel_request_fingerprint(request.travel_plan)
+        checkpoints = await load_stage_checkpoints(trip_plan_id, input_hash)
+        for stage_name, output in checkpoints.items():
+            await run.publish_stage_output(stage_name, output, input_hash)
+
+        async def checkpoint_stage(stage_name: str, output: str) -> None:
+            try:
+                await save_stage_output(trip_plan_id, stage_name, input_hash, output)
+            except Exception as e:
+                # Checkpointing is best effort; the plan can still complete without it
+                logger.warning(f"Failed to checkpoint stage '{stage_name}' for {trip_plan_id}: {e}")
+            await run.publish_stage_output(stage_name, output, input_hash)
+
+        results = await run_stage_graph(
+            build_plan_stages(travel_plan, run),
+            completed=checkpoints,
+            on_stage_complete=checkpoint_stage,
         )
 
-        return final_response
+        time_end = time.time()
+        logger.info(f"Total time taken: {time_end - time_start:.2f} seconds")
+
+        plan = {
+            "itinerary": parse_structured_output(results[STRUCTURED_STAGE]),
+            "budget_agent_response": results[BUDGET_STAGE],
+            "destination_agent_response": results[DESTINATION_STAGE],
+            "flight_agent_response": results[FLIGHTS_STAGE],
+            "hotel_agent_response": results[HOTELS_STAGE],
+            "restaurant_agent_response": results[DINING_STAGE],
+            "itinerary_agent_response": results[ITINERARY_STAGE],
+        }
+
+        # Save the output for every trip plan served by this run
+        await run.save_result(plan)
+
+        # The plan is saved, so the checkpoints are no longer needed
+        try:
+            await delete_stage_outputs(trip_plan_id)
+        except Exception as e:
+            logger.warning(f"Failed to clear stage checkpoints for {trip_plan_id}: {e}")
+
+        return plan
     except Exception as e:
         logger.error(
             f"Error generating travel plan for {trip_plan_id}: {str(e)}", exc_info=True
         )
         # Update status to failed
-        await update_trip_plan_status(
-            trip_plan_id=trip_plan_id,
+        await run.update_status(
             status="failed",
             error=str(e),
             completed_at=datetime.now(timezone.utc),
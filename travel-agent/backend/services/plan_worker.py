@@ -0,0 +1,276 @@
+"""
+Worker subsystem that executes queued plan generation tasks.
+
+The API only enqueues ``plan_tasks`` rows. Workers claim them with
+``FOR UPDATE SKIP LOCKED``, run at most ``PLAN_WORKER_CONCURRENCY`` plans at a
+time and keep a lease on each claimed task alive with heartbeats. If a worker
+dies, its leases expire and another worker picks the task up again, resuming
+from the stage checkpoints. Throughput scales by running more worker processes
+(see ``worker.py``); the API process can also run one embedded worker.
+"""
+
+import asyncio
+import os
+import socket
+import traceback
+import uuid
+from datetime import datetime, timezone
+from typing import Optional, Set
+
+from loguru import logger
+from pydantic import ValidationError
+
+from models.plan_task import PlanTask, TaskStatus
+from models.travel_plan import TravelPlanAgentRequest, TravelPlanRequest
+from repository.plan_task_repository import (
+    claim_duplicate_tasks,
+    claim_next_task,
+    heartbeat_task,
+    release_task,
+    update_task_status,
+)
+from repository.trip_plan_repository import (
+    touch_trip_plan_status,
+    update_trip_plan_status,
+)
+from services.plan_coalescer import generate_travel_plan_coalesced, has_inflight_plan
+from services.plan_events import publish_status
+from services.plan_service import travel_request_fingerprint
+
+PLAN_TASK_TYPE = "travel_plan_generation"
+
+WORKER_CONCURRENCY = int(os.getenv("PLAN_WORKER_CONCURRENCY", "2"))
+LEASE_SECONDS = int(os.getenv("PLAN_WORKER_LEASE_SECONDS", "120"))
+POLL_INTERVAL_SECONDS = float(os.getenv("PLAN_WORKER_POLL_SECONDS", "2"))
+MAX_ATTEMPTS = int(os.getenv("PLAN_WORKER_MAX_ATTEMPTS", "3"))
+# Whether the API process runs a worker too (disable when running worker.py separately)
+EMBEDDED_WORKER_ENABLED = os.getenv("PLAN_WORKER_EMBEDDED", "true").lower() == "true"
+
+
+def handle_task_exception(task: asyncio.Task):
+    """Callback to handle exceptions from background tasks."""
+    try:
+        exc = task.exception()
+        if exc:
+            logger.error(f"Background task failed with exception: {exc}")
+            logger.error(f"Traceback: {''.join(traceback.format_exception(type(exc), exc, exc.__traceback__))}")
+    except asyncio.CancelledError:
+        logger.warning("Background task was cancelled")
+    except Exception as e:
+        logger.error(f"Error in exception handler: {e}")
+
+
+class PlanWorker:
+    """Claims and runs plan generation tasks with bounded concurrency."""
+
+    def __init__(
+        self,
+        concurrency: int = WORKER_CONCURRENCY,
+        lease_seconds: int = LEASE_SECONDS,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        max_attempts: int = MAX_ATTEMPTS,
+        worker_id: Optional[str] = None,
+    ):
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+        self._slots = asyncio.Semaphore(concurrency)
+        self._wakeup = asyncio.Event()
+        self._running: Set[asyncio.Task] = set()
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start claiming tasks in the background."""
+        logger.info(
+            f"Starting plan worker {self.worker_id} (concurrency={self.concurrency}, "
+            f"lease={self.lease_seconds}s)"
+        )
+        self._loop_task = asyncio.create_task(self._run(), name=f"plan-worker:{self.worker_id}")
+        self._loop_task.add_done_callback(handle_task_exception)
+
+    def wake(self) -> None:
+        """Check the queue immediately instead of waiting for the next poll."""
+        self._wakeup.set()
+
+    async def stop(self) -> None:
+        """Stop claiming tasks and hand running tasks back to the queue."""
+        logger.info(f"Stopping plan worker {self.worker_id}")
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+        for task in list(self._running):
+            task.cancel()
+        await asyncio.gather(*self._running, return_exceptions=True)
+
+    async def run_forever(self) -> None:
+        """Run the worker until cancelled."""
+        self.start()
+        try:
+            await self._loop_task
+        finally:
+            await self.stop()
+
+    async def _run(self) -> None:
+        while True:
+            await self._slots.acquire()
+            self._wakeup.clear()
+            try:
+                task = await claim_next_task(PLAN_TASK_TYPE, self.worker_id, self.lease_seconds)
+            except Exception as e:
+                logger.error(f"Plan worker {self.worker_id} failed to claim a task: {e}")
+                task = None
+
+            if task is None:
+                self._slots.release()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            try:
+                fingerprint = task.fingerprint or travel_request_fingerprint(
+                    TravelPlanRequest(**task.input_data)
+                )
+            except Exception as e:
+                # A malformed row must not stop the worker or be re-claimed forever
+                self._slots.release()
+                await self._fail_task(task, f"Invalid plan request: {e}")
+                continue
+
+            # Identical queued requests are served by the same pipeline run
+            duplicates = []
+            try:
+                duplicates = await claim_duplicate_tasks(
+                    PLAN_TASK_TYPE, fingerprint, self.worker_id, self.lease_seconds
+                )
+            except Exception as e:
+                logger.warning(f"Plan worker {self.worker_id} failed to claim duplicates: {e}")
+
+            # Joining a pipeline that is already running here doesn't need a slot
+            if has_inflight_plan(fingerprint):
+                self._slots.release()
+                self._spawn(task, fingerprint, holds_slot=False)
+            else:
+                self._spawn(task, fingerprint, holds_slot=True)
+            for duplicate in duplicates:
+                self._spawn(duplicate, fingerprint, holds_slot=False)
+
+    def _spawn(self, task: PlanTask, fingerprint: str, holds_slot: bool) -> None:
+        # Tasks start in creation order, so the first one spawned starts the pipeline
+        processing = asyncio.create_task(
+            self._process(task, fingerprint, holds_slot), name=f"plan-task:{task.id}"
+        )
+        self._running.add(processing)
+        processing.add_done_callback(self._running.discard)
+        processing.add_done_callback(handle_task_exception)
+
+    async def _heartbeat(self, task: PlanTask, processing: asyncio.Task) -> None:
+        task_id = task.id
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                if not await heartbeat_task(task_id, self.worker_id, self.lease_seconds):
+                    logger.warning(
+                        f"[Task {task_id}] Lease lost by worker {self.worker_id}; stopping"
+                    )
+                    processing.cancel()
+                    return
+                # Keep the plan's status fresh so startup recovery leaves it alone
+                await touch_trip_plan_status(task.trip_plan_id)
+            except Exception as e:
+                logger.warning(f"[Task {task_id}] Heartbeat failed: {e}")
+
+    async def _fail_task(self, task: PlanTask, error_msg: str) -> None:
+        """Mark a task and its plan failed without running it."""
+        logger.error(f"[Task {task.id}] {error_msg}")
+        try:
+            await update_task_status(task.id, TaskStatus.error, error_message=error_msg[:500])
+            await update_trip_plan_status(
+                trip_plan_id=task.trip_plan_id,
+                status="failed",
+                error=error_msg,
+                completed_at=datetime.now(timezone.utc),
+            )
+            await publish_status(task.trip_plan_id, "failed", error=error_msg)
+        except Exception as e:
+            logger.error(f"[Task {task.id}] Failed to record the failure: {e}")
+
+    async def _process(self, task: PlanTask, fingerprint: str, holds_slot: bool) -> None:
+        heartbeat = asyncio.create_task(self._heartbeat(task, asyncio.current_task()))
+        try:
+            logger.info(
+                f"[Task {task.id}] Starting plan generation for trip: {task.trip_plan_id} "
+                f"(attempt {task.attempts})"
+            )
+
+            if task.attempts > self.max_attempts:
+                await self._fail_task(
+                    task, f"Plan generation abandoned after {task.attempts - 1} interrupted attempts"
+                )
+                return
+
+            try:
+                request = TravelPlanAgentRequest(
+                    trip_plan_id=task.trip_plan_id,
+                    travel_plan=TravelPlanRequest(**task.input_data),
+                )
+            except (ValidationError, TypeError) as e:
+                await self._fail_task(task, f"Invalid plan request: {e}")
+                return
+            # The task is marked successful together with the saved output
+            await generate_travel_plan_coalesced(request, fingerprint, task.id)
+            logger.info(f"[Task {task.id}] Completed successfully!")
+
+        except asyncio.CancelledError:
+            # Shutting down (or lease lost): let another worker resume the task
+            logger.warning(f"[Task {task.id}] Cancelled; returning task to the queue")
+            await asyncio.shield(release_task(task.id, self.worker_id))
+            raise
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            logger.error(f"[Task {task.id}] Error generating travel plan: {error_msg}")
+            logger.error(f"[Task {task.id}] Full traceback:\n{traceback.format_exc()}")
+
+            # Update task with error status
+            try:
+                await update_task_status(
+                    task.id, TaskStatus.error, error_message=error_msg[:500]
+                )
+                logger.info(f"[Task {task.id}] Status updated to error")
+            except Exception as update_error:
+                logger.error(f"[Task {task.id}] Failed to update error status: {update_error}")
+        finally:
+            heartbeat.cancel()
+            if holds_slot:
+                self._slots.release()
+
+
+_embedded_worker: Optional[PlanWorker] = None
+
+
+def start_embedded_worker() -> Optional[PlanWorker]:
+    """Start a worker inside the API process, if enabled."""
+    global _embedded_worker
+    if not EMBEDDED_WORKER_ENABLED or _embedded_worker is not None:
+        return _embedded_worker
+    _embedded_worker = PlanWorker()
+    _embedded_worker.start()
+    return _embedded_worker
+
+
+async def stop_embedded_worker() -> None:
+    """Stop the worker running inside the API process, if any."""
+    global _embedded_worker
+    if _embedded_worker is not None:
+        await _embedded_worker.stop()
+        _embedded_worker = None
+
+
+def wake_embedded_worker() -> None:
+    """Nudge the embedded worker after a task has been enqueued."""
+    if _embedded_worker is not None:
+        _embedded_worker.wake()
@@ -0,0 +1,120 @@
+"""
+Dependency-graph scheduler for multi-stage agent pipelines.
+
+Stages are declared with the names of the stages they depend on. Every stage
+whose dependencies are satisfied is started immediately, so independent stages
+run concurrently and dependent stages start as soon as their inputs are ready.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+# A stage receives the results of all completed stages (keyed by stage name)
+StageRunner = Callable[[Dict[str, Any]], Awaitable[Any]]
+# Called with the stage name and its result as soon as a stage finishes
+StageCallback = Callable[[str, Any], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class Stage:
+    """A single named unit of work in a stage graph."""
+
+    name: str
+    run: StageRunner
+    depends_on: Tuple[str, ...] = field(default_factory=tuple)
+
+
+def validate_stage_graph(stages: Sequence[Stage]) -> None:
+    """Validate that stage names are unique, dependencies exist and there are no cycles.
+
+    Args:
+        stages: The stages making up the graph
+
+    Raises:
+        ValueError: If the graph is malformed
+    """
+    names = [stage.name for stage in stages]
+    duplicates = {name for name in names if names.count(name) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate stage names: {sorted(duplicates)}")
+
+    by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        missing = [dep for dep in stage.depends_on if dep not in by_name]
+        if missing:
+            raise ValueError(f"Stage '{stage.name}' depends on unknown stages: {missing}")
+
+    # Kahn's algorithm: if we cannot order every stage there is a cycle
+    remaining = {stage.name: set(stage.depends_on) for stage in stages}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Stage graph contains a cycle between: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+async def run_stage_graph(
+    stages: Sequence[Stage],
+    completed: Optional[Dict[str, Any]] = None,
+    on_stage_complete: Optional[StageCallback] = None,
+) -> Dict[str, Any]:
+    """Run a graph of stages, starting each one as soon as its dependencies finish.
+
+    If any stage fails, all still-running stages are cancelled and the
+    original exception is re-raised.
+
+    Args:
+        stages: The stages making up the graph
+        completed: Results of stages that already ran (e.g. restored from a
+            checkpoint). These stages are skipped and their results are handed
+            to dependent stages as if they had just finished.
+        on_stage_complete: Optional callback invoked after each stage that runs
+
+    Returns:
+        Dict[str, Any]: The result of every stage, keyed by stage name
+    """
+    validate_stage_graph(stages)
+
+    results: Dict[str, Any] = dict(completed or {})
+    pending: List[Stage] = [stage for stage in stages if stage.name not in results]
+    if results:
+        logger.info(f"Resuming stage graph with completed stages: {sorted(results)}")
+    running: Dict[asyncio.Task, Stage] = {}
+
+    try:
+        while pending or running:
+            # Start every stage whose dependencies are all complete
+            for stage in [s for s in pending if all(dep in results for dep in s.depends_on)]:
+                pending.remove(stage)
+                logger.info(f"Starting stage '{stage.name}'")
+                task = asyncio.create_task(stage.run(dict(results)), name=f"stage:{stage.name}")
+                running[task] = stage
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            failed: List[asyncio.Task] = []
+            for task in done:
+                stage = running.pop(task)
+                if task.exception() is not None:
+                    failed.append(task)
+                    continue
+                results[stage.name] = task.result()
+                logger.info(f"Stage '{stage.name}' completed")
+                if on_stage_complete is not None:
+                    await on_stage_complete(stage.name, results[stage.name])
+
+            if failed:
+                # Re-raises the stage's exception, which cancels the rest below
+                failed[0].result()
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    return results
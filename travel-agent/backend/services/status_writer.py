@@ -0,0 +1,102 @@
+"""
+Coalescing writer for trip plan status updates.
+
+A plan moves through many short-lived steps, and concurrent stages report
+them in bursts. Instead of one database write per step, updates are merged per
+trip plan and written together after a short debounce window, in a single
+transaction. Terminal statuses (completed / failed) are written immediately
+together with anything still pending, so the final state is never delayed.
+
+Live progress still reaches clients without delay through the plan events
+stream; only the database write is coalesced.
+"""
+
+import asyncio
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from repository.trip_plan_repository import update_trip_plan_statuses
+from services.db_service import outside_unit_of_work
+
+STATUS_DEBOUNCE_SECONDS = float(os.getenv("STATUS_DEBOUNCE_SECONDS", "0.5"))
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+class StatusWriter:
+    """Merges status updates per trip plan and writes them in batches."""
+
+    def __init__(self, debounce_seconds: float = STATUS_DEBOUNCE_SECONDS):
+        self.debounce_seconds = debounce_seconds
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def update(
+        self,
+        trip_plan_id: str,
+        status: str,
+        current_step: Optional[str] = None,
+        error: Optional[str] = None,
+        started_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None,
+    ) -> None:
+        """Record a status update; it is written within the debounce window.
+
+        Terminal statuses are written before this returns.
+        """
+        pending = self._pending.setdefault(trip_plan_id, {})
+        pending["status"] = status
+        for name, value in (
+            ("current_step", current_step),
+            ("error", error),
+            ("started_at", started_at),
+            ("completed_at", completed_at),
+        ):
+            if value is not None:
+                pending[name] = value
+
+        if status in TERMINAL_STATUSES or self.debounce_seconds <= 0:
+            await self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.debounce_seconds, self._schedule_flush
+            )
+
+    def _schedule_flush(self) -> None:
+        self._timer = None
+        self._flush_task = asyncio.create_task(self._flush_in_background())
+
+    async def _flush_in_background(self) -> None:
+        try:
+            await self.flush()
+        except Exception as e:
+            # Intermediate steps are progress only; the next update retries them
+            logger.warning(f"Failed to write coalesced status updates: {e}")
+
+    async def flush(self) -> None:
+        """Write every pending update now."""
+        async with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            try:
+                # Batches span plans, so they never use one plan's unit of work
+                async with outside_unit_of_work():
+                    await update_trip_plan_statuses(pending)
+            except Exception:
+                # Put the updates back unless newer ones arrived meanwhile
+                for trip_plan_id, fields in pending.items():
+                    self._pending[trip_plan_id] = {**fields, **self._pending.get(trip_plan_id, {})}
+                raise
+            logger.debug(f"Wrote coalesced status updates for {len(pending)} trip plans")
+
+
+status_writer = StatusWriter()
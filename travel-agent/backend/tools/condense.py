@@ -0,0 +1,203 @@
+"""
+Relevance-ranked, size-capped tool output.
+
+Search and scrape tools return whole pages: navigation, cookie banners,
+footers and long passages unrelated to what the agent asked for. Handing all
+of it to the model makes tool-call turns slow and regularly exceeds the
+provider's request size limit.
+
+``condense_documents`` strips boilerplate, splits pages into chunks of a few
+paragraphs, ranks the chunks against the agent's query with BM25 and keeps
+the best ones (in page order) within a token budget. Without a query the
+leading chunks are kept. Everything is local and deterministic.
+"""
+
+import math
+import os
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config.tokenizer import count_tokens, truncate_to_tokens
+
+# Token budget of one tool call's page text
+TOOL_OUTPUT_MAX_TOKENS = int(os.getenv("TOOL_OUTPUT_MAX_TOKENS", "2000"))
+# Size of the chunks pages are split into before ranking
+TOOL_CHUNK_TOKENS = int(os.getenv("TOOL_CHUNK_TOKENS", "150"))
+# Most chunks kept from one tool call
+TOOL_OUTPUT_TOP_K = int(os.getenv("TOOL_OUTPUT_TOP_K", "12"))
+
+CHUNK_SEPARATOR = "\n[...]\n"
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+WORD_RE = re.compile(r"[^\W_]+", re.UNICODE)
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+BOILERPLATE_RE = re.compile(
+    r"\b(cookies?|privacy policy|terms of (use|service)|sign (in|up)|log ?in|subscribe|"
+    r"newsletter|all rights reserved|skip to (main )?content|accept all|javascript)\b",
+    re.IGNORECASE,
+)
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this "
+    "to was were will with what which who how best top near".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased words of a text, without stopwords."""
+    return [word for word in WORD_RE.findall(text.lower()) if word not in STOPWORDS]
+
+
+def strip_boilerplate(text: str) -> str:
+    """Drop page furniture: images, link-only lines, banners and repeated lines."""
+    lines = []
+    seen = set()
+    for line in IMAGE_RE.sub("", text).splitlines():
+        stripped = line.strip()
+        if not stripped:
+            if lines and lines[-1]:
+                lines.append("")
+            continue
+        # Navigation menus and link lists carry no content once the URLs are gone
+        without_links = LINK_RE.sub("", stripped).strip(" *-|•·>")
+        if not without_links:
+            continue
+        if len(stripped) < 200 and BOILERPLATE_RE.search(stripped):
+            continue
+        key = stripped.lower()
+        if key in seen and len(stripped) < 200:
+            continue
+        seen.add(key)
+        lines.append(stripped)
+    return "\n".join(lines).strip()
+
+
+def chunk_text(text: str, chunk_tokens: int = TOOL_CHUNK_TOKENS) -> List[str]:
+    """Split text into chunks of whole paragraphs, or sentences for long paragraphs."""
+    pieces: List[str] = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if count_tokens(paragraph) <= chunk_tokens:
+            pieces.append(paragraph)
+            continue
+        for sentence in SENTENCE_END_RE.split(paragraph):
+            # A "sentence" can still be a huge unpunctuated block
+            while count_tokens(sentence) > chunk_tokens:
+                head = truncate_to_tokens(sentence, chunk_tokens)
+                if not head:
+                    break
+                pieces.append(head)
+                sentence = sentence[len(head):].lstrip()
+            if sentence:
+                pieces.append(sentence)
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for piece in pieces:
+        tokens = count_tokens(piece)
+        if current and current_tokens + tokens > chunk_tokens:
+            chunks.append("\n".join(current))
+            current, current_tokens = [], 0
+        current.append(piece)
+        current_tokens += tokens
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def bm25_scores(query: str, chunks: Sequence[str]) -> List[float]:
+    """Okapi BM25 score of each chunk for the query."""
+    terms = set(tokenize(query))
+    documents = [Counter(tokenize(chunk)) for chunk in chunks]
+    if not terms or not documents:
+        return [0.0] * len(chunks)
+
+    lengths = [sum(document.values()) for document in documents]
+    average_length = (sum(lengths) / len(lengths)) or 1.0
+    document_frequency = {
+        term: sum(1 for document in documents if term in document) for term in terms
+    }
+    scores = []
+    for document, length in zip(documents, lengths):
+        score = 0.0
+        for term in terms:
+            frequency = document.get(term, 0)
+            if not frequency:
+                continue
+            df = document_frequency[term]
+            idf = math.log(1 + (len(documents) - df + 0.5) / (df + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+            score += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+        scores.append(score)
+    return scores
+
+
+def condense_documents(
+    documents: Sequence[Optional[str]],
+    query: Optional[str] = None,
+    max_tokens: int = TOOL_OUTPUT_MAX_TOKENS,
+    top_k: int = TOOL_OUTPUT_TOP_K,
+) -> List[str]:
+    """Keep the chunks of a tool call's pages that best match the query.
+
+    Chunks are ranked across all documents together, so irrelevant pages lose
+    their text to relevant ones. Kept chunks stay in page order.
+
+    Args:
+        documents: Text of each page (None for pages without text)
+        query: What the agent searched for; without one, leading chunks are kept
+        max_tokens: Token budget of all kept text together
+        top_k: Most chunks to keep
+
+    Returns:
+        List[str]: The condensed text of each document, empty if nothing was kept
+    """
+    chunks: List[Tuple[int, int, str]] = []  # (document, position, text)
+    for index, document in enumerate(documents):
+        for position, chunk in enumerate(chunk_text(strip_boilerplate(document or ""))):
+            chunks.append((index, position, chunk))
+    if not chunks:
+        return ["" for _ in documents]
+
+    if query and tokenize(query):
+        scores = bm25_scores(query, [chunk for _, _, chunk in chunks])
+        # Ties (e.g. no matching terms) keep the earlier chunk, pages' heads first
+        order = sorted(range(len(chunks)), key=lambda i: (-scores[i], chunks[i][1], chunks[i][0]))
+    else:
+        order = sorted(range(len(chunks)), key=lambda i: (chunks[i][1], chunks[i][0]))
+
+    kept: List[int] = []
+    remaining = max_tokens
+    for i in order:
+        if len(kept) >= top_k or remaining <= 0:
+            break
+        index, position, chunk = chunks[i]
+        tokens = count_tokens(chunk)
+        if tokens > remaining:
+            if kept:
+                continue
+            # A budget below one chunk still gets the head of the best chunk
+            chunks[i] = (index, position, truncate_to_tokens(chunk, remaining))
+            tokens = remaining
+        kept.append(i)
+        remaining -= tokens
+
+    selected: Dict[int, List[str]] = {}
+    for i in sorted(kept):
+        selected.setdefault(chunks[i][0], []).append(chunks[i][2])
+    return [CHUNK_SEPARATOR.join(selected.get(index, [])) for index in range(len(documents))]
+
+
+def condense_text(
+    text: str, query: Optional[str] = None, max_tokens: int = TOOL_OUTPUT_MAX_TOKENS
+) -> str:
+    """Condense a single page; see ``condense_documents``."""
+    return condense_documents([text], query, max_tokens)[0]
@@ -0,0 +1,352 @@
+"""
+Persistent, content-addressed cache for Exa searches.
+
+Every Exa call path (the agents' ExaTools and the flight tools in
+``tools/exa_flight.py``) goes through ``CachedExa``, which keys each call on the
+method, the normalized query and its parameters. Responses are stored as
+zlib-compressed JSON files under ``EXA_CACHE_DIR`` and reused until they are
+older than ``EXA_CACHE_TTL_SECONDS``.
+
+With ``EXA_CACHE_OFFLINE=true`` the cache never calls Exa: stored responses are
+served regardless of age and misses raise ``ExaCacheMiss``, so the pipeline
+can run against a pre-populated cache without network access or an API key.
+
+The agents' ``CachedExaTools`` additionally condense the page text of each
+response (see ``tools/condense.py``) before it reaches the model; the cache
+keeps the full responses.
+"""
+
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+from agno.tools.exa import ExaTools
+from exa_py import Exa
+from loguru import logger
+
+from services.http_gateway import gateway
+from tools.condense import TOOL_OUTPUT_MAX_TOKENS, condense_documents
+from tools.offload import run_blocking
+
+EXA_CACHE_ENABLED = os.getenv("EXA_CACHE_ENABLED", "true").lower() == "true"
+EXA_CACHE_DIR = os.getenv("EXA_CACHE_DIR", ".cache/exa")
+EXA_CACHE_TTL_SECONDS = int(os.getenv("EXA_CACHE_TTL_SECONDS", str(6 * 3600)))
+EXA_CACHE_OFFLINE = os.getenv("EXA_CACHE_OFFLINE", "false").lower() == "true"
+
+# Exa client methods whose responses are cached
+CACHED_METHODS = (
+    "search",
+    "search_and_contents",
+    "find_similar",
+    "find_similar_and_contents",
+    "get_contents",
+    "answer",
+)
+
+# Marks JSON objects that were response objects rather than plain dicts
+_OBJECT_MARKER = "__object__"
+
+
+class ExaCacheMiss(RuntimeError):
+    """Raised in offline mode when a search is not in the cache."""
+
+
+def normalize_query(query: Any) -> Any:
+    """Normalize a query so formatting differences hit the same cache entry."""
+    if isinstance(query, str):
+        return " ".join(query.split()).lower()
+    if isinstance(query, (list, tuple)):
+        return [normalize_query(item) for item in query]
+    return query
+
+
+def _encode(value: Any) -> Any:
+    """Convert an Exa response into JSON-serializable data."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = {f.name: _encode(getattr(value, f.name)) for f in dataclasses.fields(value)}
+        return {_OBJECT_MARKER: fields}
+    if isinstance(value, SimpleNamespace):
+        return {_OBJECT_MARKER: {k: _encode(v) for k, v in vars(value).items()}}
+    if isinstance(value, dict):
+        return {str(k): _encode(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _decode(value: Any) -> Any:
+    """Rebuild attribute-style response objects from cached data."""
+    if isinstance(value, dict):
+        if set(value) == {_OBJECT_MARKER}:
+            return SimpleNamespace(**{k: _decode(v) for k, v in value[_OBJECT_MARKER].items()})
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+class SearchCache:
+    """Compressed JSON files addressed by the hash of a search."""
+
+    def __init__(self, directory: str = EXA_CACHE_DIR, ttl_seconds: int = EXA_CACHE_TTL_SECONDS):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(method: str, query: Any, params: Dict[str, Any]) -> str:
+        """Build the content address of a search."""
+        payload = json.dumps(
+            {"method": method, "query": normalize_query(query), "params": params},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json.z")
+
+    def get(self, key: str, ignore_ttl: bool = False) -> Optional[Any]:
+        """Return the cached response for a key, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                entry = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error) as e:
+            logger.warning(f"Ignoring unreadable Exa cache entry {path}: {e}")
+            return None
+
+        if not ignore_ttl and time.time() - entry["stored_at"] > self.ttl_seconds:
+            return None
+        return _decode(entry["response"])
+
+    def set(self, key: str, method: str, query: Any, params: Dict[str, Any], response: Any) -> None:
+        """Store a response. Writes are atomic so concurrent readers never see partial files."""
+        entry = {
+            "stored_at": time.time(),
+            "method": method,
+            "query": query,
+            "params": params,
+            "response": _encode(response),
+        }
+        data = zlib.compress(json.dumps(entry, default=str).encode("utf-8"))
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write Exa cache entry {path}: {e}")
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+search_cache = SearchCache()
+
+
+class GatewayExa(Exa):
+    """Exa client whose requests go through the shared outbound HTTP gateway."""
+
+    def request(self, endpoint: str, data=None, *args, **kwargs):
+        if args or kwargs or (isinstance(data, dict) and data.get("stream")):
+            # Streaming and non-POST calls keep the SDK's own transport
+            return super().request(endpoint, data, *args, **kwargs)
+        response = gateway.request(
+            "exa", "POST", self.base_url + endpoint, json=data, headers=self.headers
+        )
+        if response.status_code != 200:
+            raise ValueError(
+                f"Request failed with status code {response.status_code}: {response.text}"
+            )
+        return response.json()
+
+
+class CachedExa:
+    """Drop-in replacement for the ``exa_py.Exa`` client that caches responses.
+
+    Calls to methods outside ``CACHED_METHODS`` are passed straight to the
+    underlying client.
+    """
+
+    def __init__(self, api_key: Optional[str] = None, cache: SearchCache = search_cache):
+        self.api_key = api_key or os.getenv("EXA_API_KEY")
+        self.cache = cache
+        self._client: Optional[GatewayExa] = None
+
+    @property
+    def client(self) -> GatewayExa:
+        if EXA_CACHE_OFFLINE:
+            raise ExaCacheMiss("Exa is not available in offline mode")
+        if self._client is None:
+            self._client = GatewayExa(api_key=self.api_key)
+        return self._client
+
+    def _call(self, method: str, query: Any, **params) -> Any:
+        if not EXA_CACHE_ENABLED and not EXA_CACHE_OFFLINE:
+            return getattr(self.client, method)(query, **params)
+
+        key = self.cache.make_key(method, query, params)
+        cached = self.cache.get(key, ignore_ttl=EXA_CACHE_OFFLINE)
+        if cached is not None:
+            self.cache.record(hit=True)
+            logger.debug(f"Exa cache hit for {method}: {query}")
+            return cached
+
+        self.cache.record(hit=False)
+        if EXA_CACHE_OFFLINE:
+            raise ExaCacheMiss(f"No cached Exa response for {method}: {query}")
+
+        response = getattr(self.client, method)(query, **params)
+        self.cache.set(key, method, query, params, response)
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name in CACHED_METHODS:
+            return lambda query, **params: self._call(name, query, **params)
+        return getattr(self.client, name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_exa(api_key: Optional[str] = None) -> CachedExa:
+    """Long-lived cached Exa client shared by every caller using the same key."""
+    return CachedExa(api_key)
+
+
+# Methods returning page text, and whether their query is a search phrase
+CONDENSED_METHODS = {
+    "search_and_contents": True,
+    "find_similar_and_contents": False,
+    "get_contents": False,
+}
+
+
+class CondensedExa:
+    """Exa client wrapper that trims the page text of responses to a token budget.
+
+    The text of all results is ranked against the search query together, so
+    a response costs at most ``max_tokens`` however many pages it returns.
+    Titles, URLs and highlights are kept for every result.
+    """
+
+    def __init__(self, exa: Any, max_tokens: int = TOOL_OUTPUT_MAX_TOKENS):
+        self.exa = exa
+        self.max_tokens = max_tokens
+
+    def _condense(self, method: str, query: Any, **params) -> Any:
+        response = getattr(self.exa, method)(query, **params)
+        results = getattr(response, "results", None) or []
+        texts = [getattr(result, "text", None) for result in results]
+        if not any(texts):
+            return response
+
+        search_query = query if CONDENSED_METHODS[method] and isinstance(query, str) else None
+        condensed = condense_documents(texts, search_query, self.max_tokens)
+        for result, text in zip(results, condensed):
+            if getattr(result, "text", None) is not None:
+                result.text = text
+        logger.debug(
+            f"Condensed Exa {method} text from {sum(len(t or '') for t in texts)} "
+            f"to {sum(len(t) for t in condensed)} characters"
+        )
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name in CONDENSED_METHODS:
+            return lambda query, **params: self._condense(name, query, **params)
+        return getattr(self.exa, name)
+
+
+class CachedExaTools(ExaTools):
+    """ExaTools whose searches go through the shared Exa search cache.
+
+    The tools are async: the Exa call, the cache and the condensing (CPU-bound
+    ranking) run in the tool thread pool, so a search never blocks the event
+    loop, not even while waiting for a gateway slot.
+
+    Args:
+        max_output_tokens: Token budget of the page text of one tool call
+    """
+
+    def __init__(self, *args, max_output_tokens: int = TOOL_OUTPUT_MAX_TOKENS, **kwargs):
+        if EXA_CACHE_OFFLINE and not (kwargs.get("api_key") or os.getenv("EXA_API_KEY")):
+            # The real client is never constructed offline, but ExaTools requires a key
+            kwargs["api_key"] = "offline"
+        super().__init__(*args, **kwargs)
+        self.exa = CondensedExa(get_shared_exa(self.api_key), max_output_tokens)
+
+    async def search_exa(self, query: str, num_results: int = 5, category: Optional[str] = None) -> str:
+        """Use this function to search Exa (a web search engine) for a query.
+
+        Args:
+            query (str): The query to search for.
+            num_results (int): Number of results to return. Defaults to 5.
+            category (Optional[str]): The category to filter search results.
+                Options are "company", "research paper", "news", "pdf", "github",
+                "tweet", "personal site", "linkedin profile", "financial report".
+
+        Returns:
+            str: The search results in JSON format.
+        """
+        return await run_blocking(ExaTools.search_exa, self, query, num_results, category)
+
+    async def get_contents(self, urls: list[str]) -> str:
+        """
+        Retrieve detailed content from specific URLs using the Exa API.
+
+        Args:
+            urls (list(str)): A list of URLs from which to fetch content.
+
+        Returns:
+            str: The search results in JSON format.
+        """
+        return await run_blocking(ExaTools.get_contents, self, urls)
+
+    async def find_similar(self, url: str, num_results: int = 5) -> str:
+        """
+        Find similar links to a given URL using the Exa API.
+
+        Args:
+            url (str): The URL for which to find similar links.
+            num_results (int, optional): The number of similar links to return. Defaults to 5.
+
+        Returns:
+            str: The search results in JSON format.
+        """
+        return await run_blocking(ExaTools.find_similar, self, url, num_results)
+
+    async def exa_answer(self, query: str, text: bool = False) -> str:
+        """
+        Get an LLM answer to a question informed by Exa search results.
+
+        Args:
+            query (str): The question or query to answer.
+            text (bool): Include full text from citation. Default is False.
+        Returns:
+            str: The answer results in JSON format with both generated answer and sources.
+        """
+        return await run_blocking(ExaTools.exa_answer, self, query, text)
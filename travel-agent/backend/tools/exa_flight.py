@@ -5,11 +5,25 @@ Uses Exa Search API to find flight information from various sources.
 from typing import Literal, List, Optional
 from loguru import logger
 from agno.tools import tool
-from config.logger import logger_hook
-from exa_py import Exa
+from config.logger import alogger_hook
+from tools.offload import run_blocking
+from tools.exa_cache import EXA_CACHE_OFFLINE, get_shared_exa
+import asyncio
 import os
 from dataclasses import dataclass
 
+# The formatters below only render titles, URLs and the first two highlights,
+# so full page text is only fetched when explicitly requested
+EXA_FLIGHT_INCLUDE_TEXT = os.getenv("EXA_FLIGHT_INCLUDE_TEXT", "false").lower() == "true"
+HIGHLIGHT_OPTIONS = {"num_sentences": 3, "highlights_per_url": 2}
+
+
+def _content_options() -> dict:
+    """Exa contents to request for flight searches."""
+    if EXA_FLIGHT_INCLUDE_TEXT:
+        return {"text": True, "highlights": HIGHLIGHT_OPTIONS}
+    return {"highlights": HIGHLIGHT_OPTIONS}
+
 
 @dataclass
 class ExaFlightResult:
@@ -23,8 +37,8 @@ class ExaFlightResult:
     stops: str = "Direct or 1+ stops"
 
 
-@tool(name="search_flights_exa", show_result=True, tool_hooks=[logger_hook])
-def search_flights_exa(
+@tool(name="search_flights_exa", show_result=True, tool_hooks=[alogger_hook])
+async def search_flights_exa(
     departure_city: str,
     destination_city: str,
     departure_date: str,
@@ -47,14 +61,14 @@ def search_flights_exa(
     """
     
     api_key = os.getenv("EXA_API_KEY")
-    if not api_key:
+    if not api_key and not EXA_CACHE_OFFLINE:
         logger.error("EXA_API_KEY not set in environment variables")
         return "Error: Exa API key not configured. Please set EXA_API_KEY environment variable."
     
     logger.info(f"Searching flights from {departure_city} to {destination_city} on {departure_date}")
     
     try:
-        exa = Exa(api_key=api_key)
+        exa = get_shared_exa(api_key)
         
         # Create search query for flights
         trip_type = "round trip" if return_date else "one-way"
@@ -63,22 +77,22 @@ def search_flights_exa(
         # Also search for specific airline routes
         airline_query = f"airlines flying {departure_city} to {destination_city} schedule prices"
         
-        # Perform search
-        results = exa.search_and_contents(
-            query=search_query,
-            type="auto",
-            num_results=10,
-            text=True,
-            highlights=True,
-        )
-        
-        # Also get airline-specific results
-        airline_results = exa.search_and_contents(
-            query=airline_query,
-            type="auto",
-            num_results=5,
-            text=True,
-            highlights=True,
+        # Run the route and airline searches concurrently
+        results, airline_results = await asyncio.gather(
+            run_blocking(
+                exa.search_and_contents,
+                query=search_query,
+                type="auto",
+                num_results=8,
+                **_content_options(),
+            ),
+            run_blocking(
+                exa.search_and_contents,
+                query=airline_query,
+                type="auto",
+                num_results=3,
+                **_content_options(),
+            ),
         )
         
         # Combine and format results
@@ -132,8 +146,8 @@ def search_flights_exa(
         return f"Error searching for flights: {str(e)}"
 
 
-@tool(name="get_flight_prices", show_result=True, tool_hooks=[logger_hook])
-def get_flight_prices(
+@tool(name="get_flight_prices", show_result=True, tool_hooks=[alogger_hook])
+async def get_flight_prices(
     departure_airport: str,
     destination_airport: str,
     month_year: str,
@@ -148,21 +162,21 @@ def get_flight_prices(
     """
     
     api_key = os.getenv("EXA_API_KEY")
-    if not api_key:
+    if not api_key and not EXA_CACHE_OFFLINE:
         logger.error("EXA_API_KEY not set")
         return "Error: Exa API key not configured."
     
     try:
-        exa = Exa(api_key=api_key)
+        exa = get_shared_exa(api_key)
         
         search_query = f"flight prices {departure_airport} to {destination_airport} {month_year} average cost cheap flights"
         
-        results = exa.search_and_contents(
+        results = await run_blocking(
+            exa.search_and_contents,
             query=search_query,
             type="auto",
-            num_results=8,
-            text=True,
-            highlights=True,
+            num_results=6,
+            **_content_options(),
         )
         
         price_info = []
@@ -2,11 +2,20 @@ from fast_flights import FlightData, Passengers, Result, get_flights
 from typing import Literal
 from loguru import logger
 from agno.tools import tool
-from config.logger import logger_hook
+from config.logger import alogger_hook
+from services.http_gateway import gateway
+from tools.offload import run_blocking
 
 
-@tool(name="get_flights", show_result=True, tool_hooks=[logger_hook])
-def get_google_flights(
+def _fetch_google_flights(**kwargs) -> Result:
+    # fast_flights owns its HTTP client; track the call so it still counts
+    # against the gateway's per-host cap and stats
+    with gateway.track("google_flights", "www.google.com"):
+        return get_flights(**kwargs)
+
+
+@tool(name="get_flights", show_result=True, tool_hooks=[alogger_hook])
+async def get_google_flights(
     departure: str,
     destination: str,
     date: str,
@@ -33,7 +42,9 @@ def get_google_flights(
     )
 
     try:
-        result: Result = get_flights(
+        # fast_flights fetches synchronously; keep it off the event loop
+        result: Result = await run_blocking(
+            _fetch_google_flights,
             flight_data=[
                 FlightData(date=date, from_airport=departure, to_airport=destination)
             ],
@@ -0,0 +1,41 @@
+"""
+Bounded thread pool for running blocking tool code off the event loop.
+
+Third-party clients used by the tools (Firecrawl, Exa, fast_flights) are
+synchronous. Calling them directly from an async agent run blocks the uvicorn
+event loop, freezing every other plan and even ``/api/health``. Async tools
+hand that work to this pool instead; its size caps how many blocking calls run
+at once, and further calls wait in the pool's queue without blocking the loop.
+"""
+
+import asyncio
+import contextvars
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+TOOL_THREADPOOL_SIZE = int(os.getenv("TOOL_THREADPOOL_SIZE", "16"))
+
+_executor = ThreadPoolExecutor(max_workers=TOOL_THREADPOOL_SIZE, thread_name_prefix="tool")
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function in the tool thread pool and await its result.
+
+    Args:
+        func: The blocking function
+        *args: Positional arguments for ``func``
+        **kwargs: Keyword arguments for ``func``
+
+    Returns:
+        The return value of ``func``
+    """
+    loop = asyncio.get_running_loop()
+    # Carry context variables (e.g. logging context) into the worker thread
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_executor, call)
+
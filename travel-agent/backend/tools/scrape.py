@@ -1,22 +1,50 @@
-from firecrawl import FirecrawlApp
 import os
+from typing import Optional
 from agno.tools import tool
 from loguru import logger
-from config.logger import logger_hook
+from config.logger import alogger_hook
+from services.http_gateway import gateway
+from tools.condense import condense_text
+from tools.offload import run_blocking
 
-app = FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
+FIRECRAWL_API_URL = os.getenv("FIRECRAWL_API_URL", "https://api.firecrawl.dev")
+
+
+def scrape_markdown(url: str) -> str:
+    """Scrape a page to markdown with Firecrawl's scrape API via the HTTP gateway.
+
+    Args:
+        url (str): The URL of the website to scrape.
+
+    Returns:
+        str: The markdown content of the website.
+    """
+    response = gateway.request(
+        "firecrawl",
+        "POST",
+        f"{FIRECRAWL_API_URL}/v1/scrape",
+        json={"url": url, "formats": ["markdown"]},
+        headers={"Authorization": f"Bearer {os.getenv('FIRECRAWL_API_KEY')}"},
+    )
+    payload = response.json()
+    if response.status_code != 200 or not payload.get("success"):
+        raise RuntimeError(payload.get("error") or f"status code {response.status_code}")
+    return (payload.get("data") or {}).get("markdown") or "No content found"
 
 
 @tool(
     name="scrape_website",
     description="Scrape a website and return the markdown content.",
-    tool_hooks=[logger_hook],
+    tool_hooks=[alogger_hook],
 )
-def scrape_website(url: str) -> str:
+async def scrape_website(url: str, query: Optional[str] = None) -> str:
     """Scrape a website and return the markdown content.
 
+    Long pages are cut down to the passages most relevant to ``query``.
+
     Args:
         url (str): The URL of the website to scrape.
+        query (str, optional): What you are looking for on the page, e.g. "opening hours and ticket prices".
 
     Returns:
         str: The markdown content of the website.
@@ -26,16 +54,10 @@ def scrape_website(url: str) -> str:
         "## Google"
     """
     try:
-        scrape_status = app.scrape(
-            url,
-            formats=["markdown"],
-        )
-        # Handle both dict and Document object response types
-        if hasattr(scrape_status, 'markdown'):
-            return scrape_status.markdown or "No content found"
-        elif isinstance(scrape_status, dict):
-            return scrape_status.get("markdown", "No content found")
-        return "No content found"
+        # The request is blocking; keep it off the event loop
+        markdown = await run_blocking(scrape_markdown, url)
     except Exception as e:
         logger.error(f"Firecrawl scrape error for {url}: {e}")
         return f"Error scraping website: {str(e)}"
+    # Ranking a long page is CPU work; keep that off the event loop too
+    return await run_blocking(condense_text, markdown, query) or "No content found"
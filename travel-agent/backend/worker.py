@@ -0,0 +1,41 @@
+import asyncio
+from dotenv import load_dotenv
+from loguru import logger
+
+# Load environment variables
+logger.info("Loading environment variables")
+load_dotenv()
+logger.info("Environment variables loaded")
+
+# Import and setup logging configuration
+from config.logger import setup_logging
+
+# Configure logging with loguru
+setup_logging(console_level="INFO")
+
+from config.tokenizer import load_tokenizer
+from services.db_service import initialize_db_pool, close_db_pool
+from services.plan_worker import PlanWorker
+from services.plan_recovery import recover_orphaned_plans
+from services.status_writer import status_writer
+
+
+async def run_worker():
+    await initialize_db_pool()
+    await asyncio.to_thread(load_tokenizer)
+    try:
+        # Requeue plans orphaned by a previous crash before claiming work
+        await recover_orphaned_plans()
+        await PlanWorker().run_forever()
+    finally:
+        # Write status updates still waiting in the debounce window
+        await status_writer.flush()
+        await close_db_pool()
+
+
+if __name__ == "__main__":
+    logger.info("Starting TripCraft AI plan worker")
+    try:
+        asyncio.run(run_worker())
+    except KeyboardInterrupt:
+        logger.info("Plan worker stopped")
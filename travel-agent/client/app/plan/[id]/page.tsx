@@ -276,8 +276,12 @@ export default function TripDetailsPage() {
 
         if (tripPlan.output?.itinerary) {
           try {
-            // First parse the outer JSON string
-            const parsedOutput = JSON.parse(tripPlan.output.itinerary);
+            // Stored as JSON; older outputs were saved as a JSON string
+            const storedOutput = tripPlan.output.itinerary;
+            const parsedOutput =
+              typeof storedOutput === "string"
+                ? JSON.parse(storedOutput)
+                : storedOutput;
             console.log("Parsed output:", parsedOutput);
 
             // Extract agent responses from the parsed JSON
@@ -291,8 +295,12 @@ export default function TripDetailsPage() {
               parsedOutput.itinerary_agent_response || "";
 
             if (parsedOutput.itinerary) {
-              // Then parse the inner JSON string to get the actual itinerary
-              itinerary = JSON.parse(parsedOutput.itinerary) as Itinerary;
+              // Older outputs nest the itinerary as a JSON string too
+              itinerary = (
+                typeof parsedOutput.itinerary === "string"
+                  ? JSON.parse(parsedOutput.itinerary)
+                  : parsedOutput.itinerary
+              ) as Itinerary;
               console.log("Parsed itinerary:", itinerary);
             }
           } catch (e) {
@@ -234,7 +234,12 @@ exports.Prisma.Plan_tasksScalarFieldEnum = {
   output_data: 'output_data',
   error_message: 'error_message',
   created_at: 'created_at',
-  updated_at: 'updated_at'
+  updated_at: 'updated_at',
+  attempts: 'attempts',
+  worker_id: 'worker_id',
+  lease_expires_at: 'lease_expires_at',
+  heartbeat_at: 'heartbeat_at',
+  fingerprint: 'fingerprint'
 };
 
 exports.Prisma.SortOrder = {
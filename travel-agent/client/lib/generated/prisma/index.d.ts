@@ -8180,7 +8180,6 @@ export namespace Prisma {
   export type TripPlanOutputMinAggregateOutputType = {
     id: string | null
     tripPlanId: string | null
-    itinerary: string | null
     summary: string | null
     createdAt: Date | null
     updatedAt: Date | null
@@ -8189,7 +8188,6 @@ export namespace Prisma {
   export type TripPlanOutputMaxAggregateOutputType = {
     id: string | null
     tripPlanId: string | null
-    itinerary: string | null
     summary: string | null
     createdAt: Date | null
     updatedAt: Date | null
@@ -8209,7 +8207,6 @@ export namespace Prisma {
   export type TripPlanOutputMinAggregateInputType = {
     id?: true
     tripPlanId?: true
-    itinerary?: true
     summary?: true
     createdAt?: true
     updatedAt?: true
@@ -8218,7 +8215,6 @@ export namespace Prisma {
   export type TripPlanOutputMaxAggregateInputType = {
     id?: true
     tripPlanId?: true
-    itinerary?: true
     summary?: true
     createdAt?: true
     updatedAt?: true
@@ -8309,7 +8305,7 @@ export namespace Prisma {
   export type TripPlanOutputGroupByOutputType = {
     id: string
     tripPlanId: string
-    itinerary: string
+    itinerary: JsonValue
     summary: string | null
     createdAt: Date
     updatedAt: Date
@@ -8390,7 +8386,7 @@ export namespace Prisma {
     scalars: $Extensions.GetPayloadResult<{
       id: string
       tripPlanId: string
-      itinerary: string
+      itinerary: Prisma.JsonValue
       summary: string | null
       createdAt: Date
       updatedAt: Date
@@ -8820,7 +8816,7 @@ export namespace Prisma {
   interface TripPlanOutputFieldRefs {
     readonly id: FieldRef<"TripPlanOutput", 'String'>
     readonly tripPlanId: FieldRef<"TripPlanOutput", 'String'>
-    readonly itinerary: FieldRef<"TripPlanOutput", 'String'>
+    readonly itinerary: FieldRef<"TripPlanOutput", 'Json'>
     readonly summary: FieldRef<"TripPlanOutput", 'String'>
     readonly createdAt: FieldRef<"TripPlanOutput", 'DateTime'>
     readonly updatedAt: FieldRef<"TripPlanOutput", 'DateTime'>
@@ -10699,10 +10695,12 @@ export namespace Prisma {
 
   export type Plan_tasksAvgAggregateOutputType = {
     id: number | null
+    attempts: number | null
   }
 
   export type Plan_tasksSumAggregateOutputType = {
     id: number | null
+    attempts: number | null
   }
 
   export type Plan_tasksMinAggregateOutputType = {
@@ -10713,6 +10711,11 @@ export namespace Prisma {
     error_message: string | null
     created_at: Date | null
     updated_at: Date | null
+    attempts: number | null
+    worker_id: string | null
+    lease_expires_at: Date | null
+    heartbeat_at: Date | null
+    fingerprint: string | null
   }
 
   export type Plan_tasksMaxAggregateOutputType = {
@@ -10723,6 +10726,11 @@ export namespace Prisma {
     error_message: string | null
     created_at: Date | null
     updated_at: Date | null
+    attempts: number | null
+    worker_id: string | null
+    lease_expires_at: Date | null
+    heartbeat_at: Date | null
+    fingerprint: string | null
   }
 
   export type Plan_tasksCountAggregateOutputType = {
@@ -10735,16 +10743,23 @@ export namespace Prisma {
     error_message: number
     created_at: number
     updated_at: number
+    attempts: number
+    worker_id: number
+    lease_expires_at: number
+    heartbeat_at: number
+    fingerprint: number
     _all: number
   }
 
 
   export type Plan_tasksAvgAggregateInputType = {
     id?: true
+    attempts?: true
   }
 
   export type Plan_tasksSumAggregateInputType = {
     id?: true
+    attempts?: true
   }
 
   export type Plan_tasksMinAggregateInputType = {
@@ -10755,6 +10770,11 @@ export namespace Prisma {
     error_message?: true
     created_at?: true
     updated_at?: true
+    attempts?: true
+    worker_id?: true
+    lease_expires_at?: true
+    heartbeat_at?: true
+    fingerprint?: true
   }
 
   export type Plan_tasksMaxAggregateInputType = {
@@ -10765,6 +10785,11 @@ export namespace Prisma {
     error_message?: true
     created_at?: true
     updated_at?: true
+    attempts?: true
+    worker_id?: true
+    lease_expires_at?: true
+    heartbeat_at?: true
+    fingerprint?: true
   }
 
   export type Plan_tasksCountAggregateInputType = {
@@ -10777,6 +10802,11 @@ export namespace Prisma {
     error_message?: true
     created_at?: true
     updated_at?: true
+    attempts?: true
+    worker_id?: true
+    lease_expires_at?: true
+    heartbeat_at?: true
+    fingerprint?: true
     _all?: true
   }
 
@@ -10876,6 +10906,11 @@ export namespace Prisma {
     error_message: string | null
     created_at: Date | null
     updated_at: Date | null
+    attempts: number
+    worker_id: string | null
+    lease_expires_at: Date | null
+    heartbeat_at: Date | null
+    fingerprint: string | null
     _count: Plan_tasksCountAggregateOutputType | null
     _avg: Plan_tasksAvgAggregateOutputType | null
     _sum: Plan_tasksSumAggregateOutputType | null
@@ -10907,6 +10942,11 @@ export namespace Prisma {
     error_message?: boolean
     created_at?: boolean
     updated_at?: boolean
+    attempts?: boolean
+    worker_id?: boolean
+    lease_expires_at?: boolean
+    heartbeat_at?: boolean
+    fingerprint?: boolean
   }, ExtArgs["result"]["plan_tasks"]>
 
   export type plan_tasksSelectCreateManyAndReturn<ExtArgs extends $Extensions.InternalArgs = $Extensions.DefaultArgs> = $Extensions.GetSelect<{
@@ -10919,6 +10959,11 @@ export namespace Prisma {
     error_message?: boolean
     created_at?: boolean
     updated_at?: boolean
+    attempts?: boolean
+    worker_id?: boolean
+    lease_expires_at?: boolean
+    heartbeat_at?: boolean
+    fingerprint?: boolean
   }, ExtArgs["result"]["plan_tasks"]>
 
   export type plan_tasksSelectUpdateManyAndReturn<ExtArgs extends $Extensions.InternalArgs = $Extensions.DefaultArgs> = $Extensions.GetSelect<{
@@ -10931,6 +10976,11 @@ export namespace Prisma {
     error_message?: boolean
     created_at?: boolean
     updated_at?: boolean
+    attempts?: boolean
+    worker_id?: boolean
+    lease_expires_at?: boolean
+    heartbeat_at?: boolean
+    fingerprint?: boolean
   }, ExtArgs["result"]["plan_tasks"]>
 
   export type plan_tasksSelectScalar = {
@@ -10943,9 +10993,14 @@ export namespace Prisma {
     error_message?: boolean
     created_at?: boolean
     updated_at?: boolean
+    attempts?: boolean
+    worker_id?: boolean
+    lease_expires_at?: boolean
+    heartbeat_at?: boolean
+    fingerprint?: boolean
   }
 
-  export type plan_tasksOmit<ExtArgs extends $Extensions.InternalArgs = $Extensions.DefaultArgs> = $Extensions.GetOmit<"id" | "trip_plan_id" | "task_type" | "status" | "input_data" | "output_data" | "error_message" | "created_at" | "updated_at", ExtArgs["result"]["plan_tasks"]>
+  export type plan_tasksOmit<ExtArgs extends $Extensions.InternalArgs = $Extensions.DefaultArgs> = $Extensions.GetOmit<"id" | "trip_plan_id" | "task_type" | "status" | "input_data" | "output_data" | "error_message" | "created_at" | "updated_at" | "attempts" | "worker_id" | "lease_expires_at" | "heartbeat_at" | "fingerprint", ExtArgs["result"]["plan_tasks"]>
 
   export type $plan_tasksPayload<ExtArgs extends $Extensions.InternalArgs = $Extensions.DefaultArgs> = {
     name: "plan_tasks"
@@ -10960,6 +11015,11 @@ export namespace Prisma {
       error_message: string | null
       created_at: Date | null
       updated_at: Date | null
+      attempts: number
+      worker_id: string | null
+      lease_expires_at: Date | null
+      heartbeat_at: Date | null
+      fingerprint: string | null
     }, ExtArgs["result"]["plan_tasks"]>
     composites: {}
   }
@@ -11392,6 +11452,11 @@ export namespace Prisma {
     readonly error_message: FieldRef<"plan_tasks", 'String'>
     readonly created_at: FieldRef<"plan_tasks", 'DateTime'>
     readonly updated_at: FieldRef<"plan_tasks", 'DateTime'>
+    readonly attempts: FieldRef<"plan_tasks", 'Int'>
+    readonly worker_id: FieldRef<"plan_tasks", 'String'>
+    readonly lease_expires_at: FieldRef<"plan_tasks", 'DateTime'>
+    readonly heartbeat_at: FieldRef<"plan_tasks", 'DateTime'>
+    readonly fingerprint: FieldRef<"plan_tasks", 'String'>
   }
     
 
@@ -11909,7 +11974,12 @@ export namespace Prisma {
     output_data: 'output_data',
     error_message: 'error_message',
     created_at: 'created_at',
-    updated_at: 'updated_at'
+    updated_at: 'updated_at',
+    attempts: 'attempts',
+    worker_id: 'worker_id',
+    lease_expires_at: 'lease_expires_at',
+    heartbeat_at: 'heartbeat_at',
+    fingerprint: 'fingerprint'
   };
 
   export type Plan_tasksScalarFieldEnum = (typeof Plan_tasksScalarFieldEnum)[keyof typeof Plan_tasksScalarFieldEnum]
@@ -12483,7 +12553,7 @@ export namespace Prisma {
     NOT?: TripPlanOutputWhereInput | TripPlanOutputWhereInput[]
     id?: StringFilter<"TripPlanOutput"> | string
     tripPlanId?: StringFilter<"TripPlanOutput"> | string
-    itinerary?: StringFilter<"TripPlanOutput"> | string
+    itinerary?: JsonFilter<"TripPlanOutput">
     summary?: StringNullableFilter<"TripPlanOutput"> | string | null
     createdAt?: DateTimeFilter<"TripPlanOutput"> | Date | string
     updatedAt?: DateTimeFilter<"TripPlanOutput"> | Date | string
@@ -12506,7 +12576,7 @@ export namespace Prisma {
     AND?: TripPlanOutputWhereInput | TripPlanOutputWhereInput[]
     OR?: TripPlanOutputWhereInput[]
     NOT?: TripPlanOutputWhereInput | TripPlanOutputWhereInput[]
-    itinerary?: StringFilter<"TripPlanOutput"> | string
+    itinerary?: JsonFilter<"TripPlanOutput">
     summary?: StringNullableFilter<"TripPlanOutput"> | string | null
     createdAt?: DateTimeFilter<"TripPlanOutput"> | Date | string
     updatedAt?: DateTimeFilter<"TripPlanOutput"> | Date | string
@@ -12531,7 +12601,7 @@ export namespace Prisma {
     NOT?: TripPlanOutputScalarWhereWithAggregatesInput | TripPlanOutputScalarWhereWithAggregatesInput[]
     id?: StringWithAggregatesFilter<"TripPlanOutput"> | string
     tripPlanId?: StringWithAggregatesFilter<"TripPlanOutput"> | string
-    itinerary?: StringWithAggregatesFilter<"TripPlanOutput"> | string
+    itinerary?: JsonWithAggregatesFilter<"TripPlanOutput">
     summary?: StringNullableWithAggregatesFilter<"TripPlanOutput"> | string | null
     createdAt?: DateTimeWithAggregatesFilter<"TripPlanOutput"> | Date | string
     updatedAt?: DateTimeWithAggregatesFilter<"TripPlanOutput"> | Date | string
@@ -12723,6 +12793,11 @@ export namespace Prisma {
     error_message?: StringNullableFilter<"plan_tasks"> | string | null
     created_at?: DateTimeNullableFilter<"plan_tasks"> | Date | string | null
     updated_at?: DateTimeNullableFilter<"plan_tasks"> | Date | string | null
+    attempts?: IntFilter<"plan_tasks"> | number
+    worker_id?: StringNullableFilter<"plan_tasks"> | string | null
+    lease_expires_at?: DateTimeNullableFilter<"plan_tasks"> | Date | string | null
+    heartbeat_at?: DateTimeNullableFilter<"plan_tasks"> | Date | string | null
+    fingerprint?: StringNullableFilter<"plan_tasks"> | string | null
   }
 
   export type plan_tasksOrderByWithRelationInput = {
@@ -12735,6 +12810,11 @@ export namespace Prisma {
     error_message?: SortOrderInput | SortOrder
     created_at?: SortOrderInput | SortOrder
     updated_at?: SortOrderInput | SortOrder
+    attempts?: SortOrder
+    worker_id?: SortOrderInput | SortOrder
+    lease_expires_at?: SortOrderInput | SortOrder
+    heartbeat_at?: SortOrderInput | SortOrder
+    fingerprint?: SortOrderInput | SortOrder
   }
 
   export type plan_tasksWhereUniqueInput = Prisma.AtLeast<{
@@ -12750,6 +12830,11 @@ export namespace Prisma {
     error_message?: StringNullableFilter<"plan_tasks"> | string | null
     created_at?: DateTimeNullableFilter<"plan_tasks"> | Date | string | null
     updated_at?: DateTimeNullableFilter<"plan_tasks"> | Date | string | null
+    attempts?: IntFilter<"plan_tasks"> | number
+    worker_id?: StringNullableFilter<"plan_tasks"> | string | null
+    lease_expires_at?: DateTimeNullableFilter<"plan_tasks"> | Date | string | null
+    heartbeat_at?: DateTimeNullableFilter<"plan_tasks"> | Date | string | null
+    fingerprint?: StringNullableFilter<"plan_tasks"> | string | null
   }, "id">
 
   export type plan_tasksOrderByWithAggregationInput = {
@@ -12762,6 +12847,11 @@ export namespace Prisma {
     error_message?: SortOrderInput | SortOrder
     created_at?: SortOrderInput | SortOrder
     updated_at?: SortOrderInput | SortOrder
+    attempts?: SortOrder
+    worker_id?: SortOrderInput | SortOrder
+    lease_expires_at?: SortOrderInput | SortOrder
+    heartbeat_at?: SortOrderInput | SortOrder
+    fingerprint?: SortOrderInput | SortOrder
     _count?: plan_tasksCountOrderByAggregateInput
     _avg?: plan_tasksAvgOrderByAggregateInput
     _max?: plan_tasksMaxOrderByAggregateInput
@@ -12782,6 +12872,11 @@ export namespace Prisma {
     error_message?: StringNullableWithAggregatesFilter<"plan_tasks"> | string | null
     created_at?: DateTimeNullableWithAggregatesFilter<"plan_tasks"> | Date | string | null
     updated_at?: DateTimeNullableWithAggregatesFilter<"plan_tasks"> | Date | string | null
+    attempts?: IntWithAggregatesFilter<"plan_tasks"> | number
+    worker_id?: StringNullableWithAggregatesFilter<"plan_tasks"> | string | null
+    lease_expires_at?: DateTimeNullableWithAggregatesFilter<"plan_tasks"> | Date | string | null
+    heartbeat_at?: DateTimeNullableWithAggregatesFilter<"plan_tasks"> | Date | string | null
+    fingerprint?: StringNullableWithAggregatesFilter<"plan_tasks"> | string | null
   }
 
   export type UserCreateInput = {
@@ -13250,7 +13345,7 @@ export namespace Prisma {
 
   export type TripPlanOutputCreateInput = {
     id?: string
-    itinerary: string
+    itinerary: JsonNullValueInput | InputJsonValue
     summary?: string | null
     createdAt?: Date | string
     updatedAt?: Date | string
@@ -13260,7 +13355,7 @@ export namespace Prisma {
   export type TripPlanOutputUncheckedCreateInput = {
     id?: string
     tripPlanId: string
-    itinerary: string
+    itinerary: JsonNullValueInput | InputJsonValue
     summary?: string | null
     createdAt?: Date | string
     updatedAt?: Date | string
@@ -13268,7 +13363,7 @@ export namespace Prisma {
 
   export type TripPlanOutputUpdateInput = {
     id?: StringFieldUpdateOperationsInput | string
-    itinerary?: StringFieldUpdateOperationsInput | string
+    itinerary?: JsonNullValueInput | InputJsonValue
     summary?: NullableStringFieldUpdateOperationsInput | string | null
     createdAt?: DateTimeFieldUpdateOperationsInput | Date | string
     updatedAt?: DateTimeFieldUpdateOperationsInput | Date | string
@@ -13278,7 +13373,7 @@ export namespace Prisma {
   export type TripPlanOutputUncheckedUpdateInput = {
     id?: StringFieldUpdateOperationsInput | string
     tripPlanId?: StringFieldUpdateOperationsInput | string
-    itinerary?: StringFieldUpdateOperationsInput | string
+    itinerary?: JsonNullValueInput | InputJsonValue
     summary?: NullableStringFieldUpdateOperationsInput | string | null
     createdAt?: DateTimeFieldUpdateOperationsInput | Date | string
     updatedAt?: DateTimeFieldUpdateOperationsInput | Date | string
@@ -13287,7 +13382,7 @@ export namespace Prisma {
   export type TripPlanOutputCreateManyInput = {
     id?: string
     tripPlanId: string
-    itinerary: string
+    itinerary: JsonNullValueInput | InputJsonValue
     summary?: string | null
     createdAt?: Date | string
     updatedAt?: Date | string
@@ -13295,7 +13390,7 @@ export namespace Prisma {
 
   export type TripPlanOutputUpdateManyMutationInput = {
     id?: StringFieldUpdateOperationsInput | string
-    itinerary?: StringFieldUpdateOperationsInput | string
+    itinerary?: JsonNullValueInput | InputJsonValue
     summary?: NullableStringFieldUpdateOperationsInput | string | null
     createdAt?: DateTimeFieldUpdateOperationsInput | Date | string
     updatedAt?: DateTimeFieldUpdateOperationsInput | Date | string
@@ -13304,7 +13399,7 @@ export namespace Prisma {
   export type TripPlanOutputUncheckedUpdateManyInput = {
     id?: StringFieldUpdateOperationsInput | string
     tripPlanId?: StringFieldUpdateOperationsInput | string
-    itinerary?: StringFieldUpdateOperationsInput | string
+    itinerary?: JsonNullValueInput | InputJsonValue
     summary?: NullableStringFieldUpdateOperationsInput | string | null
     createdAt?: DateTimeFieldUpdateOperationsInput | Date | string
     updatedAt?: DateTimeFieldUpdateOperationsInput | Date | string
@@ -13536,6 +13631,11 @@ export namespace Prisma {
     error_message?: string | null
     created_at?: Date | string | null
     updated_at?: Date | string | null
+    attempts?: number
+    worker_id?: string | null
+    lease_expires_at?: Date | string | null
+    heartbeat_at?: Date | string | null
+    fingerprint?: string | null
   }
 
   export type plan_tasksUncheckedCreateInput = {
@@ -13548,6 +13648,11 @@ export namespace Prisma {
     error_message?: string | null
     created_at?: Date | string | null
     updated_at?: Date | string | null
+    attempts?: number
+    worker_id?: string | null
+    lease_expires_at?: Date | string | null
+    heartbeat_at?: Date | string | null
+    fingerprint?: string | null
   }
 
   export type plan_tasksUpdateInput = {
@@ -13559,6 +13664,11 @@ export namespace Prisma {
     error_message?: NullableStringFieldUpdateOperationsInput | string | null
     created_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
     updated_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
+    attempts?: IntFieldUpdateOperationsInput | number
+    worker_id?: NullableStringFieldUpdateOperationsInput | string | null
+    lease_expires_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
+    heartbeat_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
+    fingerprint?: NullableStringFieldUpdateOperationsInput | string | null
   }
 
   export type plan_tasksUncheckedUpdateInput = {
@@ -13571,6 +13681,11 @@ export namespace Prisma {
     error_message?: NullableStringFieldUpdateOperationsInput | string | null
     created_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
     updated_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
+    attempts?: IntFieldUpdateOperationsInput | number
+    worker_id?: NullableStringFieldUpdateOperationsInput | string | null
+    lease_expires_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
+    heartbeat_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
+    fingerprint?: NullableStringFieldUpdateOperationsInput | string | null
   }
 
   export type plan_tasksCreateManyInput = {
@@ -13583,6 +13698,11 @@ export namespace Prisma {
     error_message?: string | null
     created_at?: Date | string | null
     updated_at?: Date | string | null
+    attempts?: number
+    worker_id?: string | null
+    lease_expires_at?: Date | string | null
+    heartbeat_at?: Date | string | null
+    fingerprint?: string | null
   }
 
   export type plan_tasksUpdateManyMutationInput = {
@@ -13594,6 +13714,11 @@ export namespace Prisma {
     error_message?: NullableStringFieldUpdateOperationsInput | string | null
     created_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
     updated_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
+    attempts?: IntFieldUpdateOperationsInput | number
+    worker_id?: NullableStringFieldUpdateOperationsInput | string | null
+    lease_expires_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
+    heartbeat_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
+    fingerprint?: NullableStringFieldUpdateOperationsInput | string | null
   }
 
   export type plan_tasksUncheckedUpdateManyInput = {
@@ -13606,6 +13731,11 @@ export namespace Prisma {
     error_message?: NullableStringFieldUpdateOperationsInput | string | null
     created_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
     updated_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
+    attempts?: IntFieldUpdateOperationsInput | number
+    worker_id?: NullableStringFieldUpdateOperationsInput | string | null
+    lease_expires_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
+    heartbeat_at?: NullableDateTimeFieldUpdateOperationsInput | Date | string | null
+    fingerprint?: NullableStringFieldUpdateOperationsInput | string | null
   }
 
   export type StringFilter<$PrismaModel = never> = {
@@ -13989,7 +14119,6 @@ export namespace Prisma {
   export type TripPlanOutputMaxOrderByAggregateInput = {
     id?: SortOrder
     tripPlanId?: SortOrder
-    itinerary?: SortOrder
     summary?: SortOrder
     createdAt?: SortOrder
     updatedAt?: SortOrder
@@ -13998,7 +14127,6 @@ export namespace Prisma {
   export type TripPlanOutputMinOrderByAggregateInput = {
     id?: SortOrder
     tripPlanId?: SortOrder
-    itinerary?: SortOrder
     summary?: SortOrder
     createdAt?: SortOrder
     updatedAt?: SortOrder
@@ -14279,10 +14407,16 @@ export namespace Prisma {
     error_message?: SortOrder
     created_at?: SortOrder
     updated_at?: SortOrder
+    attempts?: SortOrder
+    worker_id?: SortOrder
+    lease_expires_at?: SortOrder
+    heartbeat_at?: SortOrder
+    fingerprint?: SortOrder
   }
 
   export type plan_tasksAvgOrderByAggregateInput = {
     id?: SortOrder
+    attempts?: SortOrder
   }
 
   export type plan_tasksMaxOrderByAggregateInput = {
@@ -14293,6 +14427,11 @@ export namespace Prisma {
     error_message?: SortOrder
     created_at?: SortOrder
     updated_at?: SortOrder
+    attempts?: SortOrder
+    worker_id?: SortOrder
+    lease_expires_at?: SortOrder
+    heartbeat_at?: SortOrder
+    fingerprint?: SortOrder
   }
 
   export type plan_tasksMinOrderByAggregateInput = {
@@ -14303,10 +14442,16 @@ export namespace Prisma {
     error_message?: SortOrder
     created_at?: SortOrder
     updated_at?: SortOrder
+    attempts?: SortOrder
+    worker_id?: SortOrder
+    lease_expires_at?: SortOrder
+    heartbeat_at?: SortOrder
+    fingerprint?: SortOrder
   }
 
   export type plan_tasksSumOrderByAggregateInput = {
     id?: SortOrder
+    attempts?: SortOrder
   }
 
   export type Enumplan_task_statusWithAggregatesFilter<$PrismaModel = never> = {
@@ -15719,7 +15864,7 @@ export namespace Prisma {
 
   export type TripPlanOutputCreateWithoutTripPlanInput = {
     id?: string
-    itinerary: string
+    itinerary: JsonNullValueInput | InputJsonValue
     summary?: string | null
     createdAt?: Date | string
     updatedAt?: Date | string
@@ -15727,7 +15872,7 @@ export namespace Prisma {
 
   export type TripPlanOutputUncheckedCreateWithoutTripPlanInput = {
     id?: string
-    itinerary: string
+    itinerary: JsonNullValueInput | InputJsonValue
     summary?: string | null
     createdAt?: Date | string
     updatedAt?: Date | string
@@ -15819,7 +15964,7 @@ export namespace Prisma {
 
   export type TripPlanOutputUpdateWithoutTripPlanInput = {
     id?: StringFieldUpdateOperationsInput | string
-    itinerary?: StringFieldUpdateOperationsInput | string
+    itinerary?: JsonNullValueInput | InputJsonValue
     summary?: NullableStringFieldUpdateOperationsInput | string | null
     createdAt?: DateTimeFieldUpdateOperationsInput | Date | string
     updatedAt?: DateTimeFieldUpdateOperationsInput | Date | string
@@ -15827,7 +15972,7 @@ export namespace Prisma {
 
   export type TripPlanOutputUncheckedUpdateWithoutTripPlanInput = {
     id?: StringFieldUpdateOperationsInput | string
-    itinerary?: StringFieldUpdateOperationsInput | string
+    itinerary?: JsonNullValueInput | InputJsonValue
     summary?: NullableStringFieldUpdateOperationsInput | string | null
     createdAt?: DateTimeFieldUpdateOperationsInput | Date | string
     updatedAt?: DateTimeFieldUpdateOperationsInput | Date | string
@@ -206,7 +206,12 @@ exports.Prisma.Plan_tasksScalarFieldEnum = {
   output_data: 'output_data',
   error_message: 'error_message',
   created_at: 'created_at',
-  updated_at: 'updated_at'
+  updated_at: 'updated_at',
+  attempts: 'attempts',
+  worker_id: 'worker_id',
+  lease_expires_at: 'lease_expires_at',
+  heartbeat_at: 'heartbeat_at',
+  fingerprint: 'fingerprint'
 };
 
 exports.Prisma.SortOrder = {
@@ -303,13 +308,13 @@ const config = {
       }
     }
   },
-  "inlineSchema": "generator client {\n  provider = \"prisma-client-js\"\n  output   = \"../lib/generated/prisma\"\n}\n\ndatasource db {\n  provider = \"postgresql\"\n  url      = env(\"DATABASE_URL\")\n}\n\nmodel User {\n  id            String     @id\n  name          String\n  email         String     @unique\n  emailVerified Boolean\n  image         String?\n  createdAt     DateTime\n  updatedAt     DateTime\n  accounts      Account[]\n  sessions      Session[]\n  tripPlans     TripPlan[]\n\n  @@map(\"user\")\n}\n\nmodel Session {\n  id        String   @id\n  expiresAt DateTime\n  token     String   @unique\n  createdAt DateTime\n  updatedAt DateTime\n  ipAddress String?\n  userAgent String?\n  userId    String\n  user      User     @relation(fields: [userId], references: [id], onDelete: Cascade)\n\n  @@map(\"session\")\n}\n\nmodel Account {\n  id                    String    @id\n  accountId             String\n  providerId            String\n  userId                String\n  accessToken           String?\n  refreshToken          String?\n  idToken               String?\n  accessTokenExpiresAt  DateTime?\n  refreshTokenExpiresAt DateTime?\n  scope                 String?\n  password              String?\n  createdAt             DateTime\n  updatedAt             DateTime\n  user                  User      @relation(fields: [userId], references: [id], onDelete: Cascade)\n\n  @@map(\"account\")\n}\n\nmodel Verification {\n  id         String    @id\n  identifier String\n  value      String\n  expiresAt  DateTime\n  createdAt  DateTime?\n  updatedAt  DateTime?\n\n  @@map(\"verification\")\n}\n\nmodel Jwks {\n  id         String   @id\n  publicKey  String\n  privateKey String\n  createdAt  DateTime\n\n  @@map(\"jwks\")\n}\n\nmodel TripPlanStatus {\n  id          String    @id @default(cuid())\n  tripPlanId  String    @unique\n  status      String    @default(\"pending\") // pending, processing, completed, failed\n  currentStep String?\n  error       String?\n  startedAt   DateTime?\n  completedAt DateTime?\n  createdAt   DateTime  @default(now())\n  updatedAt   DateTime  @updatedAt\n\n  tripPlan TripPlan @relation(fields: [tripPlanId], references: [id], onDelete: Cascade)\n\n  @@map(\"trip_plan_status\")\n}\n\nmodel TripPlanOutput {\n  id         String   @id @default(cuid())\n  tripPlanId String   @unique\n  tripPlan   TripPlan @relation(fields: [tripPlanId], references: [id], onDelete: Cascade)\n  itinerary  String\n  summary    String?\n  createdAt  DateTime @default(now())\n  updatedAt  DateTime @updatedAt\n\n  @@map(\"trip_plan_output\")\n}\n\nmodel TripPlan {\n  id               String          @id @default(cuid())\n  name             String\n  destination      String\n  startingLocation String\n  travelDatesStart String\n  travelDatesEnd   String?\n  dateInputType    String          @default(\"picker\")\n  duration         Int?\n  travelingWith    String\n  adults           Int             @default(1)\n  children         Int             @default(0)\n  ageGroups        String[]\n  budget           Float\n  budgetCurrency   String          @default(\"USD\")\n  travelStyle      String\n  budgetFlexible   Boolean         @default(false)\n  vibes            String[]\n  priorities       String[]\n  interests        String?\n  rooms            Int             @default(1)\n  pace             Int[]\n  beenThereBefore  String?\n  lovedPlaces      String?\n  additionalInfo   String?\n  createdAt        DateTime        @default(now())\n  updatedAt        DateTime        @updatedAt\n  userId           String?\n  user             User?           @relation(fields: [userId], references: [id], onDelete: Cascade)\n  status           TripPlanStatus?\n  output           TripPlanOutput?\n\n  @@map(\"trip_plan\")\n}\n\nmodel plan_tasks {\n  id            Int              @id @default(autoincrement())\n  trip_plan_id  String\n  task_type     String\n  status        plan_task_status\n  input_data    Json\n  output_data   Json?\n  error_message String?\n  created_at    DateTime?        @default(now()) @db.Timestamptz(6)\n  updated_at    DateTime?        @default(now()) @db.Timestamptz(6)\n\n  @@index([status], map: \"idx_plan_tasks_status\")\n  @@index([trip_plan_id], map: \"idx_plan_tasks_trip_plan_id\")\n}\n\nenum plan_task_status {\n  queued\n  in_progress\n  success\n  error\n}\n",
-  "inlineSchemaHash": "d53e2788e347066c5b82429f1f7f06e40ac139dba71c4c6660315c6ee9a16421",
+  "inlineSchema": "generator client {\n  provider = \"prisma-client-js\"\n  output   = \"../lib/generated/prisma\"\n}\n\ndatasource db {\n  provider = \"postgresql\"\n  url      = env(\"DATABASE_URL\")\n}\n\nmodel User {\n  id            String     @id\n  name          String\n  email         String     @unique\n  emailVerified Boolean\n  image         String?\n  createdAt     DateTime\n  updatedAt     DateTime\n  accounts      Account[]\n  sessions      Session[]\n  tripPlans     TripPlan[]\n\n  @@map(\"user\")\n}\n\nmodel Session {\n  id        String   @id\n  expiresAt DateTime\n  token     String   @unique\n  createdAt DateTime\n  updatedAt DateTime\n  ipAddress String?\n  userAgent String?\n  userId    String\n  user      User     @relation(fields: [userId], references: [id], onDelete: Cascade)\n\n  @@map(\"session\")\n}\n\nmodel Account {\n  id                    String    @id\n  accountId             String\n  providerId            String\n  userId                String\n  accessToken           String?\n  refreshToken          String?\n  idToken               String?\n  accessTokenExpiresAt  DateTime?\n  refreshTokenExpiresAt DateTime?\n  scope                 String?\n  password              String?\n  createdAt             DateTime\n  updatedAt             DateTime\n  user                  User      @relation(fields: [userId], references: [id], onDelete: Cascade)\n\n  @@map(\"account\")\n}\n\nmodel Verification {\n  id         String    @id\n  identifier String\n  value      String\n  expiresAt  DateTime\n  createdAt  DateTime?\n  updatedAt  DateTime?\n\n  @@map(\"verification\")\n}\n\nmodel Jwks {\n  id         String   @id\n  publicKey  String\n  privateKey String\n  createdAt  DateTime\n\n  @@map(\"jwks\")\n}\n\nmodel TripPlanStatus {\n  id          String    @id @default(cuid())\n  tripPlanId  String    @unique\n  status      String    @default(\"pending\") // pending, processing, completed, failed\n  currentStep String?\n  error       String?\n  startedAt   DateTime?\n  completedAt DateTime?\n  createdAt   DateTime  @default(now())\n  updatedAt   DateTime  @updatedAt\n\n  tripPlan TripPlan @relation(fields: [tripPlanId], references: [id], onDelete: Cascade)\n\n  @@map(\"trip_plan_status\")\n}\n\nmodel TripPlanOutput {\n  id         String   @id @default(cuid())\n  tripPlanId String   @unique\n  tripPlan   TripPlan @relation(fields: [tripPlanId], references: [id], onDelete: Cascade)\n  itinerary  Json\n  summary    String?\n  createdAt  DateTime @default(now())\n  updatedAt  DateTime @updatedAt\n\n  @@map(\"trip_plan_output\")\n}\n\nmodel TripPlan {\n  id               String          @id @default(cuid())\n  name             String\n  destination      String\n  startingLocation String\n  travelDatesStart String\n  travelDatesEnd   String?\n  dateInputType    String          @default(\"picker\")\n  duration         Int?\n  travelingWith    String\n  adults           Int             @default(1)\n  children         Int             @default(0)\n  ageGroups        String[]\n  budget           Float\n  budgetCurrency   String          @default(\"USD\")\n  travelStyle      String\n  budgetFlexible   Boolean         @default(false)\n  vibes            String[]\n  priorities       String[]\n  interests        String?\n  rooms            Int             @default(1)\n  pace             Int[]\n  beenThereBefore  String?\n  lovedPlaces      String?\n  additionalInfo   String?\n  createdAt        DateTime        @default(now())\n  updatedAt        DateTime        @updatedAt\n  userId           String?\n  user             User?           @relation(fields: [userId], references: [id], onDelete: Cascade)\n  status           TripPlanStatus?\n  output           TripPlanOutput?\n\n  @@map(\"trip_plan\")\n}\n\nmodel plan_tasks {\n  id               Int              @id @default(autoincrement())\n  trip_plan_id     String\n  task_type        String\n  status           plan_task_status\n  input_data       Json\n  output_data      Json?\n  error_message    String?\n  created_at       DateTime?        @default(now()) @db.Timestamptz(6)\n  updated_at       DateTime?        @default(now()) @db.Timestamptz(6)\n  attempts         Int              @default(0)\n  worker_id        String?          @db.VarChar(100)\n  lease_expires_at DateTime?        @db.Timestamptz(6)\n  heartbeat_at     DateTime?        @db.Timestamptz(6)\n  fingerprint      String?          @db.VarChar(64)\n\n  @@index([status], map: \"idx_plan_tasks_status\")\n  @@index([trip_plan_id], map: \"idx_plan_tasks_trip_plan_id\")\n  @@index([task_type, status, created_at], map: \"idx_plan_tasks_claim\")\n  @@index([fingerprint], map: \"idx_plan_tasks_fingerprint\")\n}\n\nenum plan_task_status {\n  queued\n  in_progress\n  success\n  error\n}\n",
+  "inlineSchemaHash": "3b9774c0ca74e6088c35e2f5c67d0caf8075f736f2a15d1c51d9b71b0c061de9",
   "copyEngine": true
 }
 config.dirname = '/'
 
-config.runtimeDataModel = JSON.parse("{\"models\":{\"User\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"name\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"email\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"emailVerified\",\"kind\":\"scalar\",\"type\":\"Boolean\"},{\"name\":\"image\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"accounts\",\"kind\":\"object\",\"type\":\"Account\",\"relationName\":\"AccountToUser\"},{\"name\":\"sessions\",\"kind\":\"object\",\"type\":\"Session\",\"relationName\":\"SessionToUser\"},{\"name\":\"tripPlans\",\"kind\":\"object\",\"type\":\"TripPlan\",\"relationName\":\"TripPlanToUser\"}],\"dbName\":\"user\"},\"Session\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"expiresAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"token\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"ipAddress\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"userAgent\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"userId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"user\",\"kind\":\"object\",\"type\":\"User\",\"relationName\":\"SessionToUser\"}],\"dbName\":\"session\"},\"Account\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"accountId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"providerId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"userId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"accessToken\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"refreshToken\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"idToken\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"accessTokenExpiresAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"refreshTokenExpiresAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"scope\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"password\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"user\",\"kind\":\"object\",\"type\":\"User\",\"relationName\":\"AccountToUser\"}],\"dbName\":\"account\"},\"Verification\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"identifier\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"value\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"expiresAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"}],\"dbName\":\"verification\"},\"Jwks\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"publicKey\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"privateKey\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"}],\"dbName\":\"jwks\"},\"TripPlanStatus\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"tripPlanId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"status\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"currentStep\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"error\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"startedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"completedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"tripPlan\",\"kind\":\"object\",\"type\":\"TripPlan\",\"relationName\":\"TripPlanToTripPlanStatus\"}],\"dbName\":\"trip_plan_status\"},\"TripPlanOutput\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"tripPlanId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"tripPlan\",\"kind\":\"object\",\"type\":\"TripPlan\",\"relationName\":\"TripPlanToTripPlanOutput\"},{\"name\":\"itinerary\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"summary\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"}],\"dbName\":\"trip_plan_output\"},\"TripPlan\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"name\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"destination\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"startingLocation\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"travelDatesStart\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"travelDatesEnd\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"dateInputType\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"duration\",\"kind\":\"scalar\",\"type\":\"Int\"},{\"name\":\"travelingWith\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"adults\",\"kind\":\"scalar\",\"type\":\"Int\"},{\"name\":\"children\",\"kind\":\"scalar\",\"type\":\"Int\"},{\"name\":\"ageGroups\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"budget\",\"kind\":\"scalar\",\"type\":\"Float\"},{\"name\":\"budgetCurrency\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"travelStyle\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"budgetFlexible\",\"kind\":\"scalar\",\"type\":\"Boolean\"},{\"name\":\"vibes\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"priorities\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"interests\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"rooms\",\"kind\":\"scalar\",\"type\":\"Int\"},{\"name\":\"pace\",\"kind\":\"scalar\",\"type\":\"Int\"},{\"name\":\"beenThereBefore\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"lovedPlaces\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"additionalInfo\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"userId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"user\",\"kind\":\"object\",\"type\":\"User\",\"relationName\":\"TripPlanToUser\"},{\"name\":\"status\",\"kind\":\"object\",\"type\":\"TripPlanStatus\",\"relationName\":\"TripPlanToTripPlanStatus\"},{\"name\":\"output\",\"kind\":\"object\",\"type\":\"TripPlanOutput\",\"relationName\":\"TripPlanToTripPlanOutput\"}],\"dbName\":\"trip_plan\"},\"plan_tasks\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"Int\"},{\"name\":\"trip_plan_id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"task_type\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"status\",\"kind\":\"enum\",\"type\":\"plan_task_status\"},{\"name\":\"input_data\",\"kind\":\"scalar\",\"type\":\"Json\"},{\"name\":\"output_data\",\"kind\":\"scalar\",\"type\":\"Json\"},{\"name\":\"error_message\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"created_at\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updated_at\",\"kind\":\"scalar\",\"type\":\"DateTime\"}],\"dbName\":null}},\"enums\":{},\"types\":{}}")
+config.runtimeDataModel = JSON.parse("{\"models\":{\"User\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"name\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"email\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"emailVerified\",\"kind\":\"scalar\",\"type\":\"Boolean\"},{\"name\":\"image\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"accounts\",\"kind\":\"object\",\"type\":\"Account\",\"relationName\":\"AccountToUser\"},{\"name\":\"sessions\",\"kind\":\"object\",\"type\":\"Session\",\"relationName\":\"SessionToUser\"},{\"name\":\"tripPlans\",\"kind\":\"object\",\"type\":\"TripPlan\",\"relationName\":\"TripPlanToUser\"}],\"dbName\":\"user\"},\"Session\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"expiresAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"token\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"ipAddress\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"userAgent\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"userId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"user\",\"kind\":\"object\",\"type\":\"User\",\"relationName\":\"SessionToUser\"}],\"dbName\":\"session\"},\"Account\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"accountId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"providerId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"userId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"accessToken\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"refreshToken\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"idToken\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"accessTokenExpiresAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"refreshTokenExpiresAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"scope\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"password\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"user\",\"kind\":\"object\",\"type\":\"User\",\"relationName\":\"AccountToUser\"}],\"dbName\":\"account\"},\"Verification\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"identifier\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"value\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"expiresAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"}],\"dbName\":\"verification\"},\"Jwks\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"publicKey\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"privateKey\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"}],\"dbName\":\"jwks\"},\"TripPlanStatus\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"tripPlanId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"status\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"currentStep\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"error\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"startedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"completedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"tripPlan\",\"kind\":\"object\",\"type\":\"TripPlan\",\"relationName\":\"TripPlanToTripPlanStatus\"}],\"dbName\":\"trip_plan_status\"},\"TripPlanOutput\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"tripPlanId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"tripPlan\",\"kind\":\"object\",\"type\":\"TripPlan\",\"relationName\":\"TripPlanToTripPlanOutput\"},{\"name\":\"itinerary\",\"kind\":\"scalar\",\"type\":\"Json\"},{\"name\":\"summary\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"}],\"dbName\":\"trip_plan_output\"},\"TripPlan\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"name\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"destination\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"startingLocation\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"travelDatesStart\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"travelDatesEnd\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"dateInputType\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"duration\",\"kind\":\"scalar\",\"type\":\"Int\"},{\"name\":\"travelingWith\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"adults\",\"kind\":\"scalar\",\"type\":\"Int\"},{\"name\":\"children\",\"kind\":\"scalar\",\"type\":\"Int\"},{\"name\":\"ageGroups\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"budget\",\"kind\":\"scalar\",\"type\":\"Float\"},{\"name\":\"budgetCurrency\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"travelStyle\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"budgetFlexible\",\"kind\":\"scalar\",\"type\":\"Boolean\"},{\"name\":\"vibes\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"priorities\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"interests\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"rooms\",\"kind\":\"scalar\",\"type\":\"Int\"},{\"name\":\"pace\",\"kind\":\"scalar\",\"type\":\"Int\"},{\"name\":\"beenThereBefore\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"lovedPlaces\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"additionalInfo\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"createdAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updatedAt\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"userId\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"user\",\"kind\":\"object\",\"type\":\"User\",\"relationName\":\"TripPlanToUser\"},{\"name\":\"status\",\"kind\":\"object\",\"type\":\"TripPlanStatus\",\"relationName\":\"TripPlanToTripPlanStatus\"},{\"name\":\"output\",\"kind\":\"object\",\"type\":\"TripPlanOutput\",\"relationName\":\"TripPlanToTripPlanOutput\"}],\"dbName\":\"trip_plan\"},\"plan_tasks\":{\"fields\":[{\"name\":\"id\",\"kind\":\"scalar\",\"type\":\"Int\"},{\"name\":\"trip_plan_id\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"task_type\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"status\",\"kind\":\"enum\",\"type\":\"plan_task_status\"},{\"name\":\"input_data\",\"kind\":\"scalar\",\"type\":\"Json\"},{\"name\":\"output_data\",\"kind\":\"scalar\",\"type\":\"Json\"},{\"name\":\"error_message\",\"kind\":\"scalar\",\"type\":\"String\"},{\"name\":\"created_at\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"updated_at\",\"kind\":\"scalar\",\"type\":\"DateTime\"},{\"name\":\"attempts\",\"kind\":\"scalar\",\"isList\":false,\"isRequired\":true,\"isUnique\":false,\"isId\":false,\"isReadOnly\":false,\"hasDefaultValue\":true,\"type\":\"Int\",\"nativeType\":null,\"default\":0,\"isGenerated\":false,\"isUpdatedAt\":false},{\"name\":\"worker_id\",\"kind\":\"scalar\",\"isList\":false,\"isRequired\":false,\"isUnique\":false,\"isId\":false,\"isReadOnly\":false,\"hasDefaultValue\":false,\"type\":\"String\",\"nativeType\":[\"VarChar\",[\"100\"]],\"isGenerated\":false,\"isUpdatedAt\":false},{\"name\":\"lease_expires_at\",\"kind\":\"scalar\",\"isList\":false,\"isRequired\":false,\"isUnique\":false,\"isId\":false,\"isReadOnly\":false,\"hasDefaultValue\":false,\"type\":\"DateTime\",\"nativeType\":[\"Timestamptz\",[\"6\"]],\"isGenerated\":false,\"isUpdatedAt\":false},{\"name\":\"heartbeat_at\",\"kind\":\"scalar\",\"isList\":false,\"isRequired\":false,\"isUnique\":false,\"isId\":false,\"isReadOnly\":false,\"hasDefaultValue\":false,\"type\":\"DateTime\",\"nativeType\":[\"Timestamptz\",[\"6\"]],\"isGenerated\":false,\"isUpdatedAt\":false},{\"name\":\"fingerprint\",\"kind\":\"scalar\",\"isList\":false,\"isRequired\":false,\"isUnique\":false,\"isId\":false,\"isReadOnly\":false,\"hasDefaultValue\":false,\"type\":\"String\",\"nativeType\":[\"VarChar\",[\"64\"]],\"isGenerated\":false,\"isUpdatedAt\":false}],\"dbName\":null}},\"enums\":{},\"types\":{}}")
 defineDmmfProperty(exports.Prisma, config.runtimeDataModel)
 config.engineWasm = {
   getRuntime: async () => require('./query_engine_bg.js'),
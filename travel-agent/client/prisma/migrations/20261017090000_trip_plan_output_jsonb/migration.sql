@@ -0,0 +1,47 @@
+/*
+  Mirrors backend/migrations/convert_trip_plan_output_to_jsonb.sql.
+
+  trip_plan_output is created by the backend's SQL migrations, not by this
+  history, so every step is skipped where the table doesn't exist (e.g. the
+  shadow database) and is a no-op where the backend migration already ran.
+
+  Warnings:
+
+  - Only the newest output of each trip plan is kept.
+  - `itinerary` changes from TEXT to JSONB; the nested itinerary JSON string is unpacked.
+*/
+DO $$
+BEGIN
+    IF to_regclass('trip_plan_output') IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- Keep only the newest output of each trip plan before adding the unique key
+    DELETE FROM "trip_plan_output" older
+    USING "trip_plan_output" newer
+    WHERE older."tripPlanId" = newer."tripPlanId"
+      AND (older."updatedAt", older."id") < (newer."updatedAt", newer."id");
+
+    -- AlterTable
+    IF (
+        SELECT data_type FROM information_schema.columns
+        WHERE table_name = 'trip_plan_output' AND column_name = 'itinerary'
+    ) <> 'jsonb' THEN
+        ALTER TABLE "trip_plan_output"
+            ALTER COLUMN "itinerary" SET DATA TYPE JSONB USING "itinerary"::jsonb;
+    END IF;
+
+    UPDATE "trip_plan_output"
+    SET "itinerary" = jsonb_set("itinerary", '{itinerary}', ("itinerary"->>'itinerary')::jsonb)
+    WHERE jsonb_typeof("itinerary"->'itinerary') = 'string'
+      AND left(ltrim("itinerary"->>'itinerary'), 1) = '{';
+
+    -- CreateIndex
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'trip_plan_output_tripPlanId_key'
+    ) AND to_regclass('"trip_plan_output_tripPlanId_key"') IS NULL THEN
+        CREATE UNIQUE INDEX "trip_plan_output_tripPlanId_key" ON "trip_plan_output"("tripPlanId");
+    END IF;
+
+    DROP INDEX IF EXISTS "idx_trip_plan_output_trip_plan_id";
+END $$;
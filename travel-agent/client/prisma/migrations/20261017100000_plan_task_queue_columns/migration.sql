@@ -0,0 +1,27 @@
+/*
+  Mirrors backend/migrations/add_plan_task_queue_columns.sql and
+  backend/migrations/add_plan_task_fingerprint.sql.
+
+  plan_tasks is created by the backend's SQL migrations, not by this history,
+  so every step is skipped where the table doesn't exist (e.g. the shadow
+  database) and is a no-op where the backend migrations already ran.
+*/
+DO $$
+BEGIN
+    IF to_regclass('plan_tasks') IS NULL THEN
+        RETURN;
+    END IF;
+
+    -- AlterTable
+    ALTER TABLE "plan_tasks" ADD COLUMN IF NOT EXISTS "attempts" INTEGER NOT NULL DEFAULT 0;
+    ALTER TABLE "plan_tasks" ADD COLUMN IF NOT EXISTS "worker_id" VARCHAR(100);
+    ALTER TABLE "plan_tasks" ADD COLUMN IF NOT EXISTS "lease_expires_at" TIMESTAMPTZ(6);
+    ALTER TABLE "plan_tasks" ADD COLUMN IF NOT EXISTS "heartbeat_at" TIMESTAMPTZ(6);
+    ALTER TABLE "plan_tasks" ADD COLUMN IF NOT EXISTS "fingerprint" VARCHAR(64);
+
+    -- CreateIndex
+    CREATE INDEX IF NOT EXISTS "idx_plan_tasks_claim" ON "plan_tasks"("task_type", "status", "created_at");
+
+    -- CreateIndex
+    CREATE INDEX IF NOT EXISTS "idx_plan_tasks_fingerprint" ON "plan_tasks"("fingerprint");
+END $$;
@@ -17,7 +17,7 @@ CREATE TABLE "trip_plan_status" (
 CREATE TABLE "trip_plan_output" (
   "id" TEXT NOT NULL,
   "tripPlanId" TEXT NOT NULL,
-  "itinerary" TEXT NOT NULL,
+  "itinerary" JSONB NOT NULL,
   "summary" TEXT,
   "createdAt" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
   "updatedAt" TIMESTAMP NOT NULL,